@@ -0,0 +1,118 @@
+#Análisis espectral de señales x/y muestreadas: frecuencias, razón p:q y fase relativa de la figura de Lissajous
+
+#Imports
+from __future__ import annotations
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
+from typing import Optional, Tuple
+import numpy as np
+from scipy import fft as sfft
+
+MAX_DENOMINADOR_FIGURA: int = 10 #Razones más finas se reportan como la fracción más cercana
+BINS_DC: int = 2 #Bins ignorados junto a DC (lóbulo principal de la ventana de Hann)
+UMBRAL_SILENCIO: float = 1e-9 #Amplitud relativa bajo la cual un canal se considera sin tono
+
+
+@dataclass(frozen = True)
+class Tono: #Componente dominante de un canal: A sin(2π f t + fase), t = 0 al inicio del bloque
+    frecuencia: float #Hz
+    amplitud: float #Unidades de la señal (V o px)
+    fase: float #rad
+
+
+@dataclass(frozen = True)
+class EstimacionLissajous: #Figura estimada: vertical = p f0, horizontal = q f0
+    vertical: Tono
+    horizontal: Tono
+    p: int
+    q: int
+    fase_relativa: float #φv - p φh / q reducida a [0, 2π/q): φh solo se conoce módulo 2π, y eso mueve el valor en 2π p/q
+
+    @property
+    def razon(self) -> str:
+        return f"{self.p}:{self.q}"
+
+
+@lru_cache(maxsize=16)
+def _ventana(n: int) -> Tuple[np.ndarray, float]: #Hann periódica y su suma (ganancia coherente), por tamaño de bloque
+    w = np.hanning(n + 1)[:-1]
+    w.flags.writeable = False
+    return w, float(w.sum())
+
+
+@lru_cache(maxsize=16)
+def _indices(n: int) -> np.ndarray: #0..n-1 para evaluar la DFT en frecuencia fraccionaria
+    i = np.arange(n, dtype=float)
+    i.flags.writeable = False
+    return i
+
+
+def estimar_tono(x: np.ndarray, fs: float, buffer: Optional[np.ndarray] = None) -> Optional[Tono]: #Tono dominante con FFT ventaneada + interpolación parabólica del pico
+    """
+    El pico de |X| se refina con una parábola sobre log|X| en los tres bins vecinos; amplitud y fase se
+    obtienen evaluando la DFT ventaneada justo en la frecuencia refinada (un producto punto), lo que
+    evita el sesgo de amplitud y de fase del bin más cercano.
+    """
+    n = x.size
+    if n < 4 * BINS_DC + 4:
+        return None
+    w, suma = _ventana(n)
+    xw = np.subtract(x, np.mean(x), out=buffer) #Sin DC para que no se filtre al primer bin
+    xw *= w
+    espectro = np.abs(sfft.rfft(xw))
+    k = BINS_DC + int(np.argmax(espectro[BINS_DC:-1]))
+    if espectro[k] <= UMBRAL_SILENCIO * suma * max(np.abs(x).max(), 1e-300):
+        return None
+    a, b, c = np.log(espectro[k - 1:k + 2] + 1e-300)
+    denominador = a - 2 * b + c
+    delta = 0.5 * (a - c) / denominador if denominador != 0 else 0.0
+    ciclos = k + float(np.clip(delta, -0.5, 0.5)) #Frecuencia en ciclos por bloque
+    X = np.dot(xw, np.exp(-2j * np.pi * ciclos / n * _indices(n)))
+    return Tono(ciclos * fs / n, 2.0 * abs(X) / suma, float(np.angle(X)) + np.pi / 2) #sen = cos desfasado -π/2
+
+
+def estimar_lissajous(voltaje_h: np.ndarray, voltaje_v: np.ndarray, fs: float, buffer: Optional[np.ndarray] = None) -> Optional[EstimacionLissajous]: #Razón y fase relativa a partir de x (horizontal) e y (vertical)
+    horizontal = estimar_tono(voltaje_h, fs, buffer)
+    vertical = estimar_tono(voltaje_v, fs, buffer)
+    if horizontal is None or vertical is None:
+        return None
+    razon = Fraction(vertical.frecuencia / horizontal.frecuencia).limit_denominator(MAX_DENOMINADOR_FIGURA)
+    p, q = max(razon.numerator, 1), razon.denominator
+    fase = (vertical.fase - p * horizontal.fase / q) % (2 * np.pi / q)
+    return EstimacionLissajous(vertical, horizontal, p, q, fase)
+
+
+class AnalizadorLissajous: #Ventana deslizante de tamaño fijo: cada análisis cuesta lo mismo sin importar la fuente
+    def __init__(self, fs: float, bloque: int = 1024, salto: Optional[int] = None) -> None:
+        if fs <= 0:
+            raise ValueError("fs debe ser > 0.")
+        if bloque < 16:
+            raise ValueError("bloque debe ser >= 16.")
+        self.fs = fs
+        self.bloque = bloque
+        self.salto = bloque // 4 if salto is None else max(1, salto) #Muestras nuevas entre análisis
+        self._x = np.zeros(bloque)
+        self._y = np.zeros(bloque)
+        self._buffer = np.empty(bloque) #Trabajo para la señal ventaneada
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        self._llenas = 0
+        self._pendientes = 0
+        self.estimacion: Optional[EstimacionLissajous] = None
+
+    def agregar(self, voltaje_h: np.ndarray, voltaje_v: np.ndarray) -> Optional[EstimacionLissajous]: #Agrega muestras (orden cronológico) y reanaliza cada `salto`
+        voltaje_h = np.asarray(voltaje_h, dtype=float)[-self.bloque:]
+        voltaje_v = np.asarray(voltaje_v, dtype=float)[-self.bloque:]
+        n = voltaje_h.size
+        if n:
+            for historial, nuevas in ((self._x, voltaje_h), (self._y, voltaje_v)):
+                historial[:-n] = historial[n:]
+                historial[-n:] = nuevas
+            self._llenas = min(self.bloque, self._llenas + n)
+            self._pendientes += n
+        if self._llenas == self.bloque and self._pendientes >= self.salto:
+            self._pendientes = 0
+            self.estimacion = estimar_lissajous(self._x, self._y, self.fs, self._buffer)
+        return self.estimacion
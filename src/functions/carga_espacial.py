@@ -0,0 +1,112 @@
+#Carga espacial del haz por el método partícula-malla (PM) con solver de Poisson por FFT
+
+#Imports
+from __future__ import annotations
+from functools import lru_cache
+from typing import Optional, Tuple
+import numpy as np
+from scipy import fft as sfft
+from src.utils.constantes import EPSILON_0, E_CHARGE, E_MASS, PI
+
+MARGEN_MIN: float = 1e-6 #Margen mínimo por eje (m): un haz plano o puntual también necesita celdas de tamaño finito
+PASOS_POR_OCTAVA: int = 8 #Cuantización del paso de malla (escalera geométrica) para reutilizar la función de Green
+
+
+class CargaEspacial: #Campo propio del haz: depósito CIC -> Poisson (Hockney, FFT) -> interpolación CIC
+    """
+    Cada electrón del ElectronBeam representa una macro-partícula de carga -carga_macro (C).
+    La malla cubre la caja que envuelve al haz en cada llamada; el potencial de espacio libre se
+    obtiene convolucionando la carga con la función de Green 1/(4πε0 r) sobre una malla duplicada,
+    así el costo por paso es O(N + G log G) en lugar de O(N²).
+    """
+
+    def __init__(self, carga_macro: float, forma: Tuple[int, int, int] = (32, 32, 32), relleno: float = 0.1, workers: Optional[int] = None, margen_min: float = MARGEN_MIN) -> None:
+        if carga_macro < 0:
+            raise ValueError("carga_macro no puede ser negativa.")
+        if min(forma) < 2:
+            raise ValueError("La malla necesita al menos 2 nodos por eje.")
+        self.carga_macro = carga_macro
+        self.forma = tuple(int(n) for n in forma)
+        self.relleno = relleno #Margen relativo alrededor del haz, por eje
+        self.margen_min = margen_min
+        self.workers = workers #Hilos para scipy.fft
+
+    @classmethod
+    def desde_corriente(cls, corriente: float, tasa_emision: float, **kwargs) -> "CargaEspacial": #Carga por macro-partícula = I / (partículas emitidas por segundo)
+        if tasa_emision <= 0:
+            raise ValueError("tasa_emision debe ser > 0.")
+        return cls(corriente / tasa_emision, **kwargs)
+
+    def _malla(self, pos: np.ndarray) -> Tuple[np.ndarray, np.ndarray]: #Origen y paso de la malla que envuelve al haz
+        """
+        Cada eje se rellena según su propia extensión (el haz mide decenas de cm a lo largo y mm de
+        ancho: con un margen común las celdas transversales serían de cm). El paso se redondea hacia
+        arriba a la escalera 2^(k/PASOS_POR_OCTAVA) para que la función de Green cacheada se reutilice
+        mientras el haz cambia poco de tamaño; la malla queda centrada sobre el haz.
+        """
+        lo = pos.min(axis=0)
+        hi = pos.max(axis=0)
+        extension = hi - lo
+        margen = np.maximum(self.relleno * extension, self.margen_min)
+        extension = extension + 2 * margen
+        nodos = np.array(self.forma) - 1
+        h = 2.0 ** (np.ceil(np.log2(extension / nodos) * PASOS_POR_OCTAVA) / PASOS_POR_OCTAVA)
+        lo = 0.5 * (lo + hi) - 0.5 * h * nodos
+        return lo, h
+
+    def _pesos_cic(self, pos: np.ndarray, lo: np.ndarray, h: np.ndarray): #Índices planos y pesos de los 8 nodos vecinos
+        nx, ny, nz = self.forma
+        f = (pos - lo) / h
+        i = np.clip(np.floor(f).astype(np.intp), 0, np.array(self.forma) - 2)
+        w = f - i
+        for dx in (0, 1):
+            wx = w[:, 0] if dx else 1.0 - w[:, 0]
+            for dy in (0, 1):
+                wy = w[:, 1] if dy else 1.0 - w[:, 1]
+                for dz in (0, 1):
+                    wz = w[:, 2] if dz else 1.0 - w[:, 2]
+                    plano = ((i[:, 0] + dx) * ny + (i[:, 1] + dy)) * nz + (i[:, 2] + dz)
+                    yield plano, wx * wy * wz
+
+    def potencial(self, pos: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]: #Potencial (V) en la malla, origen y paso
+        lo, h = self._malla(pos)
+        n_nodos = int(np.prod(self.forma))
+        carga = np.zeros(n_nodos)
+        for plano, peso in self._pesos_cic(pos, lo, h):
+            carga += np.bincount(plano, weights=peso, minlength=n_nodos)
+        carga *= -self.carga_macro #Electrones: carga negativa
+        carga = carga.reshape(self.forma)
+
+        doble = tuple(2 * n for n in self.forma)
+        green_f = _green_fft(self.forma, tuple(h.tolist()), self.workers) #h ya cuantizado: la clave se repite entre pasos
+        phi = sfft.irfftn(sfft.rfftn(carga, s=doble, workers=self.workers) * green_f, s=doble, workers=self.workers)
+        return phi[:self.forma[0], :self.forma[1], :self.forma[2]], lo, h
+
+    def aceleracion(self, pos: np.ndarray, q_m: float = E_CHARGE / E_MASS, out: Optional[np.ndarray] = None) -> np.ndarray: #Aceleración (m/s²) por el campo propio del haz
+        a = np.zeros_like(pos) if out is None else out
+        if pos.shape[0] < 2 or self.carga_macro == 0:
+            return a
+
+        phi, lo, h = self.potencial(pos)
+        campos = np.gradient(phi, *h) #-E en cada eje
+        planos = list(self._pesos_cic(pos, lo, h))
+        for eje in range(3):
+            grad = campos[eje].ravel()
+            valor = np.zeros(pos.shape[0])
+            for plano, peso in planos:
+                valor += grad[plano] * peso
+            a[:, eje] += q_m * valor #a = -(q/M) E = (q/M) grad(phi)
+        return a
+
+
+@lru_cache(maxsize=8)
+def _green_fft(forma: Tuple[int, int, int], h: Tuple[float, float, float], workers: Optional[int]) -> np.ndarray: #FFT de 1/(4πε0 r) sobre la malla duplicada (Hockney)
+    ejes = []
+    for n, paso in zip(forma, h):
+        k = np.arange(2 * n)
+        ejes.append(np.minimum(k, 2 * n - k) * paso)
+    x, y, z = np.meshgrid(*ejes, indexing="ij", sparse=True)
+    r = np.sqrt(x**2 + y**2 + z**2)
+    r[0, 0, 0] = 0.5 * min(h) #Autopotencial regularizado de la celda
+    green = 1.0 / (4.0 * PI * EPSILON_0 * r)
+    return sfft.rfftn(green, workers=workers)
@@ -0,0 +1,111 @@
+#Síntesis digital directa (DDS) con tablas de onda limitadas en banda para las placas
+
+#Imports
+from __future__ import annotations
+from typing import Iterator, Optional
+import numpy as np
+from src.functions.señales import SignalSpec, SineOscillator
+from src.utils.constantes import FS_DEF, PI
+from src.utils.helpers import salida
+
+TABLE_SIZE_DEF: int = 2048 #Muestras por ciclo en cada tabla
+
+
+class Wavetable: #Un ciclo de la forma de onda, con una tabla por octava (mipmap) para evitar aliasing
+    """
+    coeficientes[k-1] es el coeficiente complejo del armónico k, con x(θ) = Σ Im{c_k e^{jkθ}}
+    (c_k real -> componente seno). La tabla del nivel l conserva los armónicos <= (size/2 - 1) >> l;
+    al reproducir a frecuencia f se usa el primer nivel cuyos armónicos quedan bajo fs/2.
+    """
+
+    def __init__(self, coeficientes: np.ndarray, size: int = TABLE_SIZE_DEF) -> None:
+        if size < 8:
+            raise ValueError("size debe ser >= 8.")
+        coeficientes = np.asarray(coeficientes, dtype=complex)
+        self.size = size
+        self.max_armonico = min(coeficientes.size, size // 2 - 1)
+
+        self.limites = []
+        limite = self.max_armonico
+        while True:
+            self.limites.append(limite)
+            if limite <= 1:
+                break
+            limite //= 2
+
+        #Tablas con un punto extra (copia del primero) para interpolar sin aritmética modular
+        self.tablas = np.empty((len(self.limites), size + 1))
+        for nivel, limite in enumerate(self.limites):
+            espectro = np.zeros(size // 2 + 1, dtype=complex)
+            espectro[1:limite + 1] = -1j * coeficientes[:limite] * (size / 2) #Im{c e^{jkθ}} -> bin de la rfft
+            self.tablas[nivel, :size] = np.fft.irfft(espectro, size)
+            self.tablas[nivel, size] = self.tablas[nivel, 0]
+
+    @classmethod
+    def from_harmonics(cls, armonicos: int, funcion, size: int = TABLE_SIZE_DEF) -> "Wavetable": #Coeficientes seno b_k = funcion(k)
+        k = np.arange(1, armonicos + 1)
+        return cls(funcion(k).astype(complex), size)
+
+    @classmethod
+    def square(cls, size: int = TABLE_SIZE_DEF) -> "Wavetable": #4/π Σ sin(kθ)/k, k impar
+        return cls.from_harmonics(size // 2, lambda k: np.where(k % 2 == 1, 4.0 / (PI * k), 0.0), size)
+
+    @classmethod
+    def triangle(cls, size: int = TABLE_SIZE_DEF) -> "Wavetable": #8/π² Σ (-1)^((k-1)/2) sin(kθ)/k², k impar
+        return cls.from_harmonics(size // 2, lambda k: np.where(k % 2 == 1, 8.0 / (PI**2 * k**2) * (-1.0) ** ((k - 1) // 2), 0.0), size)
+
+    @classmethod
+    def sawtooth(cls, size: int = TABLE_SIZE_DEF) -> "Wavetable": #2/π Σ (-1)^(k+1) sin(kθ)/k (rampa de -1 a 1)
+        return cls.from_harmonics(size // 2, lambda k: 2.0 / (PI * k) * (-1.0) ** (k + 1), size)
+
+    @classmethod
+    def from_samples(cls, ciclo: np.ndarray, size: int = TABLE_SIZE_DEF) -> "Wavetable": #Forma de onda arbitraria a partir de un ciclo muestreado
+        ciclo = np.asarray(ciclo, dtype=float)
+        if ciclo.ndim != 1 or ciclo.size < 4:
+            raise ValueError("ciclo debe ser un arreglo 1D con al menos 4 muestras.")
+        espectro = np.fft.rfft(ciclo - ciclo.mean()) / (ciclo.size / 2)
+        coeficientes = 1j * espectro[1:] #Inverso de la convención Im{c e^{jkθ}}
+        if ciclo.size % 2 == 0:
+            coeficientes = coeficientes[:-1] #Descarta el bin de Nyquist
+        return cls(coeficientes, size)
+
+    def nivel(self, frecuencia: float, fs: float) -> int: #Primer nivel sin armónicos sobre Nyquist
+        permitido = fs / (2.0 * frecuencia) if frecuencia > 0 else np.inf
+        for nivel, limite in enumerate(self.limites):
+            if limite < permitido:
+                return nivel
+        return len(self.limites) - 1
+
+
+class DDSOscillator(SineOscillator): #Acumulador de fase con lectura interpolada de la tabla; costo fijo por muestra
+    def __init__(self, spec: SignalSpec, tabla: Wavetable, fs: float, chunk_size: int) -> None:
+        super().__init__(spec, fs, chunk_size)
+        self.tabla = tabla
+        self._datos = tabla.tablas[tabla.nivel(spec.frequency, fs)]
+        self._escala = tabla.size / (2.0 * np.pi) #rad -> posición en la tabla
+
+    def next_chunk(self, out: Optional[np.ndarray] = None) -> np.ndarray: #Siguiente bloque de chunk_size muestras (en out si se da)
+        if out is not None:
+            out = salida(out, self.chunk_size, out.dtype)
+        directo = out is not None and out.dtype == np.float64 #En otra precisión la posición se arma aparte en float64
+        x = np.add(self._rampa, self.phase, out=out if directo else None)
+        x *= self._escala
+        np.mod(x, self.tabla.size, out=x)
+        i = x.astype(np.intp)
+        x -= i #Fracción para interpolación lineal
+        a = self._datos[i]
+        x *= self._datos[i + 1] - a
+        x += a
+        if out is not None and not directo:
+            out[...] = x
+            x = out
+        x *= self.spec.amplitude
+        x += self.spec.offset
+        self.phase = (self.phase + self._avance) % (2.0 * np.pi)
+        return x
+
+
+def iter_dds_chunks(spec: SignalSpec, tabla: Wavetable, fs: Optional[float] = None, chunk_size: int = 1024) -> Iterator[np.ndarray]: #Bloques infinitos con fase continua
+    osc = DDSOscillator(spec, tabla, FS_DEF if fs is None else fs, chunk_size)
+    while True:
+        yield osc.next_chunk()
@@ -0,0 +1,189 @@
+#Haz de electrones como conjunto de partículas en arreglos contiguos (estructura de arreglos)
+
+#Imports
+from __future__ import annotations
+from typing import Callable, Optional, Tuple, Union
+import numpy as np
+from src.functions.carga_espacial import CargaEspacial
+from src.functions.placas import MapaCampo
+from src.functions.yugo import YugoMagnetico
+from src.utils.constantes import E_CHARGE, E_MASS, TubeGeometry
+
+Voltaje = Union[float, Callable[[float], float]] #Voltaje fijo o función del tiempo V(t)
+
+
+def _evaluar(voltaje: Voltaje, t: float) -> float: #Voltaje en el instante t
+    return float(voltaje(t)) if callable(voltaje) else float(voltaje)
+
+
+class ElectronBeam: #N electrones con posición, velocidad y tiempo de nacimiento en arreglos NumPy
+    """
+    Ejes: x horizontal, y vertical, z a lo largo del tubo (z = 0 en la entrada de las placas verticales).
+    Regiones (m), a partir de TubeGeometry:
+        placas verticales    0 <= z <= Lv
+        placas horizontales  Lv + D <= z <= Lv + D + Lh
+        pantalla             z = Lv + D + Lh + distancia_placas_h_pantalla
+    Dentro de las placas el campo es uniforme V/d, con la misma convención de signos que posicionPantalla.
+    Con mapas (placas.mapas_tubo) se usa el campo resuelto por diferencias finitas, incluidos los bordes.
+    Con carga_espacial cada electrón es una macro-partícula y se suma el campo propio del haz.
+    En modo magnético (step_boris) la señal excita un YugoMagnetico y se integra con el método de Boris.
+    """
+
+    def __init__(self, capacity: int, geometria: Optional[TubeGeometry] = None, q: float = E_CHARGE, M: float = E_MASS,
+                 mapas: Optional[Tuple[MapaCampo, MapaCampo]] = None, carga_espacial: Optional[CargaEspacial] = None) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity debe ser > 0.")
+        self.geometria = geometria or TubeGeometry()
+        self.q_m = q / M #Relación carga/masa (sin signo)
+        self.q = q
+        self.M = M
+        self.mapas = mapas #(placas verticales, placas horizontales) o None para campo uniforme
+        self.carga_espacial = carga_espacial #Modo opcional de carga espacial (PM)
+
+        self.pos = np.zeros((capacity, 3)) #Posición (m)
+        self.vel = np.zeros((capacity, 3)) #Velocidad (m/s)
+        self.birth = np.zeros(capacity) #Tiempo de nacimiento (s)
+        self.n = 0 #Electrones activos (ocupan las primeras n filas)
+        self.t = 0.0 #Tiempo del tubo (s)
+
+        g = self.geometria
+        self.z_placas_v = (0.0, g.longitud_placas_v)
+        inicio_h = g.longitud_placas_v + g.distancia_entre_placas
+        self.z_placas_h = (inicio_h, inicio_h + g.longitud_placas_h)
+        self.z_pantalla = self.z_placas_h[1] + g.distancia_placas_h_pantalla
+
+    @property
+    def capacity(self) -> int:
+        return self.pos.shape[0]
+
+    def velocidad_inicial(self, voltaje_aceleracion: float) -> float: #v0 = (2qV/M)^1/2
+        return float(np.sqrt(2.0 * self.q * abs(voltaje_aceleracion) / self.M))
+
+    def emit(self, count: int, voltaje_aceleracion: float, pos: Optional[np.ndarray] = None, vel: Optional[np.ndarray] = None) -> slice: #Agrega electrones en la entrada de las placas
+        count = min(int(count), self.capacity - self.n)
+        sl = slice(self.n, self.n + count)
+        if count <= 0:
+            return sl
+
+        if pos is None:
+            self.pos[sl] = 0.0
+        else:
+            self.pos[sl] = pos[:count]
+        if vel is None:
+            self.vel[sl] = 0.0
+            self.vel[sl, 2] = self.velocidad_inicial(voltaje_aceleracion)
+        else:
+            self.vel[sl] = vel[:count]
+        self.birth[sl] = self.t
+        self.n += count
+        return sl
+
+    def acceleration(self, pos: np.ndarray, voltaje_v: float, voltaje_h: float, out: Optional[np.ndarray] = None) -> np.ndarray: #Aceleración (m/s²) de cada electrón
+        a = np.zeros_like(pos) if out is None else out
+        if out is not None:
+            a[...] = 0.0
+        if self.mapas is not None:
+            self._acceleration_mapas(pos, voltaje_v, voltaje_h, a)
+        else:
+            z = pos[:, 2]
+            d = self.geometria.separacion_placas
+            en_v = (z >= self.z_placas_v[0]) & (z <= self.z_placas_v[1])
+            en_h = (z >= self.z_placas_h[0]) & (z <= self.z_placas_h[1])
+            a[en_v, 1] = -self.q_m * voltaje_v / d #Negativa: el electrón tiene carga negativa
+            a[en_h, 0] = self.q_m * voltaje_h / d
+
+        if self.carga_espacial is not None:
+            self.carga_espacial.aceleracion(pos, self.q_m, out=a)
+        return a
+
+    def _acceleration_mapas(self, pos: np.ndarray, voltaje_v: float, voltaje_h: float, a: np.ndarray) -> np.ndarray: #Campo con bordes a partir de los mapas
+        mapa_v, mapa_h = self.mapas
+        ez, eu = mapa_v.muestrear(pos[:, 2] - self.z_placas_v[0], pos[:, 1])
+        a[:, 1] -= self.q_m * voltaje_v * eu
+        a[:, 2] -= self.q_m * voltaje_v * ez
+        ez, eu = mapa_h.muestrear(pos[:, 2] - self.z_placas_h[0], pos[:, 0])
+        a[:, 0] += self.q_m * voltaje_h * eu #Par horizontal con polaridad opuesta (misma convención que el campo uniforme)
+        a[:, 2] += self.q_m * voltaje_h * ez
+        return a
+
+    def step(self, dt: float, voltaje_v: Voltaje = 0.0, voltaje_h: Voltaje = 0.0) -> None: #Paso Velocity-Verlet para todos los electrones
+        n = self.n
+        pos, vel = self.pos[:n], self.vel[:n]
+        t0, t1 = self.t, self.t + dt
+
+        a0 = self.acceleration(pos, _evaluar(voltaje_v, t0), _evaluar(voltaje_h, t0))
+        pos += vel * dt + 0.5 * a0 * dt**2
+        a1 = self.acceleration(pos, _evaluar(voltaje_v, t1), _evaluar(voltaje_h, t1))
+        vel += 0.5 * (a0 + a1) * dt
+        self.t = t1
+
+    def step_boris(self, dt: float, yugo: YugoMagnetico, senal_v: Voltaje = 0.0, senal_h: Voltaje = 0.0, voltaje_v: Voltaje = 0.0, voltaje_h: Voltaje = 0.0) -> None: #Paso de Boris con campo B del yugo (y E de placas, si hay)
+        n = self.n
+        pos, vel = self.pos[:n], self.vel[:n]
+        t_medio = self.t + 0.5 * dt
+
+        a_e = self.acceleration(pos, _evaluar(voltaje_v, t_medio), _evaluar(voltaje_h, t_medio))
+        B = yugo.campo(pos, _evaluar(senal_v, t_medio), _evaluar(senal_h, t_medio))
+
+        #Medio impulso eléctrico, rotación magnética, medio impulso eléctrico (carga negativa: -q/M)
+        vel += 0.5 * dt * a_e
+        t_rot = (-0.5 * dt * self.q_m) * B
+        s_rot = 2.0 * t_rot / (1.0 + np.einsum("ij,ij->i", t_rot, t_rot))[:, None]
+        v_prima = vel + np.cross(vel, t_rot)
+        vel += np.cross(v_prima, s_rot)
+        vel += 0.5 * dt * a_e
+        pos += vel * dt
+        self.t += dt
+
+    def collect_hits(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]: #Retira los electrones que llegaron a la pantalla
+        n = self.n
+        z, vz = self.pos[:n, 2], self.vel[:n, 2]
+        llego = z >= self.z_pantalla
+        if not llego.any():
+            vacio = np.empty(0)
+            return vacio, vacio, vacio
+
+        #Interpolación lineal hacia atrás hasta el plano de la pantalla
+        exceso = (z[llego] - self.z_pantalla) / vz[llego]
+        x = self.pos[:n, 0][llego] - self.vel[:n, 0][llego] * exceso
+        y = self.pos[:n, 1][llego] - self.vel[:n, 1][llego] * exceso
+        t_impacto = self.t - exceso
+
+        #Compactar los electrones restantes al inicio de los arreglos
+        quedan = ~llego
+        k = int(quedan.sum())
+        self.pos[:k] = self.pos[:n][quedan]
+        self.vel[:k] = self.vel[:n][quedan]
+        self.birth[:k] = self.birth[:n][quedan]
+        self.n = k
+
+        escala = self.geometria.escala_px
+        return x * escala, y * escala, t_impacto #Posición de impacto (px) y tiempo (s)
+
+    def run(self, duration: float, dt: float, voltaje_aceleracion: float, rate: float, voltaje_v: Voltaje = 0.0, voltaje_h: Voltaje = 0.0, yugo: Optional[YugoMagnetico] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]: #Emite a 'rate' electrones/s y avanza 'duration' segundos
+        """Con yugo, voltaje_v/voltaje_h son la señal de las bobinas y las placas quedan a 0 V."""
+        if dt <= 0:
+            raise ValueError("dt debe ser > 0.")
+        pasos = int(np.ceil(duration / dt))
+        acumulado = 0.0
+        xs, ys, ts = [], [], []
+
+        for _ in range(pasos):
+            acumulado += rate * dt
+            nuevos = int(acumulado)
+            acumulado -= nuevos
+            self.emit(nuevos, voltaje_aceleracion)
+            if yugo is None:
+                self.step(dt, voltaje_v, voltaje_h)
+            else:
+                self.step_boris(dt, yugo, voltaje_v, voltaje_h)
+            x, y, t = self.collect_hits()
+            if x.size:
+                xs.append(x)
+                ys.append(y)
+                ts.append(t)
+
+        if not xs:
+            vacio = np.empty(0)
+            return vacio, vacio, vacio
+        return np.concatenate(xs), np.concatenate(ys), np.concatenate(ts) #Impactos acumulados
@@ -0,0 +1,114 @@
+#Emisión termoiónica del cátodo por Monte Carlo: distribución real del punto en pantalla
+
+#Imports
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import numpy as np
+from src.functions.fisica import posicionPantalla
+from src.utils.constantes import E_CHARGE, E_MASS, K_BOLTZMANN, PI, TubeGeometry
+
+BLOQUE_DEF: int = 250_000 #Muestras por flujo aleatorio independiente
+
+
+@dataclass(frozen = True)
+class ModeloEmision: #Cátodo caliente con emisor de radio finito
+    temperatura: float = 1100.0 #Temperatura del cátodo (K)
+    radio_emisor: float = 0.5e-3 #Radio de la superficie emisora (m)
+    distancia_aceleracion: float = 0.02 #Cátodo -> ánodo (m), campo uniforme
+
+
+@dataclass
+class DistribucionPunto: #Impactos en pantalla (px) de un estudio de tamaño de punto
+    x: np.ndarray
+    y: np.ndarray
+
+    @property
+    def sigma_x(self) -> float:
+        return float(np.std(self.x))
+
+    @property
+    def sigma_y(self) -> float:
+        return float(np.std(self.y))
+
+    @property
+    def centro(self) -> Tuple[float, float]:
+        return float(np.mean(self.x)), float(np.mean(self.y))
+
+    def histograma(self, bins: int = 64) -> Tuple[np.ndarray, np.ndarray, np.ndarray]: #Densidad 2D del punto
+        return np.histogram2d(self.x, self.y, bins=bins)
+
+
+def muestrear_emision(n: int, voltaje_aceleracion: float, rng: np.random.Generator, modelo: Optional[ModeloEmision] = None) -> Tuple[np.ndarray, np.ndarray]: #Posición y velocidad (n, 3) a la salida del ánodo
+    m = modelo or ModeloEmision()
+    sigma_v = np.sqrt(K_BOLTZMANN * m.temperatura / E_MASS) #Maxwelliana por componente
+
+    #Posición uniforme sobre el disco emisor
+    r = m.radio_emisor * np.sqrt(rng.random(n))
+    theta = 2.0 * PI * rng.random(n)
+    pos = np.zeros((n, 3))
+    pos[:, 0] = r * np.cos(theta)
+    pos[:, 1] = r * np.sin(theta)
+
+    #Velocidades iniciales: transversales normales, longitudinal con flujo v*exp(-v²/2σ²) (Rayleigh)
+    vel = np.empty((n, 3))
+    vel[:, 0] = rng.normal(0.0, sigma_v, n)
+    vel[:, 1] = rng.normal(0.0, sigma_v, n)
+    vz0 = sigma_v * np.sqrt(-2.0 * np.log1p(-rng.random(n)))
+
+    #Brecha de aceleración uniforme: la velocidad transversal se conserva
+    a = E_CHARGE * abs(voltaje_aceleracion) / (E_MASS * m.distancia_aceleracion)
+    vz1 = np.sqrt(vz0**2 + 2.0 * a * m.distancia_aceleracion)
+    t_brecha = (vz1 - vz0) / a
+    pos[:, 0] += vel[:, 0] * t_brecha
+    pos[:, 1] += vel[:, 1] * t_brecha
+    vel[:, 2] = vz1
+    return pos, vel
+
+
+def impactos_emision(n: int, voltaje_aceleracion: float, voltaje_v: float, voltaje_h: float, rng: np.random.Generator, modelo: Optional[ModeloEmision] = None, geometria: Optional[TubeGeometry] = None) -> Tuple[np.ndarray, np.ndarray]: #Posición en pantalla (px) de n electrones emitidos
+    g = geometria or TubeGeometry()
+    pos, vel = muestrear_emision(n, voltaje_aceleracion, rng, modelo)
+
+    #Deflexión por placas con la energía real de cada electrón (dispersión de energía)
+    voltaje_efectivo = 0.5 * E_MASS * vel[:, 2]**2 / E_CHARGE
+    dx, dy = posicionPantalla(voltaje_v, voltaje_h, voltaje_efectivo, g)
+
+    #Deriva transversal del ánodo a la pantalla
+    longitud = g.longitud_placas_v + g.distancia_entre_placas + g.longitud_placas_h + g.distancia_placas_h_pantalla
+    t_vuelo = longitud / vel[:, 2]
+    x = (pos[:, 0] + vel[:, 0] * t_vuelo) * g.escala_px + dx
+    y = (pos[:, 1] + vel[:, 1] * t_vuelo) * g.escala_px + dy
+    return x, y
+
+
+def _bloque(args) -> Tuple[np.ndarray, np.ndarray]: #Trabajo de un proceso: un bloque con su propio flujo aleatorio
+    semilla, n, voltaje_aceleracion, voltaje_v, voltaje_h, modelo, geometria = args
+    rng = np.random.Generator(np.random.PCG64(semilla))
+    return impactos_emision(n, voltaje_aceleracion, voltaje_v, voltaje_h, rng, modelo, geometria)
+
+
+def estudio_punto(n_total: int, voltaje_aceleracion: float, voltaje_v: float = 0.0, voltaje_h: float = 0.0, modelo: Optional[ModeloEmision] = None, geometria: Optional[TubeGeometry] = None, semilla: Optional[int] = None, procesos: Optional[int] = None, bloque: int = BLOQUE_DEF) -> DistribucionPunto: #Estudio de tamaño de punto reproducible y paralelo
+    """
+    Las muestras se dividen en bloques fijos, cada uno con un flujo independiente derivado de
+    SeedSequence(semilla).spawn(); el resultado es idéntico sin importar el número de procesos.
+    procesos=1 ejecuta en el proceso actual.
+    """
+    if n_total <= 0:
+        raise ValueError("n_total debe ser > 0.")
+    tamanos = [bloque] * (n_total // bloque)
+    if n_total % bloque:
+        tamanos.append(n_total % bloque)
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamanos))
+    tareas = [(s, n, voltaje_aceleracion, voltaje_v, voltaje_h, modelo, geometria) for s, n in zip(semillas, tamanos)]
+
+    if procesos == 1 or len(tareas) == 1:
+        resultados = [_bloque(t) for t in tareas]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            resultados = list(pool.map(_bloque, tareas))
+
+    x = np.concatenate([r[0] for r in resultados])
+    y = np.concatenate([r[1] for r in resultados])
+    return DistribucionPunto(x, y)
@@ -1,4 +1,8 @@
 import math
+from dataclasses import dataclass
+from functools import lru_cache
+import numpy as np
+from src.utils.constantes import E_CHARGE, E_MASS, TubeGeometry
 """ ---------------------------Etapa antes de entrar a placas deflectoras
 
 vf mediante conservación de energía v = (2eV/M)^1/2 se usará para determinar la intensidad del brillo
@@ -81,11 +85,150 @@ def voltajeSinusoidal(amplitud, frecuencia, fase, tiempo):
     dt: paso de tiempo
     v: velocidad lateral actual
     pos: posición lateral actual
+    Retorna la velocidad, posición y tiempo actualizados (v, pos, t)
     """
-def poscSinusoidal(q,m,d,a,f,fase,t,dt):
+def poscSinusoidal(q,m,d,a,f,fase,t,dt,v=0.0,pos=0.0):
     V = voltajeSinusoidal(a, f, fase, t)
     a = aceleracion(q, V, m, d, False)
     v = v + a * dt
     pos = pos + v * dt
     t = t + dt
-    return v, pos, t
\ No newline at end of file
+    return v, pos, t
+
+
+"""
+    Sensibilidad de deflexión: la trayectoria por tramos es lineal en los voltajes de placa,
+    solo el voltaje de aceleración (v0 y tiempos de tránsito) cambia los coeficientes.
+    px_por_volt_x px en pantalla por voltio de placas horizontales
+    px_por_volt_y px en pantalla por voltio de placas verticales """
+@dataclass(frozen = True)
+class SensibilidadDeflexion:
+    px_por_volt_x: float
+    px_por_volt_y: float
+
+    def posicion(self, voltaje_v, voltaje_h): #Dos multiplicaciones por muestra
+        return np.multiply(voltaje_h, self.px_por_volt_x), np.multiply(voltaje_v, self.px_por_volt_y)
+
+"""
+    Sensibilidad para un voltaje de aceleración y geometría, con caché LRU
+    (el deslizador de aceleración casi nunca cambia entre frames) """
+def sensibilidadDeflexion(voltaje_aceleracion, geometria=None):
+    return _sensibilidadCache(float(voltaje_aceleracion), geometria or TubeGeometry())
+
+@lru_cache(maxsize=128)
+def _sensibilidadCache(voltaje_aceleracion, geometria):
+    px_x, px_y = _posicionPorTramos(1.0, 1.0, voltaje_aceleracion, geometria, E_CHARGE, E_MASS)
+    return SensibilidadDeflexion(float(px_x), float(px_y))
+
+"""
+    Posición de impacto en pantalla (px) para arreglos de voltajes, trayectoria por tramos:
+    placas verticales -> espacio entre placas -> placas horizontales -> vuelo libre a la pantalla.
+    Misma física que Display._calcular_posicion_realista, evaluada de una sola vez con NumPy.
+
+    voltaje_v: voltaje de las placas verticales (V), escalar o arreglo
+    voltaje_h: voltaje de las placas horizontales (V), escalar o arreglo
+    voltaje_aceleracion: voltaje de aceleración (V), escalar o arreglo; <= 0 deja el haz en el centro
+    geometria: dimensiones del tubo (TubeGeometry por defecto)
+    dtype: tipo de los píxeles devueltos (np.float32 en el modo de precisión reducida)
+    Retorna (pixel_x, pixel_y): pixel_x con la forma de la difusión de voltaje_h con el voltaje de aceleración,
+    pixel_y con la de voltaje_v con el voltaje de aceleración (cada eje solo depende de su par de placas)
+    Con un voltaje de aceleración escalar se usa la sensibilidad en caché """
+def posicionPantalla(voltaje_v, voltaje_h, voltaje_aceleracion, geometria=None, q=E_CHARGE, M=E_MASS, dtype=float):
+    g = geometria or TubeGeometry()
+    if np.ndim(voltaje_aceleracion) == 0 and q == E_CHARGE and M == E_MASS:
+        pixel_x, pixel_y = sensibilidadDeflexion(voltaje_aceleracion, g).posicion(voltaje_v, voltaje_h)
+        return np.asarray(pixel_x, dtype=dtype), np.asarray(pixel_y, dtype=dtype)
+    pixel_x, pixel_y = _posicionPorTramos(voltaje_v, voltaje_h, voltaje_aceleracion, g, q, M)
+    return pixel_x.astype(dtype, copy=False), pixel_y.astype(dtype, copy=False)
+
+def _posicionPorTramos(voltaje_v, voltaje_h, voltaje_aceleracion, g, q, M): #Cálculo completo por tramos
+    voltaje_v = np.asarray(voltaje_v, dtype=float)
+    voltaje_h = np.asarray(voltaje_h, dtype=float)
+    voltaje_aceleracion = np.asarray(voltaje_aceleracion, dtype=float)
+
+    activo = voltaje_aceleracion > 0
+    v0 = np.sqrt(2 * q * np.where(activo, np.abs(voltaje_aceleracion), 1.0) / M)
+
+    #Tramo 1: deflexión vertical (negativa, el electrón tiene carga negativa)
+    aceleracion_v = -q * (voltaje_v / g.separacion_placas) / M
+    tiempo_placas_v = g.longitud_placas_v / v0
+    vy_salida = aceleracion_v * tiempo_placas_v
+    y_en_placas_v = 0.5 * aceleracion_v * tiempo_placas_v**2
+
+    #Tramo 2: entre placas verticales y horizontales
+    y_entre_placas = vy_salida * (g.distancia_entre_placas / v0)
+
+    #Tramo 3: deflexión horizontal
+    aceleracion_h = q * (voltaje_h / g.separacion_placas) / M
+    tiempo_placas_h = g.longitud_placas_h / v0
+    vx_salida = aceleracion_h * tiempo_placas_h
+    x_en_placas_h = 0.5 * aceleracion_h * tiempo_placas_h**2
+
+    #Tramo 4: vuelo libre hasta la pantalla
+    tiempo_a_pantalla = g.distancia_placas_h_pantalla / v0
+    y_total = y_en_placas_v + y_entre_placas + vy_salida * tiempo_a_pantalla
+    x_total = x_en_placas_h + vx_salida * tiempo_a_pantalla
+
+    pixel_x = np.where(activo, x_total * g.escala_px, 0.0)
+    pixel_y = np.where(activo, y_total * g.escala_px, 0.0)
+    return pixel_x, pixel_y
+
+
+"""
+ ----------------------------Deflexión con tiempo de tránsito finito
+ A altas frecuencias el voltaje cambia mientras el electrón cruza las placas. Para V(t) = Re{e^{jωt}}
+ la velocidad y el desplazamiento dentro de las placas se integran de forma analítica:
+     v_salida = -(q/Md) τ Q(ωτ) e^{jωt0},   Q(x) = (e^{jx} - 1)/(jx)
+     y_placas = -(q/Md) τ² P(ωτ) e^{jωt0},  P(x) = (e^{jx} - 1 - jx)/(jx)²
+     τ tiempo dentro de las placas, t0 instante de entrada
+ Con ω = 0 se recupera la sensibilidad estática (Q = 1, P = 1/2). Las distancias de vuelo libre
+ son las mismas de posicionPantalla. """
+def _transitoQP(x):
+    x = np.asarray(x, dtype=float)
+    jx = 1j * x
+    pequeno = np.abs(x) < 1e-2
+    xs = np.where(pequeno, 1.0, x) #Evita dividir entre 0 en la rama exacta
+    jxs = 1j * xs
+    Q = np.where(pequeno, 1 + jx/2 + jx**2/6 + jx**3/24, (np.exp(jxs) - 1) / jxs)
+    P = np.where(pequeno, 0.5 + jx/6 + jx**2/24 + jx**3/120, (np.exp(jxs) - 1 - jxs) / jxs**2)
+    return Q, P
+
+"""
+ Respuesta compleja de deflexión (px/V) vs frecuencia, referida al instante en que el electrón
+ entra a las placas verticales.
+     frecuencia frecuencia del voltaje de placas (Hz), escalar o arreglo
+     voltaje_aceleracion voltaje de aceleración (V)
+     eje 'x' placas horizontales | 'y' placas verticales """
+def respuestaDeflexion(frecuencia, voltaje_aceleracion, eje, geometria=None, q=E_CHARGE, M=E_MASS):
+    g = geometria or TubeGeometry()
+    frecuencia = np.asarray(frecuencia, dtype=float)
+    if voltaje_aceleracion <= 0:
+        return np.zeros(frecuencia.shape, dtype=complex)
+    v0 = velocidadCE(q, abs(voltaje_aceleracion), M)
+    w = 2 * math.pi * frecuencia
+    k = q / (M * g.separacion_placas)
+
+    if eje == 'y':
+        tau = g.longitud_placas_v / v0
+        Q, P = _transitoQP(w * tau)
+        vuelo = (g.distancia_entre_placas + g.distancia_placas_h_pantalla) / v0
+        metros = -k * (tau**2 * P + tau * Q * vuelo)
+    elif eje == 'x':
+        tau = g.longitud_placas_h / v0
+        Q, P = _transitoQP(w * tau)
+        vuelo = g.distancia_placas_h_pantalla / v0
+        retardo = (g.longitud_placas_v + g.distancia_entre_placas) / v0 #Llega a las placas H después
+        metros = k * (tau**2 * P + tau * Q * vuelo) * np.exp(1j * w * retardo)
+    else:
+        raise ValueError("eje debe ser 'x' o 'y'.")
+    return metros * g.escala_px
+
+"""
+ Deflexión en pantalla (px) para V(t) = amplitud * sen(2π f t + fase), vectorizada sobre
+ los instantes de entrada t_entrada de cada electrón (atenuación y desfase por tránsito incluidos).
+ La fase se arma siempre en float64; dtype solo fija el tipo de los píxeles devueltos """
+def deflexionSinusoidal(amplitud, frecuencia, fase, t_entrada, voltaje_aceleracion, eje, geometria=None, dtype=float):
+    H = respuestaDeflexion(frecuencia, voltaje_aceleracion, eje, geometria)
+    fasor = amplitud * H * np.exp(1j * (fase - math.pi / 2)) #sen(θ) = Re{e^{j(θ - π/2)}}
+    theta = 2 * math.pi * frecuencia * np.asarray(t_entrada, dtype=float) + np.angle(fasor)
+    return (np.abs(fasor) * np.cos(theta)).astype(dtype, copy=False)
@@ -0,0 +1,225 @@
+#Fuentes de señal externas (WAV, NPY, CSV) leídas por bloques para manejar las placas en modo XY
+
+#Imports
+from __future__ import annotations
+import os
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Iterator, Optional, Sequence, Tuple
+import numpy as np
+from scipy.io import wavfile
+from src.utils.constantes import FS_DEF
+
+ESCALA_VOLTIOS_DEF: float = 400.0 #Voltios de placa para una muestra a escala completa (±1)
+FILAS_BLOQUE_CSV: int = 65_536 #Filas por lectura del CSV
+MAX_ENCABEZADO_CSV: int = 64 #Líneas iniciales revisadas al buscar la primera fila numérica
+
+#Escala completa de los tipos enteros de WAV/NPY: (centro, divisor) para llevar las muestras a ±1
+_ESCALA_ENTEROS = {
+    np.dtype(np.uint8): (128.0, 128.0),
+    np.dtype(np.int16): (0.0, 32_768.0),
+    np.dtype(np.int32): (0.0, 2_147_483_648.0),
+}
+
+
+class FuenteExterna(ABC): #Entrega bloques (voltaje_h, voltaje_v) en V a su propia fs; vuelve al inicio al terminar si repetir
+    """
+    Convención de "oscilloscope music": canal 0 (izquierdo) -> placas horizontales (X),
+    canal 1 (derecho) -> placas verticales (Y). Con un solo canal se maneja solo la vertical.
+    """
+
+    def __init__(self, fs: float, escala: float = ESCALA_VOLTIOS_DEF, repetir: bool = True) -> None:
+        if fs <= 0:
+            raise ValueError("fs debe ser > 0.")
+        self.fs = float(fs)
+        self.escala = escala
+        self.repetir = repetir
+
+    @abstractmethod
+    def leer(self, n: int) -> Tuple[np.ndarray, np.ndarray]: #Siguientes n muestras (menos si se acabó y no repite)
+        ...
+
+    def saltar(self, n: int) -> None: #Avanza n muestras sin entregarlas
+        restantes = n
+        while restantes > 0:
+            x, _ = self.leer(min(restantes, FILAS_BLOQUE_CSV))
+            if x.size == 0:
+                break
+            restantes -= x.size
+
+    @abstractmethod
+    def reiniciar(self) -> None: #Vuelve al inicio de la fuente
+        ...
+
+    def cerrar(self) -> None: #Libera recursos (archivos abiertos); sin efecto si la fuente no tiene
+        pass
+
+    def __enter__(self) -> "FuenteExterna":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+
+    def bloques(self, tamano: int = 1024) -> Iterator[Tuple[np.ndarray, np.ndarray]]: #Bloques consecutivos hasta agotar la fuente
+        while True:
+            voltaje_h, voltaje_v = self.leer(tamano)
+            if voltaje_h.size == 0:
+                return
+            yield voltaje_h, voltaje_v
+
+
+class FuenteMapeada(FuenteExterna): #Arreglo (N,) o (N, canales) mapeado en memoria: solo se tocan las páginas leídas
+    def __init__(self, datos: np.ndarray, fs: float, escala: float = ESCALA_VOLTIOS_DEF, repetir: bool = True) -> None:
+        super().__init__(fs, escala, repetir)
+        if datos.ndim not in (1, 2) or datos.shape[0] == 0:
+            raise ValueError("datos debe tener forma (N,) o (N, canales) con N > 0.")
+        self.datos = datos
+        self.muestras = datos.shape[0]
+        centro, divisor = _ESCALA_ENTEROS.get(datos.dtype, (0.0, 1.0))
+        self._centro = centro
+        self._ganancia = escala / divisor
+        self.posicion = 0
+
+    @property
+    def duracion(self) -> float: #Segundos
+        return self.muestras / self.fs
+
+    def _voltajes(self, bloque: np.ndarray) -> Tuple[np.ndarray, np.ndarray]: #Muestras crudas -> voltios (copia en float64)
+        v = np.array(bloque, dtype=float)
+        if self._centro:
+            v -= self._centro
+        v *= self._ganancia
+        if v.ndim == 1:
+            return np.zeros_like(v), v
+        if v.shape[1] == 1: #Un solo canal: solo la vertical, igual que un arreglo 1D
+            return np.zeros(v.shape[0]), v[:, 0]
+        return v[:, 0], v[:, 1]
+
+    def leer(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        partes = []
+        restantes = max(int(n), 0)
+        while restantes > 0:
+            if self.posicion >= self.muestras:
+                if not self.repetir:
+                    break
+                self.posicion = 0
+            fin = min(self.posicion + restantes, self.muestras)
+            partes.append(self.datos[self.posicion:fin]) #Rebanada contigua del mapa
+            restantes -= fin - self.posicion
+            self.posicion = fin
+        if not partes:
+            return np.empty(0), np.empty(0)
+        return self._voltajes(partes[0] if len(partes) == 1 else np.concatenate(partes))
+
+    def saltar(self, n: int) -> None: #Acceso aleatorio: no hace falta leer
+        destino = self.posicion + max(int(n), 0)
+        self.posicion = destino % self.muestras if self.repetir else min(destino, self.muestras)
+
+    def reiniciar(self) -> None:
+        self.posicion = 0
+
+
+class FuenteCSV(FuenteExterna): #Texto no se puede mapear: se lee en bloques de filas, sin cargar el archivo completo
+    """
+    Sin columnas se usan (0,) o (0, 1) según cuántas tenga la primera fila numérica; sin encabezado
+    se saltan las líneas iniciales que no son numéricas. El primer bloque se lee en el constructor,
+    así un archivo mal formado falla al abrirlo y no en medio de la animación.
+    """
+
+    def __init__(self, ruta: str, fs: float, escala: float = 1.0, columnas: Optional[Sequence[int]] = None, delimitador: str = ",", encabezado: Optional[int] = None, repetir: bool = True) -> None:
+        super().__init__(fs, escala, repetir)
+        if columnas is not None and len(columnas) not in (1, 2):
+            raise ValueError("columnas debe indicar 1 (vertical) o 2 (horizontal, vertical) columnas.")
+        self.ruta = ruta
+        self.delimitador = delimitador
+        if columnas is None or encabezado is None:
+            primera, n_columnas = self._primera_fila_numerica()
+            encabezado = primera if encabezado is None else encabezado
+            if columnas is None:
+                columnas = (0,) if n_columnas == 1 else (0, 1)
+        self.columnas = tuple(columnas)
+        self.encabezado = encabezado
+        self._archivo = None
+        self.reiniciar()
+        try:
+            self._pendiente = self._leer_filas()
+        except Exception:
+            self.cerrar()
+            raise
+        if self._pendiente.shape[0] == 0:
+            self.cerrar()
+            raise ValueError(f"{ruta} no tiene filas de datos.")
+
+    def _primera_fila_numerica(self) -> Tuple[int, int]: #(índice de línea, columnas) de la primera fila de datos; (0, 0) si no hay
+        with open(self.ruta, "r", encoding="utf-8") as archivo:
+            for i, linea in enumerate(islice(archivo, MAX_ENCABEZADO_CSV)):
+                campos = linea.split("#")[0].strip()
+                if not campos:
+                    continue
+                try:
+                    valores = [float(c) for c in campos.split(self.delimitador)]
+                except ValueError: #Encabezado u otra línea de texto
+                    continue
+                return i, len(valores)
+        return 0, 0
+
+    def reiniciar(self) -> None:
+        if self._archivo is not None:
+            self._archivo.close()
+        self._archivo = open(self.ruta, "r", encoding="utf-8")
+        for _ in islice(self._archivo, self.encabezado):
+            pass
+        self._pendiente = np.empty((0, len(self.columnas)))
+
+    def cerrar(self) -> None:
+        if self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
+
+    def _leer_filas(self) -> np.ndarray: #Siguiente bloque de filas (vacío al final del archivo)
+        lineas = list(islice(self._archivo, FILAS_BLOQUE_CSV))
+        if not lineas:
+            return np.empty((0, len(self.columnas)))
+        return np.loadtxt(lineas, delimiter=self.delimitador, usecols=self.columnas, ndmin=2)
+
+    def leer(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        partes = [self._pendiente]
+        disponibles = self._pendiente.shape[0]
+        reinicios = 0
+        while disponibles < n:
+            filas = self._leer_filas()
+            if filas.shape[0] == 0:
+                if not self.repetir or reinicios:
+                    break
+                self.reiniciar()
+                reinicios += 1 #Un archivo vacío no debe girar para siempre
+                continue
+            reinicios = 0
+            partes.append(filas)
+            disponibles += filas.shape[0]
+        datos = np.concatenate(partes)
+        bloque, self._pendiente = datos[:n], datos[n:]
+        v = bloque * self.escala
+        if v.shape[1] == 1:
+            return np.zeros(v.shape[0]), v[:, 0]
+        return v[:, 0], v[:, 1]
+
+
+def abrir_wav(ruta: str, escala: float = ESCALA_VOLTIOS_DEF, repetir: bool = True) -> FuenteMapeada: #WAV mono o estéreo mapeado en memoria
+    fs, datos = wavfile.read(ruta, mmap=True)
+    return FuenteMapeada(datos, fs, escala, repetir)
+
+
+def abrir_npy(ruta: str, fs: float = FS_DEF, escala: float = 1.0, repetir: bool = True) -> FuenteMapeada: #Traza .npy (N,) o (N, 2); por defecto ya en voltios
+    return FuenteMapeada(np.load(ruta, mmap_mode="r"), fs, escala, repetir)
+
+
+def abrir_fuente(ruta: str, fs: Optional[float] = None, escala: Optional[float] = None, repetir: bool = True) -> FuenteExterna: #Elige el lector por la extensión (CSV: columnas y encabezado detectados)
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".wav":
+        return abrir_wav(ruta, ESCALA_VOLTIOS_DEF if escala is None else escala, repetir)
+    if extension == ".npy":
+        return abrir_npy(ruta, FS_DEF if fs is None else fs, 1.0 if escala is None else escala, repetir)
+    if extension in (".csv", ".txt"):
+        return FuenteCSV(ruta, FS_DEF if fs is None else fs, 1.0 if escala is None else escala, repetir=repetir)
+    raise ValueError(f"Formato no soportado: {extension or ruta}.")
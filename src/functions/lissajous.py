@@ -0,0 +1,90 @@
+#Caché de curvas de Lissajous cerradas para razones de frecuencia racionales
+
+#Imports
+from __future__ import annotations
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
+from typing import Optional, Tuple
+import numpy as np
+from src.functions.fisica import deflexionSinusoidal
+from src.functions.yugo import YugoMagnetico, posicion_pantalla
+from src.utils.constantes import TubeGeometry
+
+MAX_DENOMINADOR: int = 32 #Razones p:q más finas se calculan directamente
+PUNTOS_POR_CICLO: int = 256 #Muestras de la curva por ciclo de la señal más rápida
+TOLERANCIA_RAZON: float = 1e-9 #Error relativo aceptado al reconocer una razón racional
+
+
+@dataclass(frozen = True)
+class CurvaLissajous: #Un periodo completo de la figura en px, parametrizado por s ∈ [0, 1)
+    """
+    Con f_v = p f0 y f_h = q f0 (p:q reducida) la figura se cierra en 1/f0. En forma canónica
+    θ_h = 2π q s y θ_v = 2π p s + fase_relativa, donde fase_relativa = φv - p φh / q; así dos
+    pares de fases con la misma diferencia canónica comparten curva y solo cambia el origen de s.
+    """
+    p: int
+    q: int
+    x: np.ndarray #N + 1 muestras (la última repite la primera para interpolar)
+    y: np.ndarray
+
+    def posicion(self, s, dtype=float) -> Tuple[np.ndarray, np.ndarray]: #Interpolación lineal sobre la curva; s en float64, píxeles en dtype
+        n = self.x.size - 1
+        u = np.mod(np.asarray(s, dtype=float), 1.0) * n
+        i = np.minimum(u.astype(np.intp), n - 1)
+        u -= i
+        x = self.x[i] + (self.x[i + 1] - self.x[i]) * u
+        y = self.y[i] + (self.y[i + 1] - self.y[i]) * u
+        return x.astype(dtype, copy=False), y.astype(dtype, copy=False)
+
+
+def razon_racional(freq_v: float, freq_h: float, max_denominador: int = MAX_DENOMINADOR) -> Optional[Tuple[int, int, float]]: #(p, q, f0) si f_v:f_h es racional, si no None
+    if freq_h <= 0 or freq_v < 0:
+        return None
+    razon = Fraction(freq_v / freq_h).limit_denominator(max_denominador)
+    if abs(float(razon) * freq_h - freq_v) > TOLERANCIA_RAZON * max(freq_v, freq_h):
+        return None
+    if razon.numerator > max_denominador:
+        return None
+    return razon.numerator, razon.denominator, freq_h / razon.denominator
+
+
+def curva_lissajous(p: int, q: int, fase_relativa: float, amplitud: float, voltaje_aceleracion: float, frecuencia_base: Optional[float] = None, geometria: Optional[TubeGeometry] = None, yugo: Optional[YugoMagnetico] = None) -> CurvaLissajous: #Curva cerrada (caché LRU)
+    """
+    Con placas la respuesta de tránsito depende de la frecuencia absoluta, así que frecuencia_base
+    es parte de la clave; con yugo (mapa estático de voltajes) basta la razón y se ignora.
+    """
+    fase_relativa = round(float(fase_relativa) % (2 * np.pi), 12)
+    if yugo is not None:
+        frecuencia_base = None
+    elif frecuencia_base is None or frecuencia_base <= 0:
+        raise ValueError("frecuencia_base debe ser > 0 con deflexión por placas.")
+    return _curva_cache(int(p), int(q), fase_relativa, float(amplitud), float(voltaje_aceleracion), frecuencia_base, geometria or TubeGeometry(), yugo)
+
+
+@lru_cache(maxsize=64)
+def _curva_cache(p: int, q: int, fase_relativa: float, amplitud: float, voltaje_aceleracion: float, frecuencia_base: Optional[float], g: TubeGeometry, yugo: Optional[YugoMagnetico]) -> CurvaLissajous:
+    n = PUNTOS_POR_CICLO * max(p, q, 1)
+    s = np.arange(n + 1) / n
+    if yugo is None:
+        t = s / frecuencia_base #Tiempo canónico (φh = 0)
+        x = deflexionSinusoidal(amplitud, q * frecuencia_base, 0.0, t, voltaje_aceleracion, 'x', g)
+        y = deflexionSinusoidal(amplitud, p * frecuencia_base, fase_relativa, t, voltaje_aceleracion, 'y', g)
+    else:
+        voltaje_h = amplitud * np.sin(2 * np.pi * q * s)
+        voltaje_v = amplitud * np.sin(2 * np.pi * p * s + fase_relativa)
+        x, y = posicion_pantalla(voltaje_v, voltaje_h, voltaje_aceleracion, yugo, g)
+    x[-1], y[-1] = x[0], y[0]
+    x.flags.writeable = False
+    y.flags.writeable = False
+    return CurvaLissajous(p, q, x, y)
+
+
+def posicion_lissajous(t, freq_v: float, freq_h: float, fase_v: float, fase_h: float, amplitud: float, voltaje_aceleracion: float, geometria: Optional[TubeGeometry] = None, yugo: Optional[YugoMagnetico] = None, dtype=float) -> Optional[Tuple[np.ndarray, np.ndarray]]: #Posición (px) en los instantes t indexando la curva cacheada; None si la razón no es racional
+    razon = razon_racional(freq_v, freq_h)
+    if razon is None:
+        return None
+    p, q, f0 = razon
+    curva = curva_lissajous(p, q, fase_v - p * fase_h / q, amplitud, voltaje_aceleracion, f0, geometria, yugo)
+    s = f0 * np.asarray(t, dtype=float) + fase_h / (2 * np.pi * q)
+    return curva.posicion(s, dtype)
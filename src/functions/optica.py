@@ -0,0 +1,114 @@
+#Óptica paraxial del tubo con matrices de transferencia (ABCD) para posición y tamaño del punto
+
+#Imports
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+import numpy as np
+from src.utils.constantes import TubeGeometry
+
+#Estado aumentado de cada electrón: [x, x', y, y', 1] (m, rad); la última columna lleva las deflexiones
+
+
+def deriva(L: float) -> np.ndarray: #Espacio libre de largo L
+    M = np.eye(5)
+    M[0, 1] = M[2, 3] = L
+    return M
+
+
+def lente_delgada(focal: float) -> np.ndarray: #Lente de enfoque delgada (simétrica en x e y)
+    M = np.eye(5)
+    M[1, 0] = M[3, 2] = -1.0 / focal
+    return M
+
+
+def brecha_aceleracion(L: float, energia_inicial: float, energia_final: float) -> np.ndarray: #Campo longitudinal uniforme entre energías (eV)
+    razon = np.sqrt(energia_final / energia_inicial)
+    M = np.eye(5)
+    M[0, 1] = M[2, 3] = 2.0 * L / (1.0 + razon)
+    M[1, 1] = M[3, 3] = 1.0 / razon
+    return M
+
+
+def placas(L: float, separacion: float, voltaje_aceleracion: float, voltaje: float, eje: str) -> np.ndarray: #Deriva con deflexión uniforme V/d (misma convención de signos que posicionPantalla)
+    M = deriva(L)
+    signo, fila = (1.0, 0) if eje == 'x' else (-1.0, 2)
+    M[fila, 4] = signo * voltaje * L**2 / (4.0 * separacion * voltaje_aceleracion)
+    M[fila + 1, 4] = signo * voltaje * L / (2.0 * separacion * voltaje_aceleracion)
+    return M
+
+
+@dataclass(frozen = True)
+class SistemaOptico: #Matriz total del tubo para un voltaje de aceleración, lineal en los voltajes de placa
+    base: np.ndarray #Matriz 5x5 con las placas a 0 V
+    columna_v: np.ndarray #Aporte de 1 V en placas verticales a la última columna
+    columna_h: np.ndarray #Aporte de 1 V en placas horizontales a la última columna
+    escala_px: float
+
+    def matriz(self, voltaje_v: float, voltaje_h: float) -> np.ndarray:
+        M = self.base.copy()
+        M[:, 4] += voltaje_v * self.columna_v + voltaje_h * self.columna_h
+        return M
+
+    def propagar(self, estados: np.ndarray, voltaje_v: float = 0.0, voltaje_h: float = 0.0) -> np.ndarray: #Estados (N, 5) en la pantalla con una sola multiplicación de matrices
+        return estados @ self.matriz(voltaje_v, voltaje_h).T
+
+    def propagar_sigma(self, sigma: np.ndarray) -> np.ndarray: #Matriz de segundos momentos 4x4 en la pantalla: M Σ Mᵀ
+        M = self.base[:4, :4]
+        return M @ sigma @ M.T
+
+    def tamano_punto(self, estados: np.ndarray, voltaje_v: float = 0.0, voltaje_h: float = 0.0) -> Tuple[float, float, float, float]: #Centro y desviación (px) del punto
+        final = self.propagar(estados, voltaje_v, voltaje_h)
+        x = final[:, 0] * self.escala_px
+        y = final[:, 2] * self.escala_px
+        return float(x.mean()), float(y.mean()), float(x.std()), float(y.std())
+
+
+def sistema_optico(voltaje_aceleracion: float, geometria: Optional[TubeGeometry] = None, focal: Optional[float] = None, energia_inicial: Optional[float] = None, distancia_aceleracion: float = 0.02) -> SistemaOptico: #Matrices precalculadas por voltaje de aceleración (caché LRU)
+    """
+    Etapas: [brecha de aceleración] -> [lente] -> placas V -> deriva -> placas H -> deriva a la pantalla.
+    Sin energia_inicial (eV) los estados empiezan a la salida del ánodo, como en emision.muestrear_emision.
+    La deriva vertical tras las placas V es la misma de posicionPantalla (distancia entre placas más
+    distancia a la pantalla): las placas H no hacen avanzar y, así ambos modelos coinciden.
+    """
+    if voltaje_aceleracion <= 0:
+        raise ValueError("voltaje_aceleracion debe ser > 0.")
+    return _sistema_cache(float(voltaje_aceleracion), geometria or TubeGeometry(), focal, energia_inicial, distancia_aceleracion)
+
+
+@lru_cache(maxsize=64)
+def _sistema_cache(voltaje_aceleracion: float, g: TubeGeometry, focal: Optional[float], energia_inicial: Optional[float], distancia_aceleracion: float) -> SistemaOptico:
+    def total(voltaje_v: float, voltaje_h: float) -> np.ndarray:
+        etapas = []
+        if energia_inicial is not None:
+            etapas.append(brecha_aceleracion(distancia_aceleracion, energia_inicial, energia_inicial + voltaje_aceleracion))
+        if focal is not None:
+            etapas.append(lente_delgada(focal))
+        placas_h = placas(g.longitud_placas_h, g.separacion_placas, voltaje_aceleracion, voltaje_h, 'x')
+        placas_h[2, 3] = 0.0 #Sin deriva vertical dentro de las placas H (como posicionPantalla)
+        etapas += [placas(g.longitud_placas_v, g.separacion_placas, voltaje_aceleracion, voltaje_v, 'y'),
+                   deriva(g.distancia_entre_placas),
+                   placas_h,
+                   deriva(g.distancia_placas_h_pantalla)]
+        M = np.eye(5)
+        for etapa in etapas:
+            M = etapa @ M
+        return M
+
+    base = total(0.0, 0.0)
+    columna_v = total(1.0, 0.0)[:, 4] - base[:, 4]
+    columna_h = total(0.0, 1.0)[:, 4] - base[:, 4]
+    for arreglo in (base, columna_v, columna_h):
+        arreglo.flags.writeable = False
+    return SistemaOptico(base, columna_v, columna_h, g.escala_px)
+
+
+def estados_desde_haz(pos: np.ndarray, vel: np.ndarray) -> np.ndarray: #Convierte posiciones y velocidades (N, 3) a estados paraxiales (N, 5)
+    estados = np.empty((pos.shape[0], 5))
+    estados[:, 0] = pos[:, 0]
+    estados[:, 1] = vel[:, 0] / vel[:, 2]
+    estados[:, 2] = pos[:, 1]
+    estados[:, 3] = vel[:, 1] / vel[:, 2]
+    estados[:, 4] = 1.0
+    return estados
@@ -0,0 +1,144 @@
+#Placas deflectoras: campo eléctrico con bordes (fringe) resuelto por diferencias finitas
+
+#Imports
+from __future__ import annotations
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+import numpy as np
+from src.utils.constantes import TubeGeometry
+
+VERSION_SOLVER = 1 #Cambiarla invalida los mapas guardados en disco
+CACHE_DIR_DEF = os.path.join(os.path.expanduser("~"), ".cache", "crt-simulacion", "campos")
+
+
+@dataclass(frozen = True)
+class GeometriaPlacas: #Par de placas en corte 2D (z a lo largo del tubo, u transversal)
+    longitud: float #Largo de las placas (m)
+    separacion: float #Distancia entre placas (m)
+    margen: float = 0.0 #Espacio libre antes y después de las placas (m); 0 -> 2*separacion
+    semialtura: float = 0.0 #Distancia del eje a la caja a tierra (m); 0 -> 2.5*separacion
+    celdas_separacion: int = 20 #Celdas de la malla entre las placas
+    tolerancia: float = 1e-6 #Cambio máximo por iteración para detener SOR
+
+    def resuelta(self) -> "GeometriaPlacas": #Con los valores por defecto ya aplicados
+        return GeometriaPlacas(self.longitud, self.separacion,
+                               self.margen or 2.0 * self.separacion,
+                               self.semialtura or 2.5 * self.separacion,
+                               self.celdas_separacion, self.tolerancia)
+
+    def clave(self) -> str: #Hash de la geometría para el caché en disco
+        g = self.resuelta()
+        datos = {"version": VERSION_SOLVER, "longitud": g.longitud, "separacion": g.separacion,
+                 "margen": g.margen, "semialtura": g.semialtura,
+                 "celdas_separacion": g.celdas_separacion, "tolerancia": g.tolerancia}
+        return hashlib.sha256(json.dumps(datos, sort_keys=True).encode()).hexdigest()[:24]
+
+
+@dataclass(frozen = True)
+class MapaCampo: #Campo por voltio aplicado entre placas, normalizado a ~1/d en el centro
+    z0: float #Coordenada z del primer nodo, relativa a la entrada de las placas (m)
+    u0: float #Coordenada u del primer nodo (m)
+    h: float #Paso de la malla (m)
+    ez: np.ndarray #Componente longitudinal (V/m por V), forma (nz, nu)
+    eu: np.ndarray #Componente transversal (V/m por V), forma (nz, nu)
+
+    def muestrear(self, z: np.ndarray, u: np.ndarray) -> Tuple[np.ndarray, np.ndarray]: #Interpolación bilineal vectorizada; 0 fuera de la malla
+        nz, nu = self.ez.shape
+        fz = (np.asarray(z, dtype=float) - self.z0) / self.h
+        fu = (np.asarray(u, dtype=float) - self.u0) / self.h
+        dentro = (fz >= 0) & (fz <= nz - 1) & (fu >= 0) & (fu <= nu - 1)
+
+        iz = np.clip(np.floor(fz).astype(np.intp), 0, nz - 2)
+        iu = np.clip(np.floor(fu).astype(np.intp), 0, nu - 2)
+        wz = np.clip(fz - iz, 0.0, 1.0)
+        wu = np.clip(fu - iu, 0.0, 1.0)
+
+        def interpolar(campo: np.ndarray) -> np.ndarray:
+            c00 = campo[iz, iu]
+            c10 = campo[iz + 1, iu]
+            c01 = campo[iz, iu + 1]
+            c11 = campo[iz + 1, iu + 1]
+            valor = (c00 * (1 - wz) + c10 * wz) * (1 - wu) + (c01 * (1 - wz) + c11 * wz) * wu
+            return np.where(dentro, valor, 0.0)
+
+        return interpolar(self.ez), interpolar(self.eu)
+
+
+def resolver_laplace(geometria: GeometriaPlacas, omega: Optional[float] = None, max_iter: int = 20_000) -> MapaCampo: #SOR rojo-negro sobre la malla 2D
+    g = geometria.resuelta()
+    h = g.separacion / g.celdas_separacion
+    nz = int(round((g.longitud + 2 * g.margen) / h)) + 1
+    nu = int(round(2 * g.semialtura / h)) + 1
+    z0, u0 = -g.margen, -g.semialtura
+
+    #Conductores: placa superior a -1/2 V y placa inferior a +1/2 V (campo +1/d en el centro)
+    phi = np.zeros((nz, nu))
+    fijo = np.zeros((nz, nu), dtype=bool)
+    fijo[0, :] = fijo[-1, :] = fijo[:, 0] = fijo[:, -1] = True #Caja a tierra
+    iz0 = int(round(g.margen / h))
+    iz1 = int(round((g.margen + g.longitud) / h))
+    iu_sup = int(round((g.separacion / 2 - u0) / h))
+    iu_inf = int(round((-g.separacion / 2 - u0) / h))
+    phi[iz0:iz1 + 1, iu_sup] = -0.5
+    phi[iz0:iz1 + 1, iu_inf] = 0.5
+    fijo[iz0:iz1 + 1, iu_sup] = fijo[iz0:iz1 + 1, iu_inf] = True
+
+    if omega is None: #Relajación casi óptima para la malla
+        omega = 2.0 / (1.0 + np.sin(np.pi / max(nz, nu)))
+
+    ii, jj = np.meshgrid(np.arange(nz), np.arange(nu), indexing="ij")
+    colores = [((ii + jj) % 2 == c) & ~fijo for c in (0, 1)]
+    colores = [m[1:-1, 1:-1] for m in colores]
+
+    for _ in range(max_iter):
+        cambio = 0.0
+        for mascara in colores:
+            interior = phi[1:-1, 1:-1]
+            vecinos = 0.25 * (phi[:-2, 1:-1] + phi[2:, 1:-1] + phi[1:-1, :-2] + phi[1:-1, 2:])
+            delta = omega * (vecinos - interior)
+            delta[~mascara] = 0.0
+            interior += delta
+            cambio = max(cambio, float(np.abs(delta).max()))
+        if cambio < g.tolerancia:
+            break
+
+    grad_z, grad_u = np.gradient(phi, h)
+    return MapaCampo(z0=z0, u0=u0, h=h, ez=-grad_z, eu=-grad_u)
+
+
+def mapa_placas(geometria: GeometriaPlacas, cache_dir: Optional[str] = None) -> MapaCampo: #Mapa resuelto una sola vez por geometría (memoria y disco)
+    cache_dir = cache_dir or os.environ.get("CRT_CACHE_DIR") or CACHE_DIR_DEF
+    return _mapa_cache(geometria.resuelta(), cache_dir)
+
+
+@lru_cache(maxsize=16)
+def _mapa_cache(geometria: GeometriaPlacas, cache_dir: str) -> MapaCampo:
+    ruta = os.path.join(cache_dir, f"placas-{geometria.clave()}.npz")
+    if os.path.exists(ruta):
+        with np.load(ruta) as datos:
+            return MapaCampo(float(datos["z0"]), float(datos["u0"]), float(datos["h"]), datos["ez"], datos["eu"])
+
+    mapa = resolver_laplace(geometria)
+    os.makedirs(cache_dir, exist_ok=True)
+    #Escritura atómica: otros procesos nunca leen un archivo a medio escribir
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".npz")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, z0=mapa.z0, u0=mapa.u0, h=mapa.h, ez=mapa.ez, eu=mapa.eu)
+        os.replace(tmp, ruta)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return mapa
+
+
+def mapas_tubo(geometria: Optional[TubeGeometry] = None, cache_dir: Optional[str] = None) -> Tuple[MapaCampo, MapaCampo]: #Mapas de las placas verticales y horizontales del tubo
+    g = geometria or TubeGeometry()
+    mapa_v = mapa_placas(GeometriaPlacas(g.longitud_placas_v, g.separacion_placas), cache_dir)
+    mapa_h = mapa_placas(GeometriaPlacas(g.longitud_placas_h, g.separacion_placas), cache_dir)
+    return mapa_v, mapa_h
@@ -0,0 +1,92 @@
+#Remuestreo polifásico por bloques (tasa racional L/M) con estado persistente entre bloques
+
+#Imports
+from __future__ import annotations
+from fractions import Fraction
+from functools import lru_cache
+from typing import Tuple
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import signal
+
+MAX_DENOMINADOR: int = 1024 #Límite de L y M al aproximar fs_salida / fs_entrada
+TAPS_POR_FASE_DEF: int = 16 #Taps de cada fase en interpolación pura; crece con la decimación
+BETA_KAISER: float = 8.0 #Ventana Kaiser del prototipo (~80 dB de rechazo)
+
+
+class RemuestreadorPolifasico: #FIR prototipo L*T partido en L fases; cada salida cuesta T multiplicaciones
+    """
+    Salida m ↔ índice sobremuestreado u = m M: usa la fase p = u mod L sobre las T entradas que terminan
+    en n0 = u // L. Se guardan las últimas T-1 entradas, así que procesar un archivo en bloques de
+    cualquier tamaño da exactamente lo mismo que procesarlo entero. El costo por bloque depende solo
+    de las salidas producidas (y de copiar la entrada), no de cuántas entradas caen entre ellas.
+    """
+
+    def __init__(self, fs_entrada: float, fs_salida: float, taps_por_fase: int = TAPS_POR_FASE_DEF, max_denominador: int = MAX_DENOMINADOR) -> None:
+        if fs_entrada <= 0 or fs_salida <= 0:
+            raise ValueError("Las frecuencias de muestreo deben ser > 0.")
+        razon = Fraction(fs_salida / fs_entrada).limit_denominator(max_denominador)
+        if razon == 0:
+            razon = Fraction(1, max_denominador)
+        self.L = razon.numerator #Factor de interpolación
+        self.M = razon.denominator #Factor de decimación
+        self.fs_entrada = float(fs_entrada)
+        self.fs_salida = fs_entrada * self.L / self.M #Tasa real (puede diferir un poco de la pedida)
+        self.fases = _fases(self.L, self.M, taps_por_fase)
+        self.taps = self.fases.shape[1]
+        self.reiniciar()
+
+    @property
+    def retardo(self) -> float: #Retardo de grupo del filtro (s)
+        return (self.L * self.taps - 1) / 2.0 / (self.L * self.fs_entrada)
+
+    def reiniciar(self) -> None: #Olvida el historial (p. ej. tras un salto en la fuente)
+        self._historial = np.zeros(self.taps - 1)
+        self.entradas = 0 #Entradas consumidas en total
+        self.salidas = 0 #Salidas producidas en total
+
+    def procesar(self, x: np.ndarray) -> np.ndarray: #Salidas disponibles tras agregar el bloque x
+        x = np.asarray(x, dtype=float)
+        buf = np.concatenate((self._historial, x))
+        total = self.entradas + x.size
+        #Salidas m con m M // L <= total - 1, es decir m M <= total L - 1
+        m_fin = (total * self.L - 1) // self.M + 1 if total > 0 else 0
+        m = np.arange(self.salidas, max(m_fin, self.salidas), dtype=np.int64)
+        if m.size:
+            u = m * self.M
+            n0 = u // self.L
+            fase = u - n0 * self.L
+            inicio = n0 - self.entradas #Índice de la ventana en buf (las T-1 del historial van primero)
+            ventanas = sliding_window_view(buf, self.taps)[inicio]
+            y = np.einsum("ij,ij->i", ventanas, self.fases[fase])
+        else:
+            y = np.empty(0)
+
+        self._historial = buf[buf.size - self.taps + 1:].copy()
+        self.entradas = total
+        self.salidas += m.size
+        return y
+
+    def tiempos(self, n_salidas: int, t_inicio: float = 0.0) -> np.ndarray: #Instantes de las últimas n salidas (retardo compensado)
+        m = np.arange(self.salidas - n_salidas, self.salidas)
+        return t_inicio + m / self.fs_salida - self.retardo
+
+
+@lru_cache(maxsize=16)
+def _fases(L: int, M: int, taps_por_fase: int) -> np.ndarray: #Prototipo pasabajos partido en fases (L, T), invertidas para producto punto
+    if L == M == 1: #Misma tasa: copia directa
+        fases = np.ones((1, 1))
+        fases.flags.writeable = False
+        return fases
+    taps = taps_por_fase * max(1, -(-M // L)) #Al decimar el corte baja y el filtro se alarga en proporción
+    corte = 1.0 / max(L, M) #Relativo al Nyquist de la tasa sobremuestreada
+    h = signal.firwin(L * taps, corte, window=("kaiser", BETA_KAISER)) * L
+    fases = h.reshape(taps, L).T[:, ::-1].copy()
+    fases.flags.writeable = False
+    return fases
+
+
+def remuestrear(x: np.ndarray, fs_entrada: float, fs_salida: float, bloque: int = 4096) -> Tuple[np.ndarray, float]: #Atajo para un arreglo completo (por bloques); retorna (y, fs_salida real)
+    r = RemuestreadorPolifasico(fs_entrada, fs_salida)
+    partes = [r.procesar(x[i:i + bloque]) for i in range(0, len(x), bloque)]
+    return (np.concatenate(partes) if partes else np.empty(0)), r.fs_salida
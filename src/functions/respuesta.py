@@ -0,0 +1,63 @@
+#Respuesta en frecuencia de la deflexión (ganancia y fase) para ambos pares de placas
+
+#Imports
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+from src.functions.fisica import respuestaDeflexion, velocidadCE
+from src.utils.constantes import E_CHARGE, E_MASS, TubeGeometry
+
+
+@dataclass
+class RespuestaFrecuencia: #Función de transferencia muestreada; ganancia en px/V, fase en grados
+    frecuencias: np.ndarray
+    ganancia_x: np.ndarray
+    fase_x: np.ndarray
+    ganancia_y: np.ndarray
+    fase_y: np.ndarray
+    voltaje_aceleracion: float
+    ganancia_dc_x: float #|H(0)| de cada par (px/V), referencia de ganancia_db
+    ganancia_dc_y: float
+
+    def ganancia_db(self, eje: str) -> np.ndarray: #Ganancia relativa a la de DC (dB), aunque el barrido no empiece en 0 Hz
+        ganancia, dc = (self.ganancia_x, self.ganancia_dc_x) if eje == 'x' else (self.ganancia_y, self.ganancia_dc_y)
+        return 20.0 * np.log10(ganancia / dc)
+
+    def ancho_banda(self, eje: str) -> float: #Frecuencia de -3 dB (nan si no se alcanza en el barrido)
+        db = self.ganancia_db(eje)
+        debajo = np.nonzero(db <= -3.0)[0]
+        if debajo.size == 0:
+            return float("nan")
+        i = debajo[0]
+        if i == 0:
+            return float(self.frecuencias[0])
+        return float(np.interp(-3.0, [db[i], db[i - 1]], [self.frecuencias[i], self.frecuencias[i - 1]]))
+
+
+def analizar_respuesta(f_min: float, f_max: float, n: int = 2000, voltaje_aceleracion: float = 2000.0, geometria: Optional[TubeGeometry] = None, logaritmica: bool = True) -> RespuestaFrecuencia: #Barrido vectorizado de n frecuencias
+    if f_min < 0 or f_max <= f_min:
+        raise ValueError("Se requiere 0 <= f_min < f_max.")
+    if voltaje_aceleracion <= 0:
+        raise ValueError("voltaje_aceleracion debe ser > 0.")
+    g = geometria or TubeGeometry()
+    if logaritmica:
+        frecuencias = np.geomspace(max(f_min, 1e-3), f_max, n)
+    else:
+        frecuencias = np.linspace(f_min, f_max, n)
+
+    H_y = respuestaDeflexion(frecuencias, voltaje_aceleracion, 'y', g)
+    H_x = respuestaDeflexion(frecuencias, voltaje_aceleracion, 'x', g)
+
+    #Cada par se refiere a su propio instante de entrada: se quita el retardo hasta las placas H
+    v0 = velocidadCE(E_CHARGE, voltaje_aceleracion, E_MASS)
+    retardo = (g.longitud_placas_v + g.distancia_entre_placas) / v0
+    H_x = H_x * np.exp(-2j * np.pi * frecuencias * retardo)
+
+    dc = {eje: complex(respuestaDeflexion(0.0, voltaje_aceleracion, eje, g)) for eje in ('x', 'y')}
+
+    def fase(H: np.ndarray, eje: str) -> np.ndarray: #Desfase respecto a DC, desenvuelto (grados)
+        return np.degrees(np.unwrap(np.angle(H * np.sign(dc[eje].real))))
+
+    return RespuestaFrecuencia(frecuencias, np.abs(H_x), fase(H_x, 'x'), np.abs(H_y), fase(H_y, 'y'), voltaje_aceleracion,
+                               abs(dc['x']), abs(dc['y']))
@@ -2,11 +2,14 @@
 
 #Imports
 from __future__ import annotations
+import math
+import time
 from dataclasses import dataclass
-from typing import Tuple, Optional, Iterable
+from functools import lru_cache
+from typing import Dict, Tuple, Optional, Iterable, Iterator, Union
 import numpy as np
-from src.utils.constantes import SignalDefaults, PI
-from src.utils.helpers import tvector, validate_signal_params
+from src.utils.constantes import SignalDefaults, PI, FS_DEF, FREQ_DEF
+from src.utils.helpers import n_muestras, salida, tvector, validate_signal_params
 
 @dataclass(frozen = True)
 class SignalSpec: #Especificación de una señal senoidal
@@ -15,40 +18,287 @@ class SignalSpec: #Especificación de una señal senoidal
     phase: float = 0.0 #En rad
     offset: float = 0.0 #DC
 
+class SineOscillator: #Senoidal por bloques con fase continua entre bloques
+    def __init__(self, spec: SignalSpec, fs: float, chunk_size: int) -> None:
+        validate_signal_params(spec.frequency, spec.amplitude)
+        if fs <= 0:
+            raise ValueError("fs debe ser > 0.")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size debe ser > 0.")
+        self.spec = spec
+        self.fs = fs
+        self.chunk_size = chunk_size
+        self.dphi = 2.0 * np.pi * spec.frequency / fs #Incremento de fase por muestra (rad)
+        self._rampa = self.dphi * np.arange(chunk_size, dtype=float) #Fase dentro del bloque, se construye una vez
+        self._avance = (self.dphi * chunk_size) % (2.0 * np.pi)
+        self.phase = spec.phase % (2.0 * np.pi) #Fase al inicio del próximo bloque (float64, acotada)
+
+    def next_chunk(self, out: Optional[np.ndarray] = None) -> np.ndarray: #Siguiente bloque de chunk_size muestras (en out si se da)
+        directo = out is not None and out.dtype == np.float64 #En otra precisión la fase se arma aparte en float64
+        x = np.add(self._rampa, self.phase, out=out if directo else None)
+        np.sin(x, out=x)
+        if out is not None and not directo:
+            out[...] = x
+            x = out
+        x *= self.spec.amplitude
+        x += self.spec.offset
+        self.phase = (self.phase + self._avance) % (2.0 * np.pi)
+        return x
+
+
+class RecurrenceOscillator(SineOscillator): #Senoidal por rotación compleja: z[k+1] = z[k] * e^{jΔφ}, sin llamar a sin() por muestra
+    """
+    Cada bloque se divide en sub-bloques de sub_block muestras: las potencias e^{jΔφk} del sub-bloque se
+    precalculan una vez y los inicios de sub-bloque se obtienen por recurrencia (cumprod). El inicio de
+    cada bloque se re-ancla a la fase float64 acumulada, lo que renormaliza la recurrencia y evita deriva
+    en corridas largas.
+    """
+    def __init__(self, spec: SignalSpec, fs: float, chunk_size: int, sub_block: int = 1024) -> None:
+        super().__init__(spec, fs, chunk_size)
+        self.sub_block = min(sub_block, chunk_size)
+        self._n_sub = -(-chunk_size // self.sub_block)
+        self._potencias = np.exp(1j * self.dphi * np.arange(self.sub_block)) #e^{jΔφk}, k < sub_block
+        self._paso = np.exp(1j * self.dphi * self.sub_block) #Rotación entre sub-bloques
+        self._inicios = np.empty(self._n_sub, dtype=complex)
+        self._z = np.empty((self._n_sub, self.sub_block), dtype=complex) #Muestras complejas del bloque, reutilizadas
+
+    def next_chunk(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        inicios = self._inicios
+        inicios[0] = np.exp(1j * self.phase) #Re-anclaje exacto (renormalización)
+        inicios[1:] = self._paso
+        np.cumprod(inicios, out=inicios)
+        z = np.multiply.outer(inicios, self._potencias, out=self._z)
+        x = np.empty(self.chunk_size) if out is None or not out.flags.c_contiguous else out
+        completos = self.chunk_size // self.sub_block
+        corte = completos * self.sub_block
+        x[:corte].reshape(completos, self.sub_block)[...] = z.imag[:completos] #Parte imaginaria directo a la salida
+        if corte < self.chunk_size: #Último sub-bloque incompleto
+            x[corte:] = z.imag[completos, :self.chunk_size - corte]
+        if out is not None and x is not out:
+            out[...] = x
+            x = out
+        x *= self.spec.amplitude
+        x += self.spec.offset
+        self.phase = (self.phase + self._avance) % (2.0 * np.pi)
+        return x
+
+
+OSCILLATORS = {"numpy": SineOscillator, "recurrence": RecurrenceOscillator} #Backends de generación senoidal
+
+COMPOSITE_METHODS = ("auto", "loop", "broadcast", "ifft") #Métodos de SignalGenerator.composite
+BLOQUE_COMPOSITE: int = 32_768 #Elementos (float64) de la matriz tiempo x componentes por bloque
+COMPOSITE_MIN_ELEMENTOS: int = 100_000 #Muestras x componentes desde donde conviene evitar el bucle
+IFFT_MIN_SPECS: int = 16 #Desde cuántas componentes armónicas la irfft supera al broadcast
+
+
+@lru_cache(maxsize=16)
+def _oscilador(backend: str, spec: SignalSpec, fs: float, n: int) -> SineOscillator: #Oscilador reutilizable por (spec, fs, n); su fase se re-ancla en cada uso
+    return OSCILLATORS[backend](spec, fs, n)
+
+
+class SignalWorkspace: #Buffers preasignados y generador de ruido para regenerar cuadros sin reservar memoria
+    def __init__(self, n: int = 0, seed: Optional[int] = None, dtype=np.float64) -> None:
+        self.rng = np.random.default_rng(seed) #Ruido sin arreglos temporales (standard_normal con out=)
+        self.dtype = np.dtype(dtype) #Tipo de x e y; t y el auxiliar (fases) siempre en float64
+        self._tiempo = np.empty((2, n))
+        self._senal = np.empty((2, n), dtype=self.dtype)
+
+    def reservar(self, n: int) -> None: #Crece solo si hace falta; después del calentamiento no reserva más
+        if n > self._tiempo.shape[1]:
+            self._tiempo = np.empty((2, n))
+            self._senal = np.empty((2, n), dtype=self.dtype)
+
+    def buffers(self, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: #Vistas (t, x, y, auxiliar) de n muestras
+        self.reservar(n)
+        t, aux = self._tiempo[:, :n]
+        x, y = self._senal[:, :n]
+        return t, x, y, aux
+
+
 class SignalGenerator: #Generados de señales sinoidales individuales, compuestas y Lissajous
-    def __init__(self, defaults: Optional[SignalDefaults] = None) -> None: #Valores predeterminados
+    def __init__(self, defaults: Optional[SignalDefaults] = None, backend: str = "numpy") -> None: #Valores predeterminados y backend del oscilador
+        if backend not in OSCILLATORS:
+            raise ValueError(f"backend debe ser uno de {sorted(OSCILLATORS)}.")
         self.defaults = defaults or SignalDefaults()
+        self.backend = backend
+        self.dtype = np.dtype(self.defaults.precision) #Tipo de las señales generadas
 
-    def sine(self, freq: float, amp: float, phase: float = 0.0, offset: float = 0.0, fs: Optional[float] = None, duration: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]: #Señal senoidal: x(t) = offset + amp * sin(2π f t + phase)
+    def sine(self, freq: float, amp: float, phase: float = 0.0, offset: float = 0.0, fs: Optional[float] = None, duration: Optional[float] = None, out: Optional[np.ndarray] = None, workspace: Optional[SignalWorkspace] = None) -> Tuple[np.ndarray, np.ndarray]: #Señal senoidal: x(t) = offset + amp * sin(2π f t + phase)
         validate_signal_params(freq, amp)
         fs = self.defaults.fs if fs is None else fs
         duration = self.defaults.duration if duration is None else duration
 
-        t = tvector(fs, duration)
-        x = offset + amp * np.sin(2.0 * np.pi * freq * t + phase)
+        t, x, aux = self._buffers_tiempo(fs, duration, workspace)
+        x = self._sine_from_t(t, freq, amp, phase, offset, fs, x if out is None else out, aux)
         return t, x #Vector de tiempo y señal
 
-    def composite(self, specs: Iterable[SignalSpec], fs: Optional[float] = None, duration: Optional[float] = None, noise_std: float = 0.0) -> Tuple[np.ndarray, np.ndarray]: #Suma de varias senoidales con ruido gaussiano opcional
+    @staticmethod
+    def _buffers_tiempo(fs: float, duration: float, workspace: Optional[SignalWorkspace]) -> Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]: #Vector de tiempo (en el workspace si hay), buffer de salida y auxiliar float64
+        if workspace is None:
+            return tvector(fs, duration), None, None
+        t, x, _, aux = workspace.buffers(n_muestras(fs, duration))
+        return tvector(fs, duration, out=t), x, aux
+
+    def _sine_from_t(self, t: np.ndarray, freq: float, amp: float, phase: float, offset: float, fs: float, out: Optional[np.ndarray] = None, aux: Optional[np.ndarray] = None, dtype=None) -> np.ndarray: #x(t) sobre un vector de tiempo uniforme ya construido (en self.dtype salvo que se pida otro)
+        validate_signal_params(freq, amp)
+        out = salida(out, t.size, self.dtype if dtype is None else dtype)
+        uniforme = t.size < 2 or math.isclose(t[1] - t[0], 1.0 / fs, rel_tol=1e-9) #Los osciladores avanzan de a 1/fs
+        if self.backend == "numpy" or not uniforme:
+            if out.dtype == np.float64:
+                fase = np.multiply(t, 2.0 * np.pi * freq, out=out)
+            else: #La fase se arma en float64 (aux) y solo el seno se guarda en la precisión reducida
+                fase = np.multiply(t, 2.0 * np.pi * freq, out=aux)
+            fase += phase
+            np.sin(fase, out=fase)
+            if fase is not out: #copyto convierte sin búfer; np.sin(float64, out=float32) reservaría uno por llamada
+                np.copyto(out, fase)
+            out *= amp
+            out += offset
+            return out
+        osc = _oscilador(self.backend, SignalSpec(freq, amp, phase, offset), fs, t.size)
+        osc.phase = (2.0 * np.pi * freq * t[0] + phase) % (2.0 * np.pi) #El bloque empieza en t[0], no en 0
+        return osc.next_chunk(out)
+
+    def composite(self, specs: Iterable[SignalSpec], fs: Optional[float] = None, duration: Optional[float] = None, noise_std: float = 0.0, method: str = "auto", out: Optional[np.ndarray] = None, workspace: Optional[SignalWorkspace] = None) -> Tuple[np.ndarray, np.ndarray]: #Suma de varias senoidales con ruido gaussiano opcional
         fs = self.defaults.fs if fs is None else fs
         duration = self.defaults.duration if duration is None else duration
-        t = tvector(fs, duration)
-
-        x = np.zeros_like(t)
-        for s in specs: #Suma de señales
+        t, x, aux = self._buffers_tiempo(fs, duration, workspace)
+        x = salida(x if out is None else out, t.size, self.dtype)
+        #Buffer en la precisión de x para sumarle componentes y ruido: x += float64 reservaría un búfer de conversión por llamada
+        convertida = None
+        if x.dtype != np.float64:
+            convertida = np.empty_like(x) if workspace is None else workspace.buffers(t.size)[2]
+        specs = list(specs)
+        for s in specs:
             validate_signal_params(s.frequency, s.amplitude)
-            x += s.offset + s.amplitude * np.sin(2.0 * np.pi * s.frequency * t + s.phase)
+
+        if method not in COMPOSITE_METHODS:
+            raise ValueError(f"method debe ser uno de {COMPOSITE_METHODS}.")
+        bins = self._bins_armonicos(specs, t) if method in ("auto", "ifft") else None
+        if method == "auto": #Bucle para sumas pequeñas; ifft si muchas componentes caen en la rejilla armónica; si no broadcast
+            if len(specs) < 2 or t.size < 2 or t.size * len(specs) < COMPOSITE_MIN_ELEMENTOS:
+                method = "loop"
+            elif bins is not None and len(specs) >= IFFT_MIN_SPECS:
+                method = "ifft"
+            else:
+                method = "broadcast"
+        if method == "broadcast" and (t.size < 2 or not specs):
+            method = "loop"
+        if method == "ifft" and bins is None:
+            raise ValueError("method='ifft' requiere frecuencias en la rejilla armónica (f*duración entera, bajo Nyquist).")
+
+        if method == "ifft":
+            x[...] = self._composite_ifft(specs, bins, t.size)
+        elif method == "broadcast":
+            x[...] = self._composite_broadcast(specs, t)
+        else:
+            x.fill(0.0)
+            componente = np.empty(t.size) if aux is None else aux
+            for s in specs: #Suma de señales
+                c = self._sine_from_t(t, s.frequency, s.amplitude, s.phase, s.offset, fs, componente, dtype=np.float64) #Cada componente en float64
+                if convertida is not None:
+                    np.copyto(convertida, c)
+                    c = convertida
+                x += c
 
         if noise_std > 0.0: #Ruido gaussiano blanco
-            x += np.random.normal(loc=0.0, scale=noise_std, size=t.shape)
+            if workspace is None:
+                x += np.random.normal(loc=0.0, scale=noise_std, size=t.shape)
+            else:
+                ruido = aux if convertida is None else convertida #Se genera directo en la precisión de x
+                workspace.rng.standard_normal(out=ruido, dtype=ruido.dtype)
+                ruido *= noise_std
+                x += ruido
 
         return t, x #Vector de tiempo y señal compuesta
 
-    def lissajous(self, spec_x: SignalSpec, spec_y: SignalSpec, fs: Optional[float] = None, duration: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]: #Señales senoidales (x(t), y(t)) para trazar curvas de Lissajous
+    @staticmethod
+    def _bins_armonicos(specs: Iterable[SignalSpec], t: np.ndarray) -> Optional[np.ndarray]: #Bin de la rfft de cada spec, o None si alguna no cae en la rejilla
+        n = t.size
+        if n < 2 or not specs:
+            return None
+        ciclos = np.array([s.frequency for s in specs]) * (t[1] - t[0]) * n #Ciclos completos en la ventana
+        bins = np.rint(ciclos)
+        if np.any(np.abs(ciclos - bins) > 1e-9 * np.maximum(1.0, ciclos)) or np.any(bins <= 0) or np.any(2 * bins >= n):
+            return None
+        return bins.astype(np.intp)
+
+    @staticmethod
+    def _composite_ifft(specs: Iterable[SignalSpec], bins: np.ndarray, n: int) -> np.ndarray: #Síntesis por irfft: A sin(θ + φ) = Re{A e^{j(φ - π/2)} e^{jθ}}
+        amplitudes = np.array([s.amplitude for s in specs])
+        fases = np.array([s.phase for s in specs])
+        espectro = np.zeros(n // 2 + 1, dtype=complex)
+        np.add.at(espectro, bins, amplitudes * np.exp(1j * (fases - PI / 2)) * (n / 2)) #Specs repetidas en el mismo bin se suman
+        espectro[0] = n * sum(s.offset for s in specs)
+        return np.fft.irfft(espectro, n)
+
+    @staticmethod
+    def _composite_broadcast(specs: Iterable[SignalSpec], t: np.ndarray) -> np.ndarray: #Todas las componentes a la vez con productos matriciales por bloques de tiempo
+        """
+        Con t uniforme, dentro de un bloque que empieza en t0: A sin(w(t0 + m dt) + φ) =
+        sin(w m dt) * A cos(ψ) + cos(w m dt) * A sin(ψ), con ψ = w t0 + φ. Las matrices seno/coseno
+        (bloque x componentes) se calculan una vez y cada bloque solo necesita K senos y cosenos;
+        el resto es un producto matricial (BLAS) en lugar de una pasada completa de np.sin por spec.
+        """
+        n = t.size
+        w = 2.0 * np.pi * np.array([s.frequency for s in specs])
+        fases = np.array([s.phase for s in specs])
+        amplitudes = np.array([s.amplitude for s in specs])
+        bloque = min(n, max(64, BLOQUE_COMPOSITE // w.size)) #Matriz (bloque, componentes) de ~256 KB
+        n_bloques = -(-n // bloque)
+
+        m = np.outer(np.arange(bloque) * (t[1] - t[0]), w)
+        seno, coseno = np.sin(m), np.cos(m)
+        x = np.empty(n_bloques * bloque)
+        grupo = max(1, BLOQUE_COMPOSITE // w.size) #Bloques por producto matricial
+        for i in range(0, n_bloques, grupo):
+            inicios = t[i * bloque:min(n_bloques, i + grupo) * bloque:bloque]
+            psi = np.outer(w, inicios)
+            psi += fases[:, None]
+            destino = x[i * bloque:(i + inicios.size) * bloque].reshape(inicios.size, bloque)
+            np.dot((amplitudes[:, None] * np.cos(psi)).T, seno.T, out=destino)
+            destino += (amplitudes[:, None] * np.sin(psi)).T @ coseno.T
+        x = x[:n]
+        x += sum(s.offset for s in specs)
+        return x
+
+    def lissajous(self, spec_x: SignalSpec, spec_y: SignalSpec, fs: Optional[float] = None, duration: Optional[float] = None, out_x: Optional[np.ndarray] = None, out_y: Optional[np.ndarray] = None, workspace: Optional[SignalWorkspace] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]: #Señales senoidales (x(t), y(t)) para trazar curvas de Lissajous
         fs = self.defaults.fs if fs is None else fs
         duration = self.defaults.duration if duration is None else duration
 
-        t = tvector(fs, duration)
-        _, x = self.sine(spec_x.frequency, spec_x.amplitude, spec_x.phase, spec_x.offset, fs, duration)
-        _, y = self.sine(spec_y.frequency, spec_y.amplitude, spec_y.phase, spec_y.offset, fs, duration)
+        t, x, aux = self._buffers_tiempo(fs, duration, workspace) #Un solo vector de tiempo para ambas señales
+        y = None if workspace is None else workspace.buffers(t.size)[2]
+        x = self._sine_from_t(t, spec_x.frequency, spec_x.amplitude, spec_x.phase, spec_x.offset, fs, x if out_x is None else out_x, aux)
+        y = self._sine_from_t(t, spec_y.frequency, spec_y.amplitude, spec_y.phase, spec_y.offset, fs, y if out_y is None else out_y, aux)
 
         return t, x, y #Vector de tiempo y señales x(t), y(t)
+
+    def iter_chunks(self, spec: Union[SignalSpec, Iterable[SignalSpec]], fs: Optional[float] = None, chunk_size: int = 1024) -> Iterator[np.ndarray]: #Bloques infinitos de chunk_size muestras con fase continua
+        fs = self.defaults.fs if fs is None else fs
+        specs = [spec] if isinstance(spec, SignalSpec) else list(spec)
+        osciladores = [OSCILLATORS[self.backend](s, fs, chunk_size) for s in specs]
+        if not osciladores:
+            raise ValueError("Se requiere al menos una SignalSpec.")
+
+        while True:
+            x = osciladores[0].next_chunk()
+            for osc in osciladores[1:]: #Suma de señales (compuesta)
+                x += osc.next_chunk()
+            yield x.astype(self.dtype, copy=False) #La fase de cada oscilador se acumula en float64
+
+    def iter_lissajous_chunks(self, spec_x: SignalSpec, spec_y: SignalSpec, fs: Optional[float] = None, chunk_size: int = 1024) -> Iterator[Tuple[np.ndarray, np.ndarray]]: #Bloques (x, y) infinitos para curvas de Lissajous
+        for x, y in zip(self.iter_chunks(spec_x, fs, chunk_size), self.iter_chunks(spec_y, fs, chunk_size)):
+            yield x, y
+
+
+def benchmark_oscillators(n: int = 1 << 20, repeats: int = 10, fs: float = FS_DEF, freq: float = FREQ_DEF) -> Dict[str, float]: #Rendimiento (Mmuestras/s) de cada backend para bloques de n muestras
+    spec = SignalSpec(freq, 1.0)
+    resultados = {}
+    for nombre, clase in OSCILLATORS.items():
+        osc = clase(spec, fs, n)
+        osc.next_chunk() #Calentamiento
+        inicio = time.perf_counter()
+        for _ in range(repeats):
+            osc.next_chunk()
+        resultados[nombre] = n * repeats / (time.perf_counter() - inicio) / 1e6
+    return resultados
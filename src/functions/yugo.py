@@ -0,0 +1,71 @@
+#Deflexión magnética con yugo (bobinas tipo TV) y campo externo uniforme opcional
+
+#Imports
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import numpy as np
+from src.utils.constantes import E_CHARGE, E_MASS, TubeGeometry
+
+
+@dataclass(frozen = True)
+class YugoMagnetico: #Región de campo B uniforme excitada con la misma señal que las placas
+    """
+    La región del yugo ocupa z_inicio <= z <= z_inicio + longitud (z = 0 en la entrada de las placas
+    verticales, igual que ElectronBeam). La señal de control (V) se convierte en corriente de bobina y
+    luego en campo: B = tesla_por_amperio * amperios_por_voltio * V.
+    Convención igual a las placas: señal vertical positiva -> y negativa, horizontal positiva -> x positiva.
+    """
+    z_inicio: float = 0.0 #Inicio de la región del yugo (m)
+    longitud: float = 0.05 #Largo de la región del yugo (m)
+    tesla_por_amperio: float = 1e-3 #Campo por amperio de bobina (T/A)
+    amperios_por_voltio: float = 1e-3 #Corriente de bobina por voltio de señal (A/V)
+    campo_externo: Tuple[float, float, float] = (0.0, 0.0, 0.0) #Campo uniforme en todo el tubo, p. ej. el terrestre (T)
+
+    @property
+    def tesla_por_voltio(self) -> float:
+        return self.tesla_por_amperio * self.amperios_por_voltio
+
+    def campo(self, pos: np.ndarray, voltaje_v: float, voltaje_h: float, out: Optional[np.ndarray] = None) -> np.ndarray: #B (T) en cada posición (N, 3)
+        B = np.empty_like(pos) if out is None else out
+        B[...] = self.campo_externo
+        z = pos[:, 2]
+        dentro = (z >= self.z_inicio) & (z <= self.z_inicio + self.longitud)
+        B[dentro, 0] += self.tesla_por_voltio * voltaje_v #Bx desvía en y
+        B[dentro, 1] += self.tesla_por_voltio * voltaje_h #By desvía en x
+        return B
+
+
+def _desvio_arco(B, v0, longitud, deriva, q_m): #Desvío (m) de un arco circular dentro del campo más la deriva recta; NaN si no llega a la pantalla
+    radio = v0 / (q_m * np.where(B == 0, 1.0, np.abs(B)))
+    seno = longitud / radio
+    sale = seno < 1.0 #Con radio <= longitud el electrón gira de vuelta (o sale perpendicular) dentro del campo
+    coseno = np.sqrt(np.where(sale, 1.0 - seno**2, 1.0))
+    desvio = radio * (1.0 - coseno) + deriva * seno / coseno
+    return np.where(B == 0, 0.0, np.where(sale, np.sign(B) * desvio, np.nan))
+
+
+def posicion_pantalla(voltaje_v, voltaje_h, voltaje_aceleracion, yugo: Optional[YugoMagnetico] = None, geometria: Optional[TubeGeometry] = None, q: float = E_CHARGE, M: float = E_MASS) -> Tuple[np.ndarray, np.ndarray]: #Equivalente magnético de posicionPantalla (px), vectorizado; NaN donde el haz no llega
+    y_ = yugo or YugoMagnetico()
+    g = geometria or TubeGeometry()
+    voltaje_aceleracion = np.asarray(voltaje_aceleracion, dtype=float)
+    activo = voltaje_aceleracion > 0
+    q_m = q / M
+    v0 = np.sqrt(2 * q_m * np.where(activo, np.abs(voltaje_aceleracion), 1.0))
+
+    largo_tubo = g.longitud_placas_v + g.distancia_entre_placas + g.longitud_placas_h + g.distancia_placas_h_pantalla
+    deriva = largo_tubo - y_.z_inicio - y_.longitud
+    bx = y_.tesla_por_voltio * np.asarray(voltaje_v, dtype=float)
+    by = y_.tesla_por_voltio * np.asarray(voltaje_h, dtype=float)
+
+    #F = -e v × B con v según z: By > 0 desvía hacia +x, Bx > 0 hacia -y
+    x = _desvio_arco(by, v0, y_.longitud, deriva, q_m)
+    y = -_desvio_arco(bx, v0, y_.longitud, deriva, q_m)
+
+    #Campo externo uniforme a lo largo de todo el tubo
+    bx_ext, by_ext, _ = y_.campo_externo
+    if bx_ext or by_ext:
+        x = x + _desvio_arco(np.full_like(v0, by_ext), v0, largo_tubo, 0.0, q_m)
+        y = y - _desvio_arco(np.full_like(v0, bx_ext), v0, largo_tubo, 0.0, q_m)
+
+    return np.where(activo, x * g.escala_px, 0.0), np.where(activo, y * g.escala_px, 0.0)
@@ -0,0 +1,42 @@
+import pytest
+
+
+class CanvasFalso:
+    """Registra las llamadas de dibujo que usan src.ui.reserva y src.ui.panel, sin Tk"""
+
+    def __init__(self):
+        self.items = {}  # id -> opciones actuales (incluye coords y state)
+        self.llamadas = []  # (método, id, argumentos) en orden
+
+    def _create(self, tipo, *coords, **opciones):
+        item = len(self.items) + 1
+        self.items[item] = dict(opciones, tipo=tipo, coords=list(coords), state=opciones.get("state", "normal"))
+        self.llamadas.append((f"create_{tipo}", item, opciones))
+        return item
+
+    def create_line(self, *coords, **opciones):
+        return self._create("line", *coords, **opciones)
+
+    def create_oval(self, *coords, **opciones):
+        return self._create("oval", *coords, **opciones)
+
+    def create_text(self, *coords, **opciones):
+        return self._create("text", *coords, **opciones)
+
+    def coords(self, item, *coords):
+        self.items[item]["coords"] = list(coords)
+        self.llamadas.append(("coords", item, coords))
+
+    def itemconfig(self, item, **opciones):
+        self.items[item].update(opciones)
+        self.llamadas.append(("itemconfig", item, opciones))
+
+    itemconfigure = itemconfig
+
+    def contar(self, metodo):
+        return sum(1 for nombre, _, _ in self.llamadas if nombre == metodo)
+
+
+@pytest.fixture
+def canvas():
+    return CanvasFalso()
@@ -0,0 +1,36 @@
+import numpy as np
+from src.functions.analizador import AnalizadorLissajous, estimar_tono
+
+
+def test_estimar_tono_dentro_de_un_bin():
+    fs, n = 48_000.0, 1024
+    t = np.arange(n) / fs
+    rng = np.random.default_rng(0)
+    for f, a, fase in zip(rng.uniform(500, 20_000, 30), rng.uniform(0.1, 5, 30), rng.uniform(-np.pi, np.pi, 30)):
+        tono = estimar_tono(a * np.sin(2 * np.pi * f * t + fase) + 0.3, fs)
+        assert abs(tono.frecuencia - f) < fs / n #Dentro de un bin (en la práctica una fracción)
+        assert abs(tono.frecuencia - f) < 0.05 * fs / n
+        assert np.isclose(tono.amplitud, a, rtol=0.01)
+        #La fase se compara en el centro de la ventana: referida a t = 0 arrastra el error de frecuencia
+        centro = (n / 2) / fs
+        error_fase = (tono.fase + 2 * np.pi * tono.frecuencia * centro) - (fase + 2 * np.pi * f * centro)
+        assert abs(np.angle(np.exp(1j * error_fase))) < 0.01
+    assert estimar_tono(np.full(n, 2.0), fs) is None #Solo DC: sin tono
+
+
+def test_analizador_razon_y_fase_relativa():
+    fs, n = 64.0, 512
+    t = np.arange(2 * n) / fs
+    x = np.sin(2 * np.pi * 2.0 * t + 0.4)
+    y = np.sin(2 * np.pi * 3.0 * t + 1.0)
+    analizador = AnalizadorLissajous(fs, n)
+    assert analizador.agregar(x[:n // 2], y[:n // 2]) is None #Ventana incompleta
+    estimacion = analizador.agregar(x[n // 2:], y[n // 2:])
+    assert (estimacion.p, estimacion.q) == (3, 2) and estimacion.razon == "3:2"
+    #φv - p φh / q módulo 2π/q, con las fases medidas al inicio de la ventana
+    inicio = t[-n]
+    fase_v, fase_h = 2 * np.pi * 3.0 * inicio + 1.0, 2 * np.pi * 2.0 * inicio + 0.4
+    esperada = (fase_v - 3 * fase_h / 2) % np.pi
+    assert abs(np.angle(np.exp(2j * (estimacion.fase_relativa - esperada)))) < 0.05
+    analizador.reiniciar()
+    assert analizador.estimacion is None
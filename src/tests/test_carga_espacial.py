@@ -0,0 +1,48 @@
+import numpy as np
+from src.functions.carga_espacial import CargaEspacial, _green_fft
+from src.utils.constantes import E_CHARGE, E_MASS, EPSILON_0, PI
+
+
+def _esfera(n, radio, rng):
+    direccion = rng.normal(size=(n, 3))
+    direccion /= np.linalg.norm(direccion, axis=1)[:, None]
+    return direccion * radio * rng.uniform(0, 1, n)[:, None] ** (1 / 3)
+
+
+def test_esfera_uniforme_campo_analitico():
+    #Dentro E ∝ r, fuera E = Q/(4πε0 r²); para electrones la fuerza es radial y repulsiva
+    rng = np.random.default_rng(0)
+    radio, n, carga_macro = 1e-3, 40_000, 1e-16
+    sondas = np.array([[1.5, 0, 0], [0, -1.5, 0], [0, 0, 1.5], [-1.1, 1.1, 0]]) * radio
+    pos = np.vstack([_esfera(n, radio, rng), sondas])
+    carga = CargaEspacial(carga_macro, forma=(48, 48, 48))
+    a = carga.aceleracion(pos)
+
+    r = np.linalg.norm(pos, axis=1)
+    radial = np.einsum("ij,ij->i", a, pos) / r
+    q_m = E_CHARGE / E_MASS
+    k = q_m * n * carga_macro / (4 * PI * EPSILON_0)
+    esperado = np.where(r < radio, k * r / radio**3, k / r**2)
+
+    capa = (r > 0.4 * radio) & (r < 0.8 * radio)
+    assert np.all(radial[capa] > 0)
+    assert abs(np.median(radial[capa] / esperado[capa]) - 1) < 0.05
+    assert np.allclose(radial[n:], esperado[n:], rtol=0.05)
+    transversal = np.linalg.norm(a[n:] - radial[n:, None] * pos[n:] / r[n:, None], axis=1)
+    assert np.all(transversal < 0.05 * esperado[n:])
+
+
+def test_malla_por_eje_y_green_reutilizada():
+    #Haz largo y delgado: el margen de cada eje sigue su propia extensión
+    rng = np.random.default_rng(1)
+    pos = rng.uniform(-1, 1, (1000, 3)) * [1e-4, 1e-4, 0.1]
+    carga = CargaEspacial(1e-16)
+    lo, h = carga._malla(pos)
+    assert h[0] < 1e-5 and h[2] > 1e-3
+    assert np.all(lo <= pos.min(axis=0)) and np.all(lo + h * 31 >= pos.max(axis=0))
+
+    #Un haz apenas más grande cae en el mismo paso cuantizado y reutiliza la función de Green
+    _green_fft.cache_clear()
+    carga.potencial(pos)
+    carga.potencial(pos * 1.01)
+    assert _green_fft.cache_info().hits == 1
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from src.functions.dds import DDSOscillator, Wavetable
+from src.functions.señales import SignalSpec
+
+
+def test_niveles_sin_armonicos_sobre_nyquist():
+    tabla = Wavetable.square()
+    for fs in (8_000.0, 48_000.0):
+        for f in (20.0, 440.0, 1_286.9, 5_000.0, 0.45 * fs):
+            nivel = tabla.nivel(f, fs)
+            limite = tabla.limites[nivel]
+            assert limite * f < fs / 2 or limite == 1
+            assert nivel == 0 or tabla.limites[nivel - 1] * f >= fs / 2 #El nivel más rico que no produce aliasing
+            espectro = np.abs(np.fft.rfft(tabla.tablas[nivel, :-1]))
+            assert espectro[limite + 1:].max() < 1e-9 * espectro.max()
+
+
+def test_dds_cuadrada_sin_aliasing():
+    #Frecuencia que no divide a fs: los armónicos reflejados caerían entre los armónicos legítimos
+    fs, n = 48_000.0, 1 << 15
+    f = fs / 37.3
+    tabla = Wavetable.square()
+
+    def fuera_de_armonicos(osc):
+        espectro = np.abs(np.fft.rfft(osc.next_chunk() * np.hanning(n)))**2
+        k = np.fft.rfftfreq(n, 1 / fs) / f
+        cerca = np.abs(k - np.round(k)) * f < 8 * fs / n
+        return espectro[~cerca].sum() / espectro.sum()
+
+    osc = DDSOscillator(SignalSpec(f, 1.0), tabla, fs, n)
+    assert fuera_de_armonicos(osc) < 1e-5
+    completa = DDSOscillator(SignalSpec(f, 1.0), tabla, fs, n)
+    completa._datos = tabla.tablas[0] #Tabla con todos los armónicos: se reflejan bajo Nyquist
+    assert fuera_de_armonicos(completa) > 1e-3
+
+
+def test_next_chunk_en_out():
+    spec, tabla = SignalSpec(1_234.5, 0.8, 0.3, 0.1), Wavetable.triangle()
+    referencia = DDSOscillator(spec, tabla, 48_000.0, 1_000)
+    osc = DDSOscillator(spec, tabla, 48_000.0, 1_000)
+    out = np.empty(1_000)
+    out32 = np.empty(1_000, dtype=np.float32)
+    for _ in range(3): #Misma fase continua escribiendo en el buffer recibido
+        esperado = referencia.next_chunk()
+        assert osc.next_chunk(out) is out
+        assert np.array_equal(out, esperado)
+    esperado = referencia.next_chunk()
+    assert osc.next_chunk(out32) is out32
+    assert np.allclose(out32, esperado, rtol=0, atol=1e-6)
+    with pytest.raises(ValueError):
+        osc.next_chunk(np.empty(999))
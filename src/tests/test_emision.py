@@ -0,0 +1,30 @@
+import numpy as np
+from src.functions.emision import ModeloEmision, estudio_punto, muestrear_emision
+from src.utils.constantes import E_CHARGE, E_MASS, K_BOLTZMANN, PI
+
+
+def test_estudio_reproducible_sin_importar_procesos():
+    #Bloques con flujos SeedSequence.spawn(): mismo resultado en serie y en paralelo
+    serie = estudio_punto(5_000, 2000.0, 10.0, -5.0, semilla=7, procesos=1, bloque=1_200)
+    paralelo = estudio_punto(5_000, 2000.0, 10.0, -5.0, semilla=7, procesos=2, bloque=1_200)
+    otra = estudio_punto(5_000, 2000.0, 10.0, -5.0, semilla=8, procesos=1, bloque=1_200)
+    assert serie.x.size == 5_000
+    assert np.array_equal(serie.x, paralelo.x) and np.array_equal(serie.y, paralelo.y)
+    assert not np.array_equal(serie.x, otra.x)
+
+
+def test_momentos_maxwell_y_rayleigh():
+    n = 400_000
+    modelo = ModeloEmision(temperatura=1100.0)
+    sigma = np.sqrt(K_BOLTZMANN * modelo.temperatura / E_MASS)
+    _, vel = muestrear_emision(n, 1.0, np.random.default_rng(0), modelo)
+    error = 4 / np.sqrt(n) #Unas 4 desviaciones estándar de la media muestral (relativa)
+
+    #Transversales: normales de media 0 y desviación σ
+    assert np.all(np.abs(vel[:, :2].mean(axis=0)) < error * sigma)
+    assert np.allclose(vel[:, :2].std(axis=0), sigma, rtol=error)
+
+    #Longitudinal al salir del cátodo (se deshace la brecha): Rayleigh, media σ√(π/2) y <v²> = 2σ²
+    vz0 = np.sqrt(vel[:, 2]**2 - 2.0 * E_CHARGE * 1.0 / E_MASS)
+    assert np.isclose(vz0.mean(), sigma * np.sqrt(PI / 2), rtol=error)
+    assert np.isclose(np.mean(vz0**2), 2 * sigma**2, rtol=2 * error)
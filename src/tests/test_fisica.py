@@ -0,0 +1,151 @@
+import math
+import numpy as np
+from scipy.integrate import trapezoid
+from src.functions.fisica import _sensibilidadCache, deflexionSinusoidal, posicionPantalla, respuestaDeflexion, sensibilidadDeflexion
+from src.functions.lissajous import _curva_cache, posicion_lissajous, razon_racional
+from src.functions.respuesta import analizar_respuesta
+from src.utils.constantes import E_CHARGE, E_MASS, TubeGeometry
+
+EPS32 = np.finfo(np.float32).eps
+
+
+def test_posicion_pantalla_float32_acotada():
+    rng = np.random.default_rng(0)
+    vv, vh = rng.uniform(-500, 500, (2, 10_000))
+    x64, y64 = posicionPantalla(vv, vh, 2000)
+    x32, y32 = posicionPantalla(vv.astype(np.float32), vh.astype(np.float32), 2000, dtype=np.float32)
+    assert x32.dtype == y32.dtype == np.float32
+    escala = max(np.abs(x64).max(), np.abs(y64).max())
+    assert max(np.abs(x32 - x64).max(), np.abs(y32 - y64).max()) <= 4 * EPS32 * escala
+
+
+def test_posicion_pantalla_por_tramos_float32():
+    va = np.linspace(500, 5000, 64)
+    x64, y64 = posicionPantalla(300.0, -200.0, va)
+    x32, y32 = posicionPantalla(300.0, -200.0, va, dtype=np.float32)
+    assert x32.dtype == np.float32
+    assert np.allclose(x32, x64, rtol=4 * EPS32, atol=0) and np.allclose(y32, y64, rtol=4 * EPS32, atol=0)
+
+
+def test_deflexion_sinusoidal_float32_en_tiempos_largos():
+    #Tiempo y fase en float64: a t ~ 1e5 s el error en px queda en la resolución de float32
+    t = 1e5 + np.arange(2048) * 1e-7
+    for eje in ("x", "y"):
+        d64 = deflexionSinusoidal(400.0, 50e3, 0.2, t, 2000, eje)
+        d32 = deflexionSinusoidal(400.0, 50e3, 0.2, t, 2000, eje, dtype=np.float32)
+        assert d32.dtype == np.float32
+        assert np.abs(d32 - d64).max() <= 2 * EPS32 * np.abs(d64).max()
+
+
+def test_lissajous_float32_acotada():
+    t = np.linspace(0, 30, 5000)
+    x64, y64 = posicion_lissajous(t, 3.0, 2.0, 0.4, 1.1, 300.0, 2400)
+    x32, y32 = posicion_lissajous(t, 3.0, 2.0, 0.4, 1.1, 300.0, 2400, dtype=np.float32)
+    assert x32.dtype == np.float32
+    assert max(np.abs(x32 - x64).max(), np.abs(y32 - y64).max()) <= 1e-4
+
+
+def test_ganancia_db_referida_a_dc():
+    #Un barrido que empieza lejos de 0 Hz no debe renormalizarse a su primera frecuencia
+    resp = analizar_respuesta(100e6, 500e6, n=64, voltaje_aceleracion=2000)
+    for eje in ("x", "y"):
+        dc = abs(respuestaDeflexion(0.0, 2000, eje))
+        ganancia = resp.ganancia_x if eje == "x" else resp.ganancia_y
+        assert np.allclose(resp.ganancia_db(eje), 20 * np.log10(ganancia / dc))
+        assert resp.ganancia_db(eje)[0] < -0.1
+
+
+def _posicion_escalar(voltaje_v, voltaje_h, voltaje_aceleracion, g):
+    #Cálculo por tramos de un solo punto, como lo hacía Display antes del kernel vectorizado
+    if voltaje_aceleracion <= 0:
+        return 0.0, 0.0
+    v0 = math.sqrt(2 * E_CHARGE * voltaje_aceleracion / E_MASS)
+    a_v = -E_CHARGE * voltaje_v / g.separacion_placas / E_MASS
+    t_v = g.longitud_placas_v / v0
+    y = 0.5 * a_v * t_v**2 + a_v * t_v * (g.distancia_entre_placas + g.distancia_placas_h_pantalla) / v0
+    a_h = E_CHARGE * voltaje_h / g.separacion_placas / E_MASS
+    t_h = g.longitud_placas_h / v0
+    x = 0.5 * a_h * t_h**2 + a_h * t_h * g.distancia_placas_h_pantalla / v0
+    return x * g.escala_px, y * g.escala_px
+
+
+def test_posicion_pantalla_vectorizada_igual_al_calculo_por_punto():
+    g = TubeGeometry()
+    rng = np.random.default_rng(3)
+    vv, vh = rng.uniform(-500, 500, (2, 50))
+    va = rng.choice([-100.0, 0.0, 800.0, 2000.0, 5000.0], 50)
+    x, y = posicionPantalla(vv, vh, va, g) #Voltaje de aceleración por punto: cálculo por tramos
+    x_fijo, y_fijo = posicionPantalla(vv, vh, 2000.0, g) #Escalar: sensibilidad en caché
+    for i in range(50):
+        assert np.allclose((x[i], y[i]), _posicion_escalar(vv[i], vh[i], va[i], g), rtol=1e-12, atol=0)
+        assert np.allclose((x_fijo[i], y_fijo[i]), _posicion_escalar(vv[i], vh[i], 2000.0, g), rtol=1e-12, atol=0)
+    x, y = posicionPantalla(vv[:, None], vh[None, :5], va[:, None], g)
+    assert x.shape == (50, 5) and y.shape == (50, 1)
+
+
+def test_sensibilidad_en_cache_por_voltaje_y_geometria():
+    _sensibilidadCache.cache_clear()
+    g = TubeGeometry()
+    s = sensibilidadDeflexion(2000, g)
+    assert sensibilidadDeflexion(2000.0) is s #Misma clave (float, geometría por defecto): sin recalcular
+    assert _sensibilidadCache.cache_info().hits == 1
+    assert sensibilidadDeflexion(2000, TubeGeometry(escala_px=400.0)).px_por_volt_x == 0.5 * s.px_por_volt_x
+    #La trayectoria es lineal en los voltajes de placa: 1 V de referencia basta para cualquier voltaje
+    assert s.posicion(-250.0, 125.0) == (125.0 * s.px_por_volt_x, -250.0 * s.px_por_volt_y)
+    assert np.allclose(s.posicion(-250.0, 125.0), _posicion_escalar(-250.0, 125.0, 2000, g), rtol=1e-12, atol=0)
+    assert s.px_por_volt_y < 0 < s.px_por_volt_x #Vertical positiva baja el punto (electrón negativo)
+
+
+def _deflexion_integrada(amplitud, frecuencia, fase, t0, voltaje_aceleracion, eje, g):
+    #Integración numérica de la aceleración durante el tránsito (regla del trapecio muy fina)
+    v0 = math.sqrt(2 * E_CHARGE * voltaje_aceleracion / E_MASS)
+    if eje == "y":
+        largo, entrada, vuelo, signo = g.longitud_placas_v, t0, g.distancia_entre_placas + g.distancia_placas_h_pantalla, -1
+    else:
+        largo, vuelo, signo = g.longitud_placas_h, g.distancia_placas_h_pantalla, 1
+        entrada = t0 + (g.longitud_placas_v + g.distancia_entre_placas) / v0
+    tau = largo / v0
+    s = np.linspace(0.0, tau, 20_001)
+    a = signo * E_CHARGE / (E_MASS * g.separacion_placas) * amplitud * np.sin(2 * np.pi * frecuencia * (entrada + s) + fase)
+    v_salida = trapezoid(a, s)
+    y_placas = trapezoid((tau - s) * a, s)
+    return (y_placas + v_salida * vuelo / v0) * g.escala_px
+
+
+def test_ganancia_por_transito_igual_a_integracion_directa():
+    g = TubeGeometry()
+    t0 = np.array([0.0, 1.3e-9, 7.7e-9])
+    for frecuencia in (1e3, 80e6, 400e6, 1.5e9):
+        for eje in ("x", "y"):
+            analitica = deflexionSinusoidal(300.0, frecuencia, 0.4, t0, 2000.0, eje, g)
+            numerica = [_deflexion_integrada(300.0, frecuencia, 0.4, t, 2000.0, eje, g) for t in t0]
+            assert np.allclose(analitica, numerica, rtol=1e-6, atol=1e-6 * abs(respuestaDeflexion(0.0, 2000.0, eje, g)) * 300)
+
+
+def test_ganancia_por_transito_tiende_a_la_estatica():
+    #A baja frecuencia |H| es la sensibilidad de posicionPantalla; cuando ωτ = 2π se anula el impulso de velocidad
+    g = TubeGeometry()
+    x_dc, y_dc = posicionPantalla(1.0, 1.0, 2000.0, g)
+    assert np.isclose(respuestaDeflexion(0.0, 2000.0, "x", g).real, x_dc, rtol=1e-12)
+    assert np.isclose(respuestaDeflexion(0.0, 2000.0, "y", g).real, y_dc, rtol=1e-12)
+    v0 = math.sqrt(2 * E_CHARGE * 2000.0 / E_MASS)
+    f_nulo = v0 / g.longitud_placas_v
+    assert abs(respuestaDeflexion(f_nulo, 2000.0, "y", g)) < 0.05 * abs(y_dc)
+
+
+def test_lissajous_razon_racional_y_periodo():
+    assert razon_racional(300.0, 200.0) == (3, 2, 100.0)
+    assert razon_racional(np.sqrt(2) * 100.0, 100.0) is None
+    _curva_cache.cache_clear()
+    t = np.linspace(0.0, 0.01, 500)
+    x, y = posicion_lissajous(t, 300.0, 200.0, 0.7, 0.2, 200.0, 2000.0)
+    x_sig, y_sig = posicion_lissajous(t + 1 / 100.0, 300.0, 200.0, 0.7, 0.2, 200.0, 2000.0) #Periodo 1/f0
+    assert np.allclose(x, x_sig, atol=1e-9) and np.allclose(y, y_sig, atol=1e-9)
+    #La curva cacheada interpola el cálculo directo (256 muestras por ciclo de la señal más rápida)
+    x_dir = deflexionSinusoidal(200.0, 200.0, 0.2, t, 2000.0, "x")
+    y_dir = deflexionSinusoidal(200.0, 300.0, 0.7, t, 2000.0, "y")
+    escala = np.abs(y_dir).max()
+    assert max(np.abs(x - x_dir).max(), np.abs(y - y_dir).max()) < 2e-4 * escala
+    #Otro par de fases con la misma fase canónica φv - p φh / q reutiliza la curva
+    posicion_lissajous(t, 300.0, 200.0, 0.7 + 3 * 0.5 / 2, 0.2 + 0.5, 200.0, 2000.0)
+    assert _curva_cache.cache_info().misses == 1 and _curva_cache.cache_info().hits >= 2
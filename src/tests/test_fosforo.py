@@ -0,0 +1,62 @@
+import math
+import numpy as np
+import pytest
+from src.utils.fosforo import HALO_FOSFORO, NIVELES_FOSFORO, UMBRAL_FOSFORO, PantallaFosforo, paleta_fosforo
+
+
+def test_decaer_factor_y_umbral():
+    pantalla = PantallaFosforo(4, 3, dtype=np.float64)
+    pantalla.imagen[:] = 1.0
+    pantalla.imagen[0, 0] = 1.2 * UMBRAL_FOSFORO
+    factor = pantalla.decaer(0.1, 0.5)
+    assert factor == pytest.approx(math.exp(-0.1 / 0.35))
+    assert pantalla.imagen[1, 1] == pytest.approx(factor)
+    assert pantalla.imagen[0, 0] == 0.0 #Bajo el umbral tras decaer: se apaga
+    #Dos pasos de dt equivalen a uno de 2 dt, y más persistencia decae más lento
+    a, b = PantallaFosforo(2, 2), PantallaFosforo(2, 2)
+    assert a.decaer(0.05, 0.5) * a.decaer(0.05, 0.5) == pytest.approx(b.decaer(0.1, 0.5))
+    assert a.decaer(0.1, 2.0) > b.decaer(0.1, 0.5)
+    assert a.decaer(0.0, 0.5) == 1.0
+
+
+def test_depositar_bilineal_y_acumulado():
+    pantalla = PantallaFosforo(10, 10, dtype=np.float64)
+    pantalla.depositar([2.25], [3.5], 2.0)
+    assert pantalla.imagen.sum() == pytest.approx(2.0) #Los pesos suman la intensidad
+    assert pantalla.imagen[3, 2] == pytest.approx(2.0 * 0.75 * 0.5)
+    assert pantalla.imagen[3, 3] == pytest.approx(2.0 * 0.25 * 0.5)
+    assert pantalla.imagen[4, 2] == pytest.approx(2.0 * 0.75 * 0.5)
+    assert pantalla.imagen[4, 3] == pytest.approx(2.0 * 0.25 * 0.5)
+    pantalla.limpiar()
+    pantalla.depositar([5.0, 5.0, 5.0], [6.0, 6.0, 6.0], [1.0, 2.0, 0.5]) #Impactos repetidos se suman
+    assert pantalla.imagen[6, 5] == pytest.approx(3.5)
+    assert pantalla.imagen.sum() == pytest.approx(3.5)
+    pantalla.depositar([-0.5, 10.0, 3.0], [3.0, 3.0, 10.5], 1.0) #Fuera de la pantalla: se descartan
+    assert pantalla.imagen.sum() == pytest.approx(3.5)
+
+
+def test_depositar_en_el_borde():
+    pantalla = PantallaFosforo(10, 10, dtype=np.float64)
+    pantalla.depositar([9.0, 9.5, 0.0], [5, 5, 9], 1.0)
+    assert pantalla.imagen.sum() == pytest.approx(3.0)
+    assert pantalla.imagen[5, 9] == pytest.approx(2.0) #Última columna: el vecino +1 cae en el mismo píxel
+    assert pantalla.imagen[9, 0] == pytest.approx(1.0)
+    pantalla.limpiar()
+    pantalla.depositar([9.5], [9.5], 1.0) #Esquina inferior derecha
+    assert pantalla.imagen[9, 9] == pytest.approx(1.0)
+
+
+def test_ppm_encabezado_y_colores():
+    pantalla = PantallaFosforo(7, 5)
+    datos = pantalla.ppm()
+    encabezado = b"P6 7 5 255\n"
+    assert datos.startswith(encabezado)
+    assert len(datos) == len(encabezado) + 7 * 5 * 3
+    rgb = np.frombuffer(datos[len(encabezado):], np.uint8).reshape(5, 7, 3)
+    assert np.array_equal(rgb, np.broadcast_to(paleta_fosforo()[0], rgb.shape)) #Apagada: todo el fondo
+    pantalla.imagen[2, 3] = 1.0
+    rgb = np.frombuffer(pantalla.ppm()[len(encabezado):], np.uint8).reshape(5, 7, 3)
+    assert np.array_equal(rgb[2, 3], paleta_fosforo()[-1])
+    #Halo: los 8 vecinos reciben HALO/9 de la intensidad; el resto queda en el fondo
+    assert np.array_equal(rgb[1, 2], paleta_fosforo()[int(HALO_FOSFORO / 9 * (NIVELES_FOSFORO - 1))])
+    assert np.array_equal(rgb[0, 0], paleta_fosforo()[0])
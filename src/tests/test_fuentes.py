@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+from scipy.io import wavfile
+from src.functions import fuentes
+from src.functions.fuentes import FuenteCSV, FuenteMapeada, abrir_fuente, abrir_npy, abrir_wav
+
+
+def _escribir_csv(ruta, filas, encabezado=None):
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        if encabezado is not None:
+            archivo.write(encabezado + "\n")
+        for fila in filas:
+            archivo.write(",".join(f"{v:.6f}" for v in np.atleast_1d(fila)) + "\n")
+
+
+@pytest.mark.parametrize("dtype, valores, esperado", [
+    (np.uint8, [0, 128, 255], [-1.0, 0.0, 127 / 128]),
+    (np.int16, [-32_768, 0, 16_384], [-1.0, 0.0, 0.5]),
+])
+def test_wav_entero_a_escala(tmp_path, dtype, valores, esperado):
+    ruta = tmp_path / "mono.wav"
+    wavfile.write(ruta, 8_000, np.array(valores, dtype=dtype))
+    fuente = abrir_wav(str(ruta), escala=200.0)
+    h, v = fuente.leer(3)
+    assert fuente.fs == 8_000
+    assert np.allclose(h, 0.0) #Mono: solo la vertical
+    assert np.allclose(v, 200.0 * np.array(esperado))
+
+
+def test_wav_estereo_izquierdo_x_derecho_y(tmp_path):
+    ruta = tmp_path / "estereo.wav"
+    datos = np.array([[16_384, -16_384], [-32_768, 8_192]], dtype=np.int16)
+    wavfile.write(ruta, 44_100, datos)
+    h, v = abrir_fuente(str(ruta), escala=100.0).leer(2)
+    assert np.allclose(h, [50.0, -100.0])
+    assert np.allclose(v, [-50.0, 25.0])
+
+
+def test_una_columna_maneja_solo_la_vertical():
+    h, v = FuenteMapeada(np.arange(4.0).reshape(4, 1), 1_000.0, escala=1.0).leer(4)
+    assert np.array_equal(h, np.zeros(4))
+    assert np.array_equal(v, np.arange(4.0))
+
+
+def test_vuelta_y_agotamiento(tmp_path):
+    ruta = tmp_path / "traza.npy"
+    np.save(ruta, np.column_stack([np.arange(5.0), -np.arange(5.0)]))
+    _, v = abrir_npy(str(ruta), fs=1_000.0).leer(7)
+    assert np.array_equal(v, -np.array([0, 1, 2, 3, 4, 0, 1.0])) #repetir: vuelve al inicio
+    fuente = abrir_npy(str(ruta), fs=1_000.0, repetir=False)
+    h, _ = fuente.leer(7)
+    assert np.array_equal(h, np.arange(5.0)) #Sin repetir: entrega lo que queda
+    assert fuente.leer(3)[0].size == 0
+    assert sum(x.size for x, _ in abrir_npy(str(ruta), repetir=False).bloques(2)) == 5
+
+
+def test_saltar_mapeada_y_csv(tmp_path):
+    traza = np.column_stack([np.arange(10.0), np.arange(10.0) + 100])
+    fuente = FuenteMapeada(traza, 1_000.0, escala=1.0)
+    fuente.saltar(13)
+    assert fuente.leer(2)[0].tolist() == [3.0, 4.0] #13 mod 10
+    ruta = tmp_path / "traza.csv"
+    _escribir_csv(ruta, traza)
+    with FuenteCSV(str(ruta), 1_000.0) as csv:
+        csv.saltar(13)
+        assert csv.leer(2)[1].tolist() == [103.0, 104.0]
+        csv.saltar(4)
+        assert csv.leer(1)[0].tolist() == [9.0]
+
+
+def test_csv_entre_bloques(tmp_path, monkeypatch):
+    monkeypatch.setattr(fuentes, "FILAS_BLOQUE_CSV", 7) #Muchos cruces de bloque con pocas filas
+    traza = np.column_stack([np.arange(30.0), np.arange(30.0) * 2])
+    ruta = tmp_path / "traza.csv"
+    _escribir_csv(ruta, traza)
+    with FuenteCSV(str(ruta), 1_000.0, escala=2.0, repetir=False) as csv:
+        partes = [csv.leer(n) for n in (5, 11, 3, 20)]
+    h = np.concatenate([p[0] for p in partes])
+    v = np.concatenate([p[1] for p in partes])
+    assert np.allclose(h, 2.0 * traza[:, 0])
+    assert np.allclose(v, 2.0 * traza[:, 1])
+    with FuenteCSV(str(ruta), 1_000.0) as csv:
+        _, v = csv.leer(45)
+    assert np.allclose(v, np.concatenate([traza[:, 1], traza[:15, 1]]))
+
+
+def test_csv_una_columna_y_encabezado(tmp_path):
+    ruta = tmp_path / "mono.csv"
+    _escribir_csv(ruta, np.arange(4.0), encabezado="voltaje")
+    with abrir_fuente(str(ruta), fs=500.0) as csv:
+        assert csv.columnas == (0,) and csv.encabezado == 1
+        h, v = csv.leer(4)
+    assert np.array_equal(h, np.zeros(4))
+    assert np.array_equal(v, np.arange(4.0))
+    ruta = tmp_path / "xy.csv"
+    _escribir_csv(ruta, np.column_stack([np.arange(3.0), np.ones(3), np.zeros(3)]), encabezado="x,y,z")
+    with abrir_fuente(str(ruta), fs=500.0) as csv:
+        assert csv.columnas == (0, 1)
+        assert csv.leer(3)[1].tolist() == [1.0, 1.0, 1.0]
+
+
+def test_csv_invalido_falla_al_abrir(tmp_path):
+    vacio = tmp_path / "vacio.csv"
+    vacio.write_text("")
+    with pytest.raises(ValueError):
+        FuenteCSV(str(vacio), 1_000.0)
+    solo_encabezado = tmp_path / "encabezado.csv"
+    solo_encabezado.write_text("x,y\n")
+    with pytest.raises(ValueError):
+        FuenteCSV(str(solo_encabezado), 1_000.0)
+    ruta = tmp_path / "mono.csv"
+    _escribir_csv(ruta, np.arange(3.0))
+    with pytest.raises(ValueError):
+        FuenteCSV(str(ruta), 1_000.0, columnas=(0, 1)) #Pide una columna que no existe
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from src.utils.historial import HistorialPuntos
+
+
+def test_anillo_da_la_vuelta_y_conserva_el_orden():
+    h = HistorialPuntos(5, np.float32)
+    h.agregar(np.arange(3.0), np.arange(3.0), np.arange(3.0), 1.0)
+    h.agregar(np.arange(3.0, 7.0), np.arange(3.0, 7.0), np.arange(3.0, 7.0), 0.5) #Sobrescribe los 2 más antiguos
+    x, y, t, intensidad = h.columnas()
+    assert len(h) == 5
+    assert x.tolist() == [2, 3, 4, 5, 6] and t.tolist() == [2, 3, 4, 5, 6]
+    assert intensidad.tolist() == [1.0, 0.5, 0.5, 0.5, 0.5]
+    assert x.dtype == np.float32 and t.dtype == np.float64
+
+    h.agregar(np.arange(10.0, 22.0), 0.0, np.arange(10.0, 22.0), 1.0) #Más que la capacidad: solo los últimos
+    assert h.columnas()[0].tolist() == [17, 18, 19, 20, 21]
+
+
+def test_conservar_y_descartar_tras_la_vuelta():
+    h = HistorialPuntos(4, np.float64)
+    for k in range(7): #De a uno, como el modo manual
+        h.agregar(float(k), -float(k), float(k), 1.0)
+    h.conservar(np.array([True, False, True, True]), np.array([0.9, 0.8, 0.7]))
+    x, y, t, intensidad = h.columnas()
+    assert x.tolist() == [3, 5, 6] and y.tolist() == [-3, -5, -6] and intensidad.tolist() == [0.9, 0.8, 0.7]
+    h.descartar_viejos(tiempo_actual=6.5, persistencia=1.0)
+    assert h.columnas()[2].tolist() == [6]
+    h.agregar(7.0, 0.0, 7.0, 1.0)
+    assert h.columnas()[0].tolist() == [6, 7]
+    h.limpiar()
+    assert len(h) == 0 and h.columnas()[0].size == 0
+    with pytest.raises(ValueError):
+        HistorialPuntos(0)
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+from src.utils.paleta import ESQUEMAS_FOSFORO, INTENSIDAD_MAX_PALETA, NIVELES_PALETA, paleta, rgb_esquema
+
+
+@pytest.mark.parametrize("nombre", sorted(ESQUEMAS_FOSFORO))
+def test_paleta_ida_y_vuelta(nombre):
+    p = paleta(nombre)
+    assert paleta(nombre) is p #Se calcula una vez por esquema
+    intensidades = np.arange(NIVELES_PALETA) * INTENSIDAD_MAX_PALETA / (NIVELES_PALETA - 1)
+    #Nivel -> intensidad -> nivel es la identidad, y la versión escalar coincide con la vectorizada
+    assert np.array_equal(p.niveles(intensidades), np.arange(NIVELES_PALETA))
+    assert [p.nivel(i) for i in intensidades] == list(range(NIVELES_PALETA))
+    #El color Tk de cada nivel es el del esquema en esa intensidad
+    rgb = np.array([[int(c[i:i + 2], 16) for i in (1, 3, 5)] for c in p.relleno])
+    assert np.array_equal(rgb, rgb_esquema(ESQUEMAS_FOSFORO[nombre], intensidades))
+    assert np.array_equal(rgb, p.rgb)
+
+
+def test_paleta_cuantizacion_y_saturacion():
+    p = paleta("lissajous")
+    esquema = ESQUEMAS_FOSFORO["lissajous"]
+    i = np.random.default_rng(0).uniform(0, INTENSIDAD_MAX_PALETA, 1000)
+    paso = INTENSIDAD_MAX_PALETA / (NIVELES_PALETA - 1)
+    error = np.abs(p.rgb[p.niveles(i)].astype(int) - rgb_esquema(esquema, i))
+    assert np.all(error <= np.ceil(np.asarray(esquema.ganancia) * paso / 2) + 1) #Medio nivel de cuantización
+    assert p.nivel(-1.0) == 0 and p.nivel(10.0) == NIVELES_PALETA - 1
+    with pytest.raises(ValueError):
+        paleta("inexistente")
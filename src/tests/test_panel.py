@@ -0,0 +1,47 @@
+from src.ui.panel import PanelTexto
+
+
+def _contador(texto):
+    llamadas = []
+    def formato():
+        llamadas.append(texto)
+        return texto
+    return formato, llamadas
+
+
+def test_actualizar_solo_si_cambia(canvas):
+    panel = PanelTexto(canvas)
+    panel.campo("modo", 10, 20, fill="#fff")
+    assert canvas.items[1]["text"] == "" and canvas.items[1]["tags"] == "info"
+    assert panel.actualizar("modo", "XY")
+    assert not panel.actualizar("modo", "XY")
+    assert not panel.actualizar("modo", "XY", fill="#fff")
+    assert panel.actualizar("modo", "XY", fill="#f00")
+    assert [opciones for nombre, _, opciones in canvas.llamadas if nombre == "itemconfig"] == [{"text": "XY"}, {"fill": "#f00"}]
+
+
+def test_por_clave_sin_reformatear(canvas):
+    panel = PanelTexto(canvas)
+    panel.campo("frecuencia", 0, 0)
+    formato, llamadas = _contador("1.00 kHz")
+    assert panel.actualizar_por_clave("frecuencia", (1_000.0, 1.0), formato)
+    assert not panel.actualizar_por_clave("frecuencia", (1_000.0, 1.0), formato)
+    assert len(llamadas) == 1 and canvas.contar("itemconfig") == 1
+    #Clave nueva con el mismo texto: se formatea pero no se reenvía
+    assert not panel.actualizar_por_clave("frecuencia", (1_000.0, 2.0), formato)
+    assert len(llamadas) == 2 and canvas.contar("itemconfig") == 1
+    panel.forzar()
+    panel.actualizar_por_clave("frecuencia", (1_000.0, 2.0), formato)
+    assert len(llamadas) == 3
+
+
+def test_actualizar_cada_limita_el_refresco(canvas):
+    panel = PanelTexto(canvas, intervalo=0.25)
+    panel.campo("tiempo", 0, 0)
+    textos = iter(f"t={i}" for i in range(100))
+    for t in (0.0, 0.1, 0.2, 0.26, 0.3, 0.51):
+        panel.actualizar_cada("tiempo", t, lambda: next(textos))
+    assert [opciones["text"] for nombre, _, opciones in canvas.llamadas if nombre == "itemconfig"] == ["t=0", "t=1", "t=2"]
+    assert panel.actualizar_cada("tiempo", 0.1, lambda: next(textos)) #Tiempo hacia atrás (reinicio): refresca
+    panel.forzar()
+    assert panel.actualizar_cada("tiempo", 0.15, lambda: next(textos))
@@ -0,0 +1,39 @@
+import numpy as np
+from src.functions import placas
+from src.functions.placas import GeometriaPlacas, mapa_placas, resolver_laplace
+
+GEOMETRIA = GeometriaPlacas(0.02, 0.01, celdas_separacion=10)
+
+
+def test_campo_en_el_centro_es_v_sobre_d():
+    mapa = resolver_laplace(GEOMETRIA)
+    ez, eu = mapa.muestrear(np.array([0.01]), np.array([0.0]))
+    assert np.isclose(eu[0], 1 / 0.01, rtol=0.02)
+    assert abs(ez[0]) < 1e-3 * eu[0]
+
+
+def test_campo_de_borde_decae_fuera_de_las_placas():
+    mapa = resolver_laplace(GEOMETRIA)
+    z = 0.02 + np.linspace(0.0, 0.018, 10) #Desde el borde de salida hacia la caja a tierra
+    _, eu = mapa.muestrear(z, np.zeros_like(z))
+    centro = mapa.muestrear(np.array([0.01]), np.array([0.0]))[1][0]
+    assert eu[0] < 0.9 * centro #Ya en el borde el campo es menor que entre las placas
+    assert np.all(np.diff(eu) < 0)
+    assert eu[-1] < 0.02 * centro
+
+
+def test_mapa_se_carga_del_cache_en_disco(tmp_path, monkeypatch):
+    monkeypatch.setenv("CRT_CACHE_DIR", str(tmp_path))
+    placas._mapa_cache.cache_clear()
+    mapa = mapa_placas(GEOMETRIA)
+    assert (tmp_path / f"placas-{GEOMETRIA.clave()}.npz").exists()
+
+    #Nuevo proceso (caché en memoria vacío): la misma clave no debe volver a resolver
+    placas._mapa_cache.cache_clear()
+    def no_resolver(*args, **kwargs):
+        raise AssertionError("resolvió de nuevo en lugar de leer el .npz")
+    monkeypatch.setattr(placas, "resolver_laplace", no_resolver)
+    cargado = mapa_placas(GEOMETRIA)
+    assert np.array_equal(cargado.eu, mapa.eu) and np.array_equal(cargado.ez, mapa.ez)
+    assert cargado.h == mapa.h
+    placas._mapa_cache.cache_clear()
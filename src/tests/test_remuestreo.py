@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+from src.functions.remuestreo import RemuestreadorPolifasico, remuestrear
+
+
+@pytest.mark.parametrize("fs_entrada, fs_salida", [(48_000, 2_000), (44_100, 48_000), (8_000, 20_000), (1_000, 1_000)])
+def test_largo_de_salida_y_bloques(fs_entrada, fs_salida):
+    x = np.random.default_rng(0).standard_normal(10_007)
+    r = RemuestreadorPolifasico(fs_entrada, fs_salida)
+    completo = r.procesar(x)
+    assert completo.size == (x.size * r.L - 1) // r.M + 1 #Salidas m con m M <= N L - 1
+    por_bloques, _ = remuestrear(x, fs_entrada, fs_salida, bloque=333)
+    assert np.allclose(por_bloques, completo, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("fs_entrada, fs_salida", [(48_000, 2_000), (44_100, 48_000), (8_000, 20_000)])
+def test_ganancia_en_banda_pasante_y_retardo(fs_entrada, fs_salida):
+    r = RemuestreadorPolifasico(fs_entrada, fs_salida)
+    f = 0.1 * min(fs_entrada, fs_salida)
+    n = 20_000
+    y = r.procesar(np.sin(2 * np.pi * f * np.arange(n) / fs_entrada))
+    t = r.tiempos(y.size)
+    estable = (t > 2 * r.retardo) & (t < (n - r.taps) / fs_entrada)
+    #Ganancia unitaria y tiempos con el retardo de grupo compensado: la salida cae sobre la senoidal original
+    assert np.abs(y[estable] - np.sin(2 * np.pi * f * t[estable])).max() < 2e-3
+
+
+def test_rechazo_sobre_nyquist_de_salida():
+    r = RemuestreadorPolifasico(48_000, 2_000)
+    x = np.sin(2 * np.pi * 5_000.0 * np.arange(48_000) / 48_000) #Se reflejaría en 1 kHz sin filtro
+    y = r.procesar(x)
+    assert np.abs(y[r.taps:]).max() < 1e-3
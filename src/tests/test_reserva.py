@@ -0,0 +1,52 @@
+from src.ui.reserva import ReservaCanvas
+
+
+def _cuadro(reserva, n, fill="#fff"):
+    reserva.iniciar()
+    ids = [reserva.dibujar((i, i, i + 1, i + 1), fill=fill) for i in range(n)]
+    reserva.terminar()
+    return ids
+
+
+def test_crece_y_reutiliza(canvas):
+    reserva = ReservaCanvas(canvas, "line", "trazo", width=2)
+    primeros = _cuadro(reserva, 3)
+    assert canvas.contar("create_line") == 3
+    assert all(canvas.items[i]["width"] == 2 and canvas.items[i]["tags"] == "trazo" for i in primeros)
+    segundos = _cuadro(reserva, 5)
+    assert segundos[:3] == primeros #Mismos ids en el mismo orden
+    assert canvas.contar("create_line") == 5 #Solo se crean los que faltaban
+    assert canvas.items[segundos[2]]["coords"] == [2, 2, 3, 3]
+    _cuadro(reserva, 5)
+    assert canvas.contar("create_line") == 5 and len(reserva.items) == 5
+
+
+def test_sobrantes_se_ocultan_y_vuelven(canvas):
+    reserva = ReservaCanvas(canvas, "oval", "puntos")
+    ids = _cuadro(reserva, 4)
+    _cuadro(reserva, 2)
+    assert [canvas.items[i]["state"] for i in ids] == ["normal", "normal", "hidden", "hidden"]
+    canvas.llamadas.clear()
+    _cuadro(reserva, 2)
+    assert canvas.contar("itemconfig") == 0 #Ya ocultos: no se vuelven a ocultar
+    _cuadro(reserva, 3)
+    assert [canvas.items[i]["state"] for i in ids] == ["normal", "normal", "normal", "hidden"]
+    assert canvas.contar("create_oval") == 0
+    reserva.ocultar()
+    assert all(canvas.items[i]["state"] == "hidden" for i in ids)
+
+
+def test_solo_reenvia_opciones_que_cambian(canvas):
+    reserva = ReservaCanvas(canvas, "line", "trazo")
+    ids = _cuadro(reserva, 3)
+    canvas.llamadas.clear()
+    _cuadro(reserva, 3)
+    assert canvas.contar("coords") == 3 #Las coordenadas se envían siempre
+    assert canvas.contar("itemconfig") == 0
+    reserva.iniciar()
+    reserva.dibujar((0, 0, 1, 1), fill="#fff")
+    reserva.dibujar((1, 1, 2, 2), fill="#0f0", width=3)
+    reserva.dibujar((2, 2, 3, 3), fill="#fff")
+    reserva.terminar()
+    configs = [(item, opciones) for nombre, item, opciones in canvas.llamadas if nombre == "itemconfig"]
+    assert configs == [(ids[1], {"fill": "#0f0", "width": 3})]
@@ -0,0 +1,165 @@
+import tracemalloc
+import numpy as np
+import pytest
+from src.functions.señales import IFFT_MIN_SPECS, SignalGenerator, SignalSpec, SignalWorkspace
+from src.utils.constantes import SignalDefaults
+
+F32 = SignalDefaults(precision="float32")
+EPS32 = np.finfo(np.float32).eps
+
+
+def test_precision_invalida():
+    with pytest.raises(ValueError):
+        SignalDefaults(precision="float16")
+
+
+def test_sine_float32_acotado():
+    t64, x64 = SignalGenerator().sine(1_000.0, 2.5, 0.3, 0.5, fs=96_000, duration=0.5)
+    t32, x32 = SignalGenerator(F32).sine(1_000.0, 2.5, 0.3, 0.5, fs=96_000, duration=0.5)
+    assert x32.dtype == np.float32
+    assert t32.dtype == np.float64 #El tiempo no pierde precisión
+    assert np.abs(x32 - x64).max() <= 4 * EPS32 * 3.0
+
+
+def test_sine_float32_sin_deriva_en_corridas_largas():
+    #A t ~ 1e4 s la fase es ~6e7 rad: en float32 sería inutilizable, en float64 el error sigue acotado
+    defaults = SignalDefaults(precision="float32")
+    gen32, gen64 = SignalGenerator(defaults), SignalGenerator()
+    t = 1e4 + np.arange(4096) / 96_000
+    x32 = gen32._sine_from_t(t, 1_000.0, 1.0, 0.0, 0.0, 96_000)
+    x64 = gen64._sine_from_t(t, 1_000.0, 1.0, 0.0, 0.0, 96_000)
+    assert np.abs(x32 - x64).max() <= 4 * EPS32
+
+
+def test_composite_float32_acotado():
+    specs = [SignalSpec(100.0 * k, 1.0 / k, 0.1 * k, 0.05) for k in range(1, 40)]
+    for metodo in ("loop", "broadcast", "ifft"):
+        _, x64 = SignalGenerator().composite(specs, fs=10_000, duration=0.2, method=metodo)
+        _, x32 = SignalGenerator(F32).composite(specs, fs=10_000, duration=0.2, method=metodo)
+        assert x32.dtype == np.float32
+        assert np.abs(x32 - x64).max() <= 64 * EPS32 * np.abs(x64).max()
+
+
+def test_workspace_float32():
+    ws = SignalWorkspace(dtype=np.float32)
+    gen = SignalGenerator(F32)
+    spec_x, spec_y = SignalSpec(3.0, 1.0), SignalSpec(2.0, 1.0, np.pi / 2)
+    t, x, y = gen.lissajous(spec_x, spec_y, fs=1_000, duration=1.0, workspace=ws)
+    _, x64, y64 = SignalGenerator().lissajous(spec_x, spec_y, fs=1_000, duration=1.0)
+    assert t.dtype == np.float64 and x.dtype == y.dtype == np.float32
+    assert np.shares_memory(x, ws._senal)
+    assert max(np.abs(x - x64).max(), np.abs(y - y64).max()) <= 4 * EPS32
+
+
+def test_iter_chunks_float32_fase_continua():
+    spec = SignalSpec(1_234.5, 1.0, 0.7)
+    bloques = SignalGenerator(F32).iter_chunks(spec, fs=48_000, chunk_size=1000)
+    x32 = np.concatenate([next(bloques) for _ in range(200)])
+    _, x64 = SignalGenerator().sine(1_234.5, 1.0, 0.7, fs=48_000, duration=200_000 / 48_000)
+    assert x32.dtype == np.float32
+    assert np.abs(x32 - x64).max() <= 1e-6
+
+
+def test_recurrencia_respeta_t0_y_out():
+    #El backend de recurrencia debe arrancar en t[0] y escribir en el buffer recibido
+    gen_r, gen_n = SignalGenerator(backend="recurrence"), SignalGenerator()
+    for t0 in (0.0, 0.37, 1e3):
+        t = t0 + np.arange(5000) / 48_000
+        out = np.empty(t.size)
+        x = gen_r._sine_from_t(t, 1_234.5, 0.8, 0.3, 0.1, 48_000, out)
+        assert x is out
+        assert np.abs(x - gen_n._sine_from_t(t, 1_234.5, 0.8, 0.3, 0.1, 48_000)).max() <= 1e-8 #Fase ~8e6 rad a t0 = 1e3 s
+
+
+def test_out_con_dtype_distinto_se_rechaza():
+    with pytest.raises(ValueError):
+        SignalGenerator(F32).sine(10.0, 1.0, fs=1_000, duration=0.1, out=np.empty(100))
+
+
+@pytest.mark.parametrize("precision", ["float64", "float32"])
+def test_workspace_sin_reservas_en_regimen(precision):
+    #Tras el calentamiento un cuadro no debe reservar nada del tamaño de la señal (2400 muestras ~ 10-20 KB)
+    gen = SignalGenerator(SignalDefaults(precision=precision))
+    ws = SignalWorkspace(seed=0, dtype=precision)
+    specs = [SignalSpec(50.0 * k, 1.0 / k, 0.1 * k) for k in range(1, 4)]
+
+    def cuadro():
+        gen.composite(specs, fs=48_000, duration=0.05, noise_std=0.1, method="loop", workspace=ws)
+        gen.lissajous(specs[0], specs[1], fs=48_000, duration=0.05, workspace=ws)
+
+    cuadro()
+    tracemalloc.start()
+    try:
+        for _ in range(100):
+            cuadro()
+        actual, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert actual < 4096 and pico < 4096
+
+
+@pytest.mark.parametrize("backend", ["numpy", "recurrence"])
+def test_iter_chunks_igual_a_la_senal_completa(backend):
+    #Sin saltos de fase entre bloques, incluso con una compuesta y bloques que no dividen el periodo
+    specs = [SignalSpec(1_000.0, 1.0, 0.2), SignalSpec(3_330.0, 0.25, 1.1, 0.5)]
+    gen = SignalGenerator(backend=backend)
+    bloques = gen.iter_chunks(specs, fs=48_000, chunk_size=777)
+    x = np.concatenate([next(bloques) for _ in range(100)])
+    _, referencia = SignalGenerator().composite(specs, fs=48_000, duration=77_700 / 48_000, method="loop")
+    assert np.abs(x - referencia).max() <= 1e-9
+
+    pares = gen.iter_lissajous_chunks(specs[0], specs[1], fs=48_000, chunk_size=777)
+    bx, by = zip(*(next(pares) for _ in range(3)))
+    _, rx, ry = SignalGenerator().lissajous(specs[0], specs[1], fs=48_000, duration=3 * 777 / 48_000)
+    assert np.abs(np.concatenate(bx) - rx).max() <= 1e-9 and np.abs(np.concatenate(by) - ry).max() <= 1e-9
+
+
+def _specs_aleatorias(semilla, k, armonicas=False, duracion=1.0):
+    rng = np.random.default_rng(semilla)
+    if armonicas: #Ciclos enteros en la ventana: caen en bins de la rfft
+        frecuencias = rng.choice(np.arange(1, 2_000), size=k, replace=False) / duracion
+    else:
+        frecuencias = rng.uniform(1.0, 4_000.0, size=k)
+    return [SignalSpec(float(f), float(a), float(p), float(o)) for f, a, p, o in
+            zip(frecuencias, rng.uniform(0.1, 2.0, k), rng.uniform(-np.pi, np.pi, k), rng.uniform(-0.5, 0.5, k))]
+
+
+@pytest.mark.parametrize("semilla, k", [(0, 3), (1, 20), (2, 64)])
+def test_broadcast_igual_al_bucle(semilla, k):
+    specs = _specs_aleatorias(semilla, k)
+    _, referencia = SignalGenerator().composite(specs, fs=10_000, duration=0.73, method="loop")
+    _, x = SignalGenerator().composite(specs, fs=10_000, duration=0.73, method="broadcast")
+    assert np.abs(x - referencia).max() <= 1e-12 * sum(abs(s.amplitude) + abs(s.offset) for s in specs)
+
+
+@pytest.mark.parametrize("semilla, k", [(3, 2), (4, 16), (5, 50)])
+def test_ifft_igual_al_bucle(semilla, k):
+    specs = _specs_aleatorias(semilla, k, armonicas=True)
+    _, referencia = SignalGenerator().composite(specs, fs=8_000, duration=1.0, method="loop")
+    _, x = SignalGenerator().composite(specs, fs=8_000, duration=1.0, method="ifft")
+    assert np.abs(x - referencia).max() <= 1e-12 * sum(abs(s.amplitude) + abs(s.offset) for s in specs)
+
+
+def test_ifft_fuera_de_la_rejilla():
+    specs = [SignalSpec(100.0, 1.0), SignalSpec(100.5, 1.0)] #Medio ciclo de más en 1 s
+    with pytest.raises(ValueError):
+        SignalGenerator().composite(specs, fs=8_000, duration=1.0, method="ifft")
+
+
+def test_auto_elige_cada_metodo(monkeypatch):
+    usados = []
+    for nombre in ("_composite_broadcast", "_composite_ifft"):
+        original = getattr(SignalGenerator, nombre)
+        def espia(*args, _original=original, _nombre=nombre):
+            usados.append(_nombre)
+            return _original(*args)
+        monkeypatch.setattr(SignalGenerator, nombre, staticmethod(espia))
+    gen = SignalGenerator()
+    gen.composite(_specs_aleatorias(6, 3), fs=8_000, duration=0.1) #Pocas muestras x componentes
+    assert usados == []
+    gen.composite(_specs_aleatorias(7, IFFT_MIN_SPECS, armonicas=True), fs=8_000, duration=1.0)
+    assert usados == ["_composite_ifft"]
+    gen.composite(_specs_aleatorias(8, IFFT_MIN_SPECS), fs=8_000, duration=1.0) #Fuera de la rejilla
+    assert usados == ["_composite_ifft", "_composite_broadcast"]
+    gen.composite(_specs_aleatorias(9, 4, armonicas=True), fs=48_000, duration=1.0) #Armónicas pero pocas
+    assert usados == ["_composite_ifft", "_composite_broadcast", "_composite_broadcast"]
@@ -0,0 +1,85 @@
+import numpy as np
+from src.functions.fisica import posicionPantalla
+from src.functions.electron import ElectronBeam
+from src.functions.optica import sistema_optico
+from src.functions.yugo import YugoMagnetico, posicion_pantalla
+from src.utils.constantes import E_CHARGE, E_MASS
+
+
+def test_optica_coincide_con_posicion_pantalla():
+    #Electrón sobre el eje: el modelo ABCD y el cálculo directo dan el mismo punto para deflexiones chicas
+    sistema = sistema_optico(2000.0)
+    estado = np.array([[0.0, 0.0, 0.0, 0.0, 1.0]])
+    for vv, vh in ((5.0, 0.0), (0.0, -5.0), (3.0, 4.0)):
+        x, y, _, _ = sistema.tamano_punto(estado, vv, vh)
+        x_directo, y_directo = posicionPantalla(vv, vh, 2000.0)
+        assert np.isclose(x, x_directo, rtol=1e-9, atol=1e-9)
+        assert np.isclose(y, y_directo, rtol=1e-9, atol=1e-9)
+
+
+def test_boris_radio_de_giro():
+    #En B uniforme el electrón describe un círculo de radio v/(|q|/M B) centrado en +y (carga negativa)
+    B, v = 1e-3, 1e7
+    yugo = YugoMagnetico(campo_externo=(0.0, 0.0, B))
+    haz = ElectronBeam(1)
+    haz.emit(1, 0.0, pos=np.array([[0.0, 0.0, -1.0]]), vel=np.array([[v, 0.0, 0.0]]))
+    radio = v / (E_CHARGE / E_MASS * B)
+    periodo = 2 * np.pi * radio / v
+    dt = periodo / 2000
+    orbita = []
+    for _ in range(2000):
+        haz.step_boris(dt, yugo)
+        orbita.append(haz.pos[0, :2].copy())
+    orbita = np.array(orbita)
+    centro = orbita.mean(axis=0) #Boris desfasa v medio paso: el centro se corre v dt/2, el radio no cambia
+    assert np.isclose(np.linalg.norm(haz.vel[0]), v, rtol=1e-12)
+    assert np.allclose(np.linalg.norm(orbita - centro, axis=1), radio, rtol=1e-5)
+    assert np.allclose(centro, [0.0, radio], atol=2e-3 * radio)
+    assert np.allclose(haz.pos[0, :2], 0.0, atol=1e-3 * radio) #Vuelve al inicio tras un periodo
+
+
+def test_yugo_coincide_con_boris():
+    yugo = YugoMagnetico()
+    x, y, _ = ElectronBeam(8).run(2.5e-8, 3e-12, 2000, 4e10, 30.0, -20.0, yugo=yugo)
+    x_arco, y_arco = posicion_pantalla(30.0, -20.0, 2000, yugo)
+    assert x.size > 0
+    assert np.allclose(x, x_arco, rtol=2e-3) and np.allclose(y, y_arco, rtol=2e-3)
+
+
+def test_yugo_electron_que_no_llega_es_nan():
+    #Con radio de giro menor que el yugo el electrón vuelve: no hay impacto finito
+    x, y = posicion_pantalla(np.array([1e3, 1e5, 0.0]), 0.0, 2000)
+    assert np.isfinite(y[0]) and np.isnan(y[1]) and y[2] == 0
+    assert np.all(x == 0)
+
+
+def test_verlet_conserva_energia_entre_placas():
+    #Campo uniforme dentro de las placas V: ½|v|² - a·y se conserva (Verlet es exacto con a constante)
+    haz = ElectronBeam(4)
+    haz.emit(4, 2000.0, pos=np.array([[0.0, y0, 1e-3, ] for y0 in (-2e-3, 0.0, 1e-3, 4e-3)]))
+    a_y = -E_CHARGE / E_MASS * 150.0 / haz.geometria.separacion_placas
+
+    def energia():
+        return 0.5 * np.einsum("ij,ij->i", haz.vel[:4], haz.vel[:4]) - a_y * haz.pos[:4, 1]
+
+    inicial = energia()
+    for _ in range(150): #1.5 ns: los electrones siguen dentro de las placas
+        haz.step(1e-11, voltaje_v=150.0)
+    assert np.all(haz.pos[:4, 2] < haz.z_placas_v[1])
+    assert np.allclose(energia(), inicial, rtol=1e-12)
+    assert np.all(haz.vel[:4, 1] < 0) #Voltaje vertical positivo: el electrón baja
+
+
+def test_haz_impacta_donde_indica_posicion_pantalla():
+    haz = ElectronBeam(64)
+    x, y, t = haz.run(2.5e-8, 2.5e-12, 2000.0, 4e10, voltaje_v=40.0, voltaje_h=-25.0)
+    assert x.size > 0 and np.all(np.diff(t) >= 0)
+    assert np.allclose(x, posicionPantalla(40.0, -25.0, 2000.0)[0], rtol=1e-3)
+    #En y el haz recorre el trayecto físico completo: también deriva a lo largo de las placas H
+    g = haz.geometria
+    v0 = haz.velocidad_inicial(2000.0)
+    a_y = -E_CHARGE / E_MASS * 40.0 / g.separacion_placas
+    t_v = g.longitud_placas_v / v0
+    deriva = g.distancia_entre_placas + g.longitud_placas_h + g.distancia_placas_h_pantalla
+    y_ref = (0.5 * a_y * t_v**2 + a_y * t_v * deriva / v0) * g.escala_px
+    assert np.allclose(y, y_ref, rtol=1e-3)
@@ -6,6 +6,8 @@ import math
 class Controles:
     def __init__(self, parent):
         self.modo_sinusoidal = tk.BooleanVar(value=False)
+        self.modo_magnetico = tk.BooleanVar(value=False)
+        self.modo_fosforo = tk.BooleanVar(value=False)
         
         # Variables de control mejoradas con rangos apropiados para las figuras de Lissajous
         self.valores = {
@@ -76,6 +78,22 @@ class Controles:
                                      relief=tk.RAISED, bd=2, padx=10, pady=5,
                                      command=self._toggle_modo)
         self.btn_modo.pack()
+        
+        # Tipo de deflexión: placas electrostáticas o yugo magnético
+        self.btn_magnetico = tk.Checkbutton(btn_frame, text="🧲 DEFLEXIÓN MAGNÉTICA (Yugo)", 
+                                          variable=self.modo_magnetico, 
+                                          fg="#ffffff", bg="#4a5568", activebackground="#ff00ff",
+                                          selectcolor="#1a202c", font=("Consolas", 10, "bold"),
+                                          relief=tk.RAISED, bd=2, padx=10, pady=5)
+        self.btn_magnetico.pack(pady=(5, 0))
+        
+        # Pantalla de fósforo: una imagen que decae en lugar de un óvalo por punto
+        self.btn_fosforo = tk.Checkbutton(btn_frame, text="💡 PANTALLA DE FÓSFORO (Imagen)", 
+                                        variable=self.modo_fosforo, 
+                                        fg="#ffffff", bg="#4a5568", activebackground="#ff00ff",
+                                        selectcolor="#1a202c", font=("Consolas", 10, "bold"),
+                                        relief=tk.RAISED, bd=2, padx=10, pady=5)
+        self.btn_fosforo.pack(pady=(5, 0))
 
     def _crear_controles_sinusoidales(self):
         """Crea controles para señales sinusoidales con presets mejorados"""
@@ -309,12 +327,16 @@ class Controles:
                 self.valores[key].set(valor)
         
         self.modo_sinusoidal.set(False)
+        self.modo_magnetico.set(False)
+        self.modo_fosforo.set(False)
         self._toggle_modo()
 
     def get_valores(self):
         """Retorna todos los valores actuales"""
         valores = {k: v.get() for k, v in self.valores.items()}
         valores["modo_sinusoidal"] = self.modo_sinusoidal.get()
+        valores["modo_magnetico"] = self.modo_magnetico.get()
+        valores["modo_fosforo"] = self.modo_fosforo.get()
         return valores
 
     def get_voltajes_actuales(self, tiempo=0):
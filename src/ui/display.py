@@ -1,10 +1,29 @@
 import tkinter as tk
 import math
 import time
-from collections import deque
+from dataclasses import asdict
+import numpy as np
+from src.functions.analizador import AnalizadorLissajous
+from src.functions.fisica import deflexionSinusoidal, posicionPantalla, velocidadCE
+from src.functions.lissajous import posicion_lissajous
+from src.functions.remuestreo import RemuestreadorPolifasico
+from src.functions import yugo as yugo_magnetico
+from src.utils.constantes import E_CHARGE, E_MASS, PRECISION_DEF, TubeGeometry
+from src.utils.fosforo import PantallaFosforo
+from src.utils.historial import HistorialPuntos
+from src.utils.paleta import paleta
+from src.ui.panel import PanelTexto
+from src.ui.reserva import ReservaCanvas
+
+MAX_MUESTRAS_FUENTE = 1 << 16  # Muestras de la fuente externa leídas como máximo por cuadro
+PUNTOS_FUENTE_CUADRO = 64  # Puntos nuevos del trazo por cuadro con fuente externa
+FS_PANTALLA = PUNTOS_FUENTE_CUADRO * 60  # Tasa de puntos del trazo (Hz) a 60 cuadros por segundo
+FS_ANALISIS = 64  # Muestreo del trazo senoidal para el analizador (Hz); los controles llegan a 4 Hz
+BLOQUE_ANALISIS = 512  # Ventana del analizador en modo senoidal (8 s a FS_ANALISIS)
+BLOQUE_ANALISIS_FUENTE = 4096  # Ventana del analizador con fuente externa (~1 s a FS_PANTALLA)
 
 class Display:
-    def __init__(self, root, width=1000, height=700):
+    def __init__(self, root, width=1000, height=700, precision=PRECISION_DEF):
         # Frame principal con diseño cyberpunk
         self.frame_principal = tk.Frame(root, bg="#000000", relief=tk.RAISED, bd=3)
         self.frame_principal.pack(side=tk.LEFT, padx=15, pady=15, fill=tk.BOTH, expand=True)
@@ -18,27 +37,58 @@ class Display:
         self.width = width
         self.height = height
         
-        # Historial mejorado para persistencia realista
-        self.puntos_pantalla = deque(maxlen=3000)  # Más puntos para mejor calidad
-        self.puntos_lissajous = deque(maxlen=2000)  # Específico para Lissajous
+        # Variables para física realista del CRT
+        self.dtype = np.dtype(precision)  # Tipo de las posiciones en pantalla (tiempo y fase siempre float64)
+        
+        # Historial mejorado para persistencia realista (columnas NumPy en un ring buffer)
+        self.puntos_pantalla = HistorialPuntos(3000, self.dtype)  # Más puntos para mejor calidad
+        self.puntos_lissajous = HistorialPuntos(2000, self.dtype)  # Específico para Lissajous
         self.tiempo_inicio = time.time()
         self.ultimo_tiempo_limpiar = 0
-        
-        # Variables para física realista del CRT
+        self.geometria = TubeGeometry()
         self.constantes_fisicas = {
-            'e': 1.602e-19,  # Carga del electrón (C)
-            'm': 9.109e-31,  # Masa del electrón (kg)
-            'longitud_placas_v': 0.05,  # 5 cm
-            'longitud_placas_h': 0.04,  # 4 cm
-            'separacion_placas': 0.02,  # 2 cm
-            'distancia_placas_v_pantalla': 0.25,  # 25 cm
-            'distancia_placas_h_pantalla': 0.20,  # 20 cm
-            'distancia_entre_placas': 0.08  # 8 cm entre placas V y H
+            'e': E_CHARGE,  # Carga del electrón (C)
+            'm': E_MASS,  # Masa del electrón (kg)
+            **asdict(self.geometria)  # Longitudes de placas y distancias (m)
         }
         
+        # Fuente externa opcional (WAV/NPY/CSV) para manejar las placas en modo XY
+        self.fuente = None
+        self._fuente_t0 = None
+        self._fuente_consumidas = 0
+        self._fuente_ultimo = (0.0, 0.0)  # Últimos voltajes (h, v) leídos
+        
+        # Analizador espectral del trazo: estima razón y fase de lo que se dibuja, no de los controles
+        self.analizador = None
+        self._analisis_clave = None  # Parámetros senoidales con los que se llenó el analizador
+        self._analisis_k = 0  # Próxima muestra (índice a FS_ANALISIS) por analizar
+        
+        # Modo fósforo: la pantalla es una imagen NumPy que decae, volcada como un solo PhotoImage por cuadro
+        self.fosforo = None
+        self._fosforo_foto = None
+        self._fosforo_t = None  # Tiempo del último cuadro (para el decaimiento)
+        self._fosforo_ultimo_t = -math.inf  # Instante del impacto más reciente ya depositado
+        
+        # Colores precalculados por nivel de intensidad (sin formatear cadenas por punto)
+        self.paleta_lissajous = paleta("lissajous")
+        self.paleta_punto = paleta("punto")
+        self.paleta_conector = paleta("conector")
+        
+        # Yugo para el modo de deflexión magnética (misma señal de control que las placas)
+        self.yugo = yugo_magnetico.YugoMagnetico()
+        
         # Configurar áreas optimizadas
         self._configurar_areas_mejoradas()
         self._dibujar_estructura_avanzada()
+        
+        # Items dinámicos reutilizables: se crean una vez y se actualizan con coords/itemconfig
+        self._reserva_haz = ReservaCanvas(self.canvas, "line", "haz")
+        self._reserva_campo = ReservaCanvas(self.canvas, "line", "haz")
+        self._reserva_impactos = ReservaCanvas(self.canvas, "oval", "punto")
+        self._reserva_puntos = ReservaCanvas(self.canvas, "oval", "punto", outline="")
+        self._reserva_conectores = ReservaCanvas(self.canvas, "line", "punto")
+        self._reservas = (self._reserva_haz, self._reserva_campo, self._reserva_impactos,
+                          self._reserva_puntos, self._reserva_conectores)
 
     def _configurar_areas_mejoradas(self):
         """Define las áreas con diseño mejorado y proporciones optimizadas"""
@@ -330,10 +380,10 @@ class Display:
         # Líneas principales
         self.canvas.create_line(centro_px, self.pantalla_activa['y'],
                                centro_px, self.pantalla_activa['y'] + self.pantalla_activa['height'],
-                               fill="#003300", width=1, dash=(3, 3))
+                               fill="#003300", width=1, dash=(3, 3), tags="reticula")
         self.canvas.create_line(self.pantalla_activa['x'], centro_py,
                                self.pantalla_activa['x'] + self.pantalla_activa['width'], centro_py,
-                               fill="#003300", width=1, dash=(3, 3))
+                               fill="#003300", width=1, dash=(3, 3), tags="reticula")
         
         # Rejilla fina
         for i in range(1, 8):
@@ -343,10 +393,10 @@ class Display:
             if i != 4:  # No sobre la línea central
                 self.canvas.create_line(x, self.pantalla_activa['y'],
                                        x, self.pantalla_activa['y'] + self.pantalla_activa['height'],
-                                       fill="#002200", width=1, dash=(1, 4))
+                                       fill="#002200", width=1, dash=(1, 4), tags="reticula")
                 self.canvas.create_line(self.pantalla_activa['x'], y,
                                        self.pantalla_activa['x'] + self.pantalla_activa['width'], y,
-                                       fill="#002200", width=1, dash=(1, 4))
+                                       fill="#002200", width=1, dash=(1, 4), tags="reticula")
         
         # Marcadores de calibración
         marca_size = 5
@@ -354,8 +404,8 @@ class Display:
             for j in [-1, 1]:
                 mx = centro_px + i * self.pantalla_activa['width'] // 4
                 my = centro_py + j * self.pantalla_activa['height'] // 4
-                self.canvas.create_line(mx-marca_size, my, mx+marca_size, my, fill="#006600", width=2)
-                self.canvas.create_line(mx, my-marca_size, mx, my+marca_size, fill="#006600", width=2)
+                self.canvas.create_line(mx-marca_size, my, mx+marca_size, my, fill="#006600", width=2, tags="reticula")
+                self.canvas.create_line(mx, my-marca_size, mx, my+marca_size, fill="#006600", width=2, tags="reticula")
         
         # Indicadores de escala
         self.canvas.create_text(self.pantalla_activa['x'] - 15, centro_py, text="0V",
@@ -376,76 +426,71 @@ class Display:
         # Línea separadora
         self.canvas.create_line(info['x']+10, info['y']+25, info['x']+info['width']-10, info['y']+25,
                                fill="#444444", width=1)
-
-    def _calcular_posicion_realista(self, voltaje_v, voltaje_h, voltaje_aceleracion):
-        """Cálculo físico realista mejorado con trayectoria por tramos"""
-        c = self.constantes_fisicas
-        
-        # Velocidad inicial del electrón (energía cinética)
-        if voltaje_aceleracion <= 0:
-            return 0, 0
-            
-        v0 = math.sqrt(2 * c['e'] * abs(voltaje_aceleracion) / c['m'])
-        
-        # === TRAMO 1: Deflexión vertical ===
-        campo_v = voltaje_v / c['separacion_placas'] if c['separacion_placas'] > 0 else 0
-        aceleracion_v = -c['e'] * campo_v / c['m']  # Negativo porque el electrón tiene carga negativa
-        
-        tiempo_placas_v = c['longitud_placas_v'] / v0
-        
-        # Velocidad vertical al salir de las placas
-        vy_salida = aceleracion_v * tiempo_placas_v
-        # Desplazamiento vertical dentro de las placas
-        y_en_placas_v = 0.5 * aceleracion_v * tiempo_placas_v**2
-        
-        # === TRAMO 2: Entre placas verticales y horizontales ===
-        tiempo_entre_placas = c['distancia_entre_placas'] / v0
-        y_entre_placas = vy_salida * tiempo_entre_placas
-        
-        # === TRAMO 3: Deflexión horizontal ===
-        campo_h = voltaje_h / c['separacion_placas'] if c['separacion_placas'] > 0 else 0
-        aceleracion_h = c['e'] * campo_h / c['m']  # Positivo para deflexión hacia la derecha
-        
-        tiempo_placas_h = c['longitud_placas_h'] / v0
-        
-        # Velocidad horizontal al salir de las placas
-        vx_salida = aceleracion_h * tiempo_placas_h
-        # Desplazamiento horizontal dentro de las placas
-        x_en_placas_h = 0.5 * aceleracion_h * tiempo_placas_h**2
-        
-        # === TRAMO 4: Trayectoria libre hasta la pantalla ===
-        # Tiempo para llegar a la pantalla desde las placas horizontales
-        tiempo_a_pantalla = c['distancia_placas_h_pantalla'] / v0
-        
-        # Desplazamientos finales
-        y_libre = vy_salida * tiempo_a_pantalla
-        x_libre = vx_salida * tiempo_a_pantalla
         
-        # === Posición total ===
-        y_total = y_en_placas_v + y_entre_placas + y_libre
-        x_total = x_en_placas_h + x_libre
-        
-        # Escalar a píxeles con factor de calibración realista
-        escala = 800  # Factor ajustado para buena visualización
-        pixel_x = x_total * escala
-        pixel_y = y_total * escala
-        
-        return pixel_x, pixel_y
+        # Columnas: títulos fijos y un texto persistente por campo (se actualizan en _actualizar_informacion_sistema)
+        col1_x = info['x'] + 15
+        col2_x = info['x'] + 200
+        col3_x = info['x'] + 400
+        y_start = info['y'] + 35
+        for x, titulo in ((col1_x, "VOLTAJES:"), (col2_x, "FÍSICA:"), (col3_x, "SISTEMA:")):
+            self.canvas.create_text(x, y_start, text=titulo,
+                                   font=("Consolas", 9, "bold"), fill="#00ffff", anchor="w")
+        
+        self.panel_info = PanelTexto(self.canvas)
+        self._panel_modo = None
+        campos = (
+            ("aceleracion", col1_x, 15, "#ffffff"), ("linea_1", col1_x, 30, "#ffff00"), ("linea_2", col1_x, 45, "#00ff00"),
+            ("velocidad", col2_x, 15, "#ffffff"), ("deflexion_x", col2_x, 30, "#ff8800"), ("deflexion_y", col2_x, 45, "#ffff00"),
+            ("persistencia", col3_x, 15, "#ffffff"), ("brillo", col3_x, 30, "#ffffff"), ("puntos", col3_x, 45, "#00ff00"),
+        )
+        for nombre, x, dy, color in campos:
+            self.panel_info.campo(nombre, x, y_start + dy, font=("Consolas", 8), fill=color, anchor="w")
+
+    def _calcular_posicion_realista(self, voltaje_v, voltaje_h, voltaje_aceleracion, magnetico=False):
+        """Cálculo físico realista con trayectoria por tramos (un solo punto)"""
+        if magnetico:
+            pixel_x, pixel_y = yugo_magnetico.posicion_pantalla(voltaje_v, voltaje_h, voltaje_aceleracion,
+                                                                self.yugo, self.geometria)
+        else:
+            pixel_x, pixel_y = posicionPantalla(voltaje_v, voltaje_h, voltaje_aceleracion, self.geometria)
+        return float(pixel_x), float(pixel_y)
+
+    def _posicion_sinusoidal(self, t, freq_v, freq_h, fase_v, fase_h, amplitud, voltaje_aceleracion, magnetico=False):
+        """Posición (px) con señales senoidales: indexa la curva cerrada cacheada si la razón es racional"""
+        yugo = self.yugo if magnetico else None
+        posicion = posicion_lissajous(t, freq_v, freq_h, fase_v, fase_h, amplitud, voltaje_aceleracion,
+                                      self.geometria, yugo, self.dtype)
+        if posicion is not None:
+            return posicion
+        if magnetico:
+            voltaje_v = amplitud * np.sin(2 * math.pi * freq_v * np.asarray(t) + fase_v)
+            voltaje_h = amplitud * np.sin(2 * math.pi * freq_h * np.asarray(t) + fase_h)
+            pixel_x, pixel_y = yugo_magnetico.posicion_pantalla(voltaje_v, voltaje_h, voltaje_aceleracion, self.yugo, self.geometria)
+            return pixel_x.astype(self.dtype, copy=False), pixel_y.astype(self.dtype, copy=False)
+        # Placas: integrando el voltaje durante el tránsito del electrón
+        return (deflexionSinusoidal(amplitud, freq_h, fase_h, t, voltaje_aceleracion, 'x', self.geometria, self.dtype),
+                deflexionSinusoidal(amplitud, freq_v, fase_v, t, voltaje_aceleracion, 'y', self.geometria, self.dtype))
 
     def handle_draw(self, valores, tiempo_actual=None):
         """Actualización principal con física mejorada"""
         if tiempo_actual is None:
             tiempo_actual = time.time() - self.tiempo_inicio
         
-        # Limpiar elementos dinámicos
-        self.canvas.delete("dinamico")
-        self.canvas.delete("haz")
-        self.canvas.delete("punto")
+        # Reasignar elementos dinámicos (los que no se usen en este cuadro quedan ocultos)
+        for reserva in self._reservas:
+            reserva.iniciar()
         
         # Obtener voltajes
         voltaje_aceleracion = valores.get("voltaje_aceleracion", 2000)
-        
-        if valores.get("modo_sinusoidal", False):
+        magnetico = valores.get("modo_magnetico", False)
+        externa = self.fuente is not None
+        self._activar_fosforo(valores.get("modo_fosforo", False))
+        
+        if externa:
+            # Señal externa (WAV/NPY/CSV) en modo XY: las muestras nuevas desde el último cuadro
+            voltaje_h, voltaje_v = self._generar_trazo_fuente(tiempo_actual, valores.get("persistencia", 1.5),
+                                                              voltaje_aceleracion, magnetico)
+        elif valores.get("modo_sinusoidal", False):
             # Calcular voltajes sinusoidales para Lissajous
             freq_v = valores.get("frecuencia_vertical", 1.0)
             fase_v = math.radians(valores.get("fase_vertical", 0))
@@ -461,7 +506,9 @@ class Display:
             # Generar Lissajous completa
             self._generar_lissajous_mejorada(freq_v, freq_h, fase_v, fase_h, amplitud_base, 
                                            tiempo_actual, valores.get("persistencia", 1.5),
-                                           voltaje_aceleracion)
+                                           voltaje_aceleracion, magnetico)
+            self._analizar_sinusoidal(tiempo_actual, freq_v, freq_h, fase_v, fase_h, amplitud_base,
+                                      voltaje_aceleracion, magnetico)
         else:
             voltaje_v = valores.get("voltaje_vertical", 0)
             voltaje_h = valores.get("voltaje_horizontal", 0)
@@ -471,19 +518,140 @@ class Display:
         self._dibujar_haz_superior_mejorado(voltaje_h, voltaje_aceleracion)
         
         # Calcular posición en pantalla
-        pixel_x, pixel_y = self._calcular_posicion_realista(voltaje_v, voltaje_h, voltaje_aceleracion)
+        if externa:
+            pixel_x, pixel_y = self._calcular_posicion_realista(voltaje_v, voltaje_h, voltaje_aceleracion, magnetico)
+        elif valores.get("modo_sinusoidal", False):
+            pixel_x, pixel_y = self._posicion_sinusoidal(tiempo_actual, freq_v, freq_h, fase_v, fase_h, amplitud_base,
+                                                         voltaje_aceleracion, magnetico)
+            pixel_x, pixel_y = float(pixel_x), float(pixel_y)
+        else:
+            pixel_x, pixel_y = self._calcular_posicion_realista(voltaje_v, voltaje_h, voltaje_aceleracion, magnetico)
         
         # Dibujar en pantalla
-        if valores.get("modo_sinusoidal", False):
+        if self.fosforo is not None:
+            self._dibujar_fosforo(pixel_x, pixel_y, voltaje_aceleracion, valores.get("persistencia", 1.5),
+                                  tiempo_actual, valores.get("brillo", 1.0),
+                                  trazo=externa or valores.get("modo_sinusoidal", False))
+        elif externa or valores.get("modo_sinusoidal", False):
             self._dibujar_lissajous_pantalla_mejorada(valores.get("persistencia", 1.5), tiempo_actual)
         else:
             self._dibujar_punto_pantalla_mejorado(pixel_x, pixel_y, voltaje_aceleracion, 
                                                 valores.get("persistencia", 1.5), tiempo_actual, 
                                                 valores.get("brillo", 1.0))
         
+        for reserva in self._reservas:
+            reserva.terminar()
+        
         # Actualizar información del sistema
         self._actualizar_informacion_sistema(valores, tiempo_actual, pixel_x, pixel_y)
 
+    def _activar_fosforo(self, activo):
+        """Entra o sale del modo fósforo (imagen única en lugar de un óvalo por punto)"""
+        if activo == (self.fosforo is not None):
+            return
+        self.puntos_pantalla.limpiar()
+        self.puntos_lissajous.limpiar()
+        self._reserva_puntos.ocultar()
+        self._reserva_conectores.ocultar()
+        if not activo:
+            self.canvas.delete("fosforo")
+            self.fosforo = None
+            self._fosforo_foto = None
+            return
+        pa = self.pantalla_activa
+        self.fosforo = PantallaFosforo(pa['width'], pa['height'], self.dtype)
+        self._fosforo_foto = tk.PhotoImage(width=pa['width'], height=pa['height'])
+        self._fosforo_t = None
+        self._fosforo_ultimo_t = -math.inf
+        self.canvas.create_image(pa['x'], pa['y'], image=self._fosforo_foto, anchor="nw", tags="fosforo")
+        self.canvas.tag_raise("reticula", "fosforo")  # La rejilla queda sobre el fósforo
+
+    def _dibujar_fosforo(self, pixel_x, pixel_y, voltaje_aceleracion, persistencia, tiempo_actual, brillo, trazo=False):
+        """Decae la imagen, agrega el punto del haz (modo manual) y la vuelca al canvas"""
+        dt = 0.0 if self._fosforo_t is None else tiempo_actual - self._fosforo_t
+        self._fosforo_t = tiempo_actual
+        factor = self.fosforo.decaer(dt, persistencia)
+        if not trazo:
+            # Haz quieto: depositar (1 - factor) por cuadro deja la intensidad estable en la del punto vectorial
+            intensidad = min(voltaje_aceleracion / 3000.0 * brillo, 1.5)
+            self.fosforo.depositar(self.pantalla_activa['width'] / 2 + pixel_x,
+                                   self.pantalla_activa['height'] / 2 - pixel_y,
+                                   intensidad * (1.0 - factor) if dt > 0 else intensidad)
+        self._fosforo_foto.configure(data=self.fosforo.ppm(), format="PPM")
+
+    def conectar_fuente(self, fuente):
+        """Maneja las placas con una fuente externa (src.functions.fuentes) en lugar de los controles"""
+        if self.fuente is not None and self.fuente is not fuente:
+            self.fuente.cerrar()  # La fuente anterior puede tener un archivo abierto (CSV)
+        self.fuente = fuente
+        self._fuente_t0 = None
+        self._fuente_consumidas = 0
+        self._fuente_ultimo = (0.0, 0.0)
+        # Un remuestreador por canal: de la tasa de la fuente a la tasa de puntos de la pantalla
+        self._remuestreo = (RemuestreadorPolifasico(fuente.fs, FS_PANTALLA),
+                            RemuestreadorPolifasico(fuente.fs, FS_PANTALLA))
+        self._remuestreo_t0 = None
+        self.analizador = AnalizadorLissajous(self._remuestreo[0].fs_salida, BLOQUE_ANALISIS_FUENTE)
+        self._analisis_clave = None
+        self.puntos_lissajous.limpiar()
+
+    def desconectar_fuente(self):
+        """Vuelve a los voltajes de los controles"""
+        if self.fuente is not None:
+            self.fuente.cerrar()
+        self.fuente = None
+        self.analizador = None
+        self._analisis_clave = None
+        self.puntos_lissajous.limpiar()
+
+    def _leer_fuente(self, tiempo_actual):
+        """Muestras de la fuente entre el cuadro anterior y tiempo_actual (acotadas a MAX_MUESTRAS_FUENTE)"""
+        fuente = self.fuente
+        if self._fuente_t0 is None:
+            self._fuente_t0 = tiempo_actual
+        objetivo = int((tiempo_actual - self._fuente_t0) * fuente.fs)
+        n = objetivo - self._fuente_consumidas
+        if n > MAX_MUESTRAS_FUENTE:
+            # Cuadro muy atrasado: se salta lo que ya no se alcanza a mostrar y el filtro arranca de nuevo
+            fuente.saltar(n - MAX_MUESTRAS_FUENTE)
+            self._fuente_consumidas += n - MAX_MUESTRAS_FUENTE
+            n = MAX_MUESTRAS_FUENTE
+            for remuestreador in self._remuestreo:
+                remuestreador.reiniciar()
+            self._remuestreo_t0 = None
+        if n <= 0:
+            return np.empty(0), np.empty(0)
+        if self._remuestreo_t0 is None:
+            self._remuestreo_t0 = self._fuente_t0 + self._fuente_consumidas / fuente.fs
+        voltaje_h, voltaje_v = fuente.leer(n)
+        self._fuente_consumidas += n
+        return voltaje_h, voltaje_v
+
+    def _generar_trazo_fuente(self, tiempo_actual, persistencia, voltaje_aceleracion, magnetico=False):
+        """Convierte el bloque nuevo de la fuente en puntos del trazo; retorna los últimos voltajes (h, v)"""
+        voltaje_h, voltaje_v = self._leer_fuente(tiempo_actual)
+        if voltaje_h.size == 0:
+            return self._fuente_ultimo
+        self._fuente_ultimo = (float(voltaje_h[-1]), float(voltaje_v[-1]))
+        
+        # Filtro antialias + cambio de tasa: ~PUNTOS_FUENTE_CUADRO puntos por cuadro sin importar la fs de la fuente
+        remuestreo_h, remuestreo_v = self._remuestreo
+        voltaje_h = remuestreo_h.procesar(voltaje_h)
+        voltaje_v = remuestreo_v.procesar(voltaje_v)
+        if voltaje_h.size == 0:
+            return self._fuente_ultimo
+        self.analizador.agregar(voltaje_h, voltaje_v)  # En orden cronológico, a la tasa del trazo
+        voltaje_h, voltaje_v = voltaje_h[::-1], voltaje_v[::-1]  # Del más nuevo al más antiguo
+        t = remuestreo_h.tiempos(voltaje_h.size, self._remuestreo_t0)[::-1]
+        if magnetico:
+            pixel_x, pixel_y = yugo_magnetico.posicion_pantalla(voltaje_v, voltaje_h, voltaje_aceleracion,
+                                                                self.yugo, self.geometria)
+        else:
+            pixel_x, pixel_y = posicionPantalla(voltaje_v, voltaje_h, voltaje_aceleracion, self.geometria,
+                                                dtype=self.dtype)
+        self._agregar_puntos_trazo(pixel_x, pixel_y, t, tiempo_actual, persistencia, voltaje_aceleracion)
+        return self._fuente_ultimo
+
     def _dibujar_haz_lateral_mejorado(self, voltaje_v, voltaje_aceleracion):
         """Haz de electrones en vista lateral con efectos realistas"""
         v = self.vista_lateral
@@ -503,18 +671,18 @@ class Display:
         ancho_haz = max(1, int(3 * intensidad_haz))
         
         # 1. Tramo inicial (cátodo a ánodo)
-        self.canvas.create_line(catodo_x+3, centro_y, anodo_x-8, centro_y,
-                               fill=color_haz, width=ancho_haz, tags="haz")
+        self._reserva_haz.dibujar((catodo_x+3, centro_y, anodo_x-8, centro_y),
+                               fill=color_haz, width=ancho_haz)
         
         # Efecto de aceleración (líneas convergentes)
         for i in range(3):
             offset = (i-1) * 2
-            self.canvas.create_line(catodo_x+3, centro_y+offset, anodo_x-8, centro_y+offset//2,
-                                   fill=color_haz, width=1, tags="haz")
+            self._reserva_haz.dibujar((catodo_x+3, centro_y+offset, anodo_x-8, centro_y+offset//2),
+                                   fill=color_haz, width=1)
         
         # 2. Tramo rectilíneo (ánodo a placas verticales)
-        self.canvas.create_line(anodo_x+12, centro_y, placas_v_inicio, centro_y,
-                               fill=color_haz, width=ancho_haz, tags="haz")
+        self._reserva_haz.dibujar((anodo_x+12, centro_y, placas_v_inicio, centro_y),
+                               fill=color_haz, width=ancho_haz)
         
         # 3. Deflexión en placas verticales
         deflexion_max = 35
@@ -531,25 +699,25 @@ class Display:
             puntos_deflexion.extend([x, y])
         
         if len(puntos_deflexion) >= 4:
-            self.canvas.create_line(puntos_deflexion, fill=color_haz, width=ancho_haz, 
-                                   smooth=True, tags="haz")
+            self._reserva_haz.dibujar(puntos_deflexion, fill=color_haz, width=ancho_haz, 
+                                   smooth=True)
         
         # 4. Tramo entre placas
         y_salida_v = centro_y + deflexion
-        self.canvas.create_line(placas_v_fin, y_salida_v, placas_h_x, y_salida_v,
-                               fill=color_haz, width=ancho_haz, tags="haz")
+        self._reserva_haz.dibujar((placas_v_fin, y_salida_v, placas_h_x, y_salida_v),
+                               fill=color_haz, width=ancho_haz)
         
         # 5. Tramo final (placas horizontales a pantalla)
         # La deflexión vertical se mantiene
         y_pantalla = y_salida_v
-        self.canvas.create_line(placas_h_x+20, y_salida_v, pantalla_x, y_pantalla,
-                               fill=color_haz, width=ancho_haz, tags="haz")
+        self._reserva_haz.dibujar((placas_h_x+20, y_salida_v, pantalla_x, y_pantalla),
+                               fill=color_haz, width=ancho_haz)
         
         # 6. Punto de impacto en la pantalla lateral
         impact_size = max(2, int(4 * intensidad_haz))
-        self.canvas.create_oval(pantalla_x-impact_size, y_pantalla-impact_size,
-                               pantalla_x+impact_size, y_pantalla+impact_size,
-                               fill="#ffffff", outline=color_haz, width=2, tags="punto")
+        self._reserva_impactos.dibujar((pantalla_x-impact_size, y_pantalla-impact_size,
+                               pantalla_x+impact_size, y_pantalla+impact_size),
+                               fill="#ffffff", outline=color_haz, width=2)
         
         # 7. Líneas de campo eléctrico vertical
         if abs(voltaje_v) > 10:
@@ -574,16 +742,16 @@ class Display:
         ancho_haz = max(1, int(3 * intensidad_haz))
         
         # 1. Tramo inicial
-        self.canvas.create_line(catodo_x, centro_y, anodo_x-10, centro_y,
-                               fill=color_haz, width=ancho_haz, tags="haz")
+        self._reserva_haz.dibujar((catodo_x, centro_y, anodo_x-10, centro_y),
+                               fill=color_haz, width=ancho_haz)
         
         # 2. Tramo rectilíneo hasta placas verticales
-        self.canvas.create_line(anodo_x+10, centro_y, placas_v_x, centro_y,
-                               fill=color_haz, width=ancho_haz, tags="haz")
+        self._reserva_haz.dibujar((anodo_x+10, centro_y, placas_v_x, centro_y),
+                               fill=color_haz, width=ancho_haz)
         
         # 3. A través de las placas verticales (sin deflexión horizontal aquí)
-        self.canvas.create_line(placas_v_x, centro_y, placas_h_inicio, centro_y,
-                               fill=color_haz, width=ancho_haz, tags="haz")
+        self._reserva_haz.dibujar((placas_v_x, centro_y, placas_h_inicio, centro_y),
+                               fill=color_haz, width=ancho_haz)
         
         # 4. Deflexión en placas horizontales
         deflexion_h_max = 25
@@ -599,21 +767,21 @@ class Display:
             puntos_deflexion_h.extend([x, y])
         
         if len(puntos_deflexion_h) >= 4:
-            self.canvas.create_line(puntos_deflexion_h, fill=color_haz, width=ancho_haz,
-                                   smooth=True, tags="haz")
+            self._reserva_haz.dibujar(puntos_deflexion_h, fill=color_haz, width=ancho_haz,
+                                   smooth=True)
         
         # 5. Tramo final a pantalla
         y_salida_h = centro_y + deflexion_h
         y_pantalla_final = centro_y + deflexion_h * 1.3  # Amplificación por distancia
         
-        self.canvas.create_line(placas_h_fin, y_salida_h, pantalla_x, y_pantalla_final,
-                               fill=color_haz, width=ancho_haz, tags="haz")
+        self._reserva_haz.dibujar((placas_h_fin, y_salida_h, pantalla_x, y_pantalla_final),
+                               fill=color_haz, width=ancho_haz)
         
         # 6. Punto de impacto
         impact_size = max(2, int(4 * intensidad_haz))
-        self.canvas.create_oval(pantalla_x-impact_size, y_pantalla_final-impact_size,
-                               pantalla_x+impact_size, y_pantalla_final+impact_size,
-                               fill="#ffffff", outline=color_haz, width=2, tags="punto")
+        self._reserva_impactos.dibujar((pantalla_x-impact_size, y_pantalla_final-impact_size,
+                               pantalla_x+impact_size, y_pantalla_final+impact_size),
+                               fill="#ffffff", outline=color_haz, width=2)
         
         # 7. Campo eléctrico horizontal
         if abs(voltaje_h) > 10:
@@ -630,15 +798,14 @@ class Display:
                 # Líneas de campo
                 y1 = centro_y - 20 * direccion
                 y2 = centro_y + 20 * direccion
-                self.canvas.create_line(x, y1, x, y2, fill="#ffff00", width=1, 
-                                       tags="haz", dash=(2, 3))
+                self._reserva_campo.dibujar((x, y1, x, y2), fill="#ffff00", width=1, dash=(2, 3))
                 # Flechas indicando dirección
                 if i % 2 == 0:
                     arrow_y = centro_y + 10 * direccion
-                    self.canvas.create_line(x, arrow_y, x-2, arrow_y-3*direccion, 
-                                           fill="#ffff00", width=1, tags="haz")
-                    self.canvas.create_line(x, arrow_y, x+2, arrow_y-3*direccion, 
-                                           fill="#ffff00", width=1, tags="haz")
+                    self._reserva_campo.dibujar((x, arrow_y, x-2, arrow_y-3*direccion), 
+                                           fill="#ffff00", width=1, dash="")
+                    self._reserva_campo.dibujar((x, arrow_y, x+2, arrow_y-3*direccion), 
+                                           fill="#ffff00", width=1, dash="")
 
     def _dibujar_campo_electrico_h(self, x_inicio, x_fin, centro_y, voltaje):
         """Dibuja líneas de campo eléctrico horizontal"""
@@ -651,139 +818,119 @@ class Display:
             # Líneas horizontales de campo
             x1 = x_medio - 15 * direccion
             x2 = x_medio + 15 * direccion
-            self.canvas.create_line(x1, y, x2, y, fill="#ff8800", width=1,
-                                   tags="haz", dash=(3, 2))
+            self._reserva_campo.dibujar((x1, y, x2, y), fill="#ff8800", width=1, dash=(3, 2))
             # Flechas
             if i % 2 == 0:
                 arrow_x = x_medio + 8 * direccion
-                self.canvas.create_line(arrow_x, y, arrow_x-3*direccion, y-2,
-                                       fill="#ff8800", width=1, tags="haz")
-                self.canvas.create_line(arrow_x, y, arrow_x-3*direccion, y+2,
-                                       fill="#ff8800", width=1, tags="haz")
+                self._reserva_campo.dibujar((arrow_x, y, arrow_x-3*direccion, y-2),
+                                       fill="#ff8800", width=1, dash="")
+                self._reserva_campo.dibujar((arrow_x, y, arrow_x-3*direccion, y+2),
+                                       fill="#ff8800", width=1, dash="")
 
-    def _generar_lissajous_mejorada(self, freq_v, freq_h, fase_v, fase_h, amplitud, tiempo_actual, persistencia, voltaje_aceleracion):
+    def _generar_lissajous_mejorada(self, freq_v, freq_h, fase_v, fase_h, amplitud, tiempo_actual, persistencia, voltaje_aceleracion, magnetico=False):
         """Genera figuras de Lissajous con mayor precisión y efectos"""
         # Limpiar puntos antiguos periódicamente
         if tiempo_actual - self.ultimo_tiempo_limpiar > persistencia * 1.2:
             # Solo limpiar puntos muy antiguos
-            puntos_validos = []
-            for punto in self.puntos_lissajous:
-                if tiempo_actual - punto['tiempo'] <= persistencia:
-                    puntos_validos.append(punto)
-            self.puntos_lissajous.clear()
-            self.puntos_lissajous.extend(puntos_validos)
+            self.puntos_lissajous.descartar_viejos(tiempo_actual, persistencia)
             self.ultimo_tiempo_limpiar = tiempo_actual
         
         # Parámetros de generación adaptivos
         dt = 0.008  # Mayor frecuencia de muestreo para suavidad
-        puntos_por_ciclo = max(100, int(500 / max(freq_v, freq_h)))
         
-        # Generar puntos recientes
-        for i in range(15):  # Menos puntos por frame para mejor rendimiento
-            t = tiempo_actual - i * dt
-            if t < 0:
-                continue
-            
-            # Calcular voltajes con física realista
-            voltaje_v = amplitud * math.sin(2 * math.pi * freq_v * t + fase_v)
-            voltaje_h = amplitud * math.sin(2 * math.pi * freq_h * t + fase_h)
-            
-            # Usar la física realista del CRT
-            pixel_x, pixel_y = self._calcular_posicion_realista(voltaje_v, voltaje_h, voltaje_aceleracion)
-            
-            # Convertir a coordenadas de pantalla
-            centro_x = self.pantalla_activa['x'] + self.pantalla_activa['width'] // 2
-            centro_y = self.pantalla_activa['y'] + self.pantalla_activa['height'] // 2
-            
-            pos_x = centro_x - pixel_x
-            pos_y = centro_y - pixel_y  # Invertir Y
-            
-            # Verificar límites
-            if (self.pantalla_activa['x'] <= pos_x <= self.pantalla_activa['x'] + self.pantalla_activa['width'] and
-                self.pantalla_activa['y'] <= pos_y <= self.pantalla_activa['y'] + self.pantalla_activa['height']):
-                
-                # Intensidad basada en velocidad y edad
-                edad = tiempo_actual - t
-                intensidad = max(0, 1.0 - edad / persistencia)
-                
-                # Factor de brillo basado en voltaje de aceleración
-                brillo = min(voltaje_aceleracion / 3000.0, 1.2)
-                intensidad *= brillo
-                
-                self.puntos_lissajous.append({
-                    'x': pos_x,
-                    'y': pos_y,
-                    'tiempo': t,
-                    'intensidad': intensidad,
-                    'freq_v': freq_v,
-                    'freq_h': freq_h
-                })
-
-    def _dibujar_lissajous_pantalla_mejorada(self, persistencia, tiempo_actual):
-        """Dibuja Lissajous con efectos de CRT realistas"""
-        puntos_validos = []
-        
-        # Procesar puntos por intensidad para dibujar los más brillantes encima
-        puntos_por_intensidad = {}
+        # Generar puntos recientes (del más nuevo al más antiguo) en un solo paso vectorizado
+        t = tiempo_actual - np.arange(15) * dt  # Menos puntos por frame para mejor rendimiento
+        t = t[t >= 0]
         
-        for punto in self.puntos_lissajous:
-            edad = tiempo_actual - punto['tiempo']
-            if edad <= persistencia:
-                # Recalcular intensidad con decay exponencial más realista
-                alpha = math.exp(-edad / (persistencia * 0.7))
-                punto['intensidad'] = alpha * punto.get('intensidad', 1.0)
-                
-                # Categorizar por intensidad
-                categoria = int(punto['intensidad'] * 10)
-                if categoria not in puntos_por_intensidad:
-                    puntos_por_intensidad[categoria] = []
-                puntos_por_intensidad[categoria].append(punto)
-                
-                puntos_validos.append(punto)
+        # Posiciones con la física realista del CRT
+        pixel_x, pixel_y = self._posicion_sinusoidal(t, freq_v, freq_h, fase_v, fase_h, amplitud,
+                                                     voltaje_aceleracion, magnetico)
+        self._agregar_puntos_trazo(pixel_x, pixel_y, t, tiempo_actual, persistencia, voltaje_aceleracion)
+
+    def _analizar_sinusoidal(self, tiempo_actual, freq_v, freq_h, fase_v, fase_h, amplitud, voltaje_aceleracion, magnetico=False):
+        """Alimenta el analizador con el trazo muestreado a FS_ANALISIS (solo las muestras nuevas de cada cuadro)"""
+        k = int(tiempo_actual * FS_ANALISIS)
+        clave = (freq_v, freq_h, fase_v, fase_h, amplitud, voltaje_aceleracion, magnetico)
+        if clave != self._analisis_clave:
+            # Parámetros nuevos: se llena una ventana completa con el pasado de la señal actual
+            self._analisis_clave = clave
+            self.analizador = AnalizadorLissajous(FS_ANALISIS, BLOQUE_ANALISIS)
+            self._analisis_k = k - BLOQUE_ANALISIS
+        inicio = max(self._analisis_k, k - BLOQUE_ANALISIS)
+        if k <= inicio:
+            return
+        t = np.arange(inicio, k) / FS_ANALISIS
+        pixel_x, pixel_y = self._posicion_sinusoidal(t, freq_v, freq_h, fase_v, fase_h, amplitud,
+                                                     voltaje_aceleracion, magnetico)
+        # Con el yugo saturado el haz no llega (NaN): esas muestras cuentan como sin deflexión
+        self.analizador.agregar(np.nan_to_num(pixel_x), np.nan_to_num(pixel_y))
+        self._analisis_k = k
+
+    def _agregar_puntos_trazo(self, pixel_x, pixel_y, t, tiempo_actual, persistencia, voltaje_aceleracion):
+        """Agrega al trazo persistente los impactos (px desde el centro) que caen dentro de la pantalla"""
+        # Convertir a coordenadas de pantalla
+        centro_x = self.pantalla_activa['x'] + self.pantalla_activa['width'] // 2
+        centro_y = self.pantalla_activa['y'] + self.pantalla_activa['height'] // 2
         
-        # Actualizar lista
-        self.puntos_lissajous.clear()
-        self.puntos_lissajous.extend(puntos_validos)
+        pos_x = centro_x - pixel_x
+        pos_y = centro_y - pixel_y  # Invertir Y
         
-        # Dibujar por categorías de intensidad (menos intensos primero)
-        for categoria in sorted(puntos_por_intensidad.keys()):
-            puntos_categoria = puntos_por_intensidad[categoria]
-            
-            for punto in puntos_categoria:
-                intensidad = punto['intensidad']
-                
-                if intensidad < 0.05:
-                    continue
-                
-                # Color con efecto CRT (verde con toque azul)
-                verde = min(255, int(255 * intensidad))
-                azul = min(180, int(120 * intensidad))
-                rojo = min(100, int(50 * intensidad))
-                color = f"#{rojo:02x}{verde:02x}{azul:02x}"
-                
-                # Tamaño del punto basado en intensidad
-                if intensidad > 0.8:
-                    size = 2.5
-                    # Halo para puntos muy brillantes
-                    halo_color = f"#{int(rojo*0.3):02x}{int(verde*0.3):02x}{int(azul*0.3):02x}"
-                    self.canvas.create_oval(punto['x']-4, punto['y']-4,
-                                           punto['x']+4, punto['y']+4,
-                                           fill=halo_color, outline="", tags="punto")
-                elif intensidad > 0.5:
-                    size = 1.8
-                elif intensidad > 0.2:
-                    size = 1.2
-                else:
-                    size = 0.8
-                
-                # Punto principal
-                self.canvas.create_oval(punto['x']-size, punto['y']-size,
-                                       punto['x']+size, punto['y']+size,
-                                       fill=color, outline="", tags="punto")
+        # Verificar límites
+        dentro = ((self.pantalla_activa['x'] <= pos_x) & (pos_x <= self.pantalla_activa['x'] + self.pantalla_activa['width']) &
+                  (self.pantalla_activa['y'] <= pos_y) & (pos_y <= self.pantalla_activa['y'] + self.pantalla_activa['height']))
+        
+        # Intensidad basada en edad y en el brillo por voltaje de aceleración
+        brillo = min(voltaje_aceleracion / 3000.0, 1.2)
+        intensidad = np.maximum(0, 1.0 - (tiempo_actual - t) / persistencia) * brillo
+        
+        if self.fosforo is not None:
+            # Modo fósforo: los impactos van directo a la imagen, sin historial de puntos; cada instante
+            # se deposita una sola vez (el trazo senoidal repite los últimos instantes en cada cuadro)
+            if t.size and tiempo_actual < self._fosforo_ultimo_t:
+                self._fosforo_ultimo_t = -math.inf  # El reloj volvió atrás (reinicio)
+            nuevos = dentro & (t > self._fosforo_ultimo_t)
+            self.fosforo.depositar(pos_x[nuevos] - self.pantalla_activa['x'], pos_y[nuevos] - self.pantalla_activa['y'],
+                                   intensidad[nuevos])
+            if t.size:
+                self._fosforo_ultimo_t = max(self._fosforo_ultimo_t, float(np.max(t)))
+            return
+        
+        self.puntos_lissajous.agregar(pos_x[dentro], pos_y[dentro], t[dentro], intensidad[dentro])
+
+    def _dibujar_lissajous_pantalla_mejorada(self, persistencia, tiempo_actual):
+        """Dibuja Lissajous con efectos de CRT realistas"""
+        historial = self.puntos_lissajous
+        _, _, t, intensidad = historial.columnas()
+        
+        # Envejecer, decaer y descartar en una pasada: decay exponencial más realista sobre la intensidad guardada
+        edad = tiempo_actual - t
+        vivos = edad <= persistencia
+        historial.conservar(vivos, intensidad[vivos] * np.exp(-edad[vivos] / (persistencia * 0.7)))
+        x, y, t, intensidad = historial.columnas()
+        
+        # Dibujar por categorías de intensidad (menos intensos primero, estable dentro de cada categoría)
+        visibles = np.flatnonzero(intensidad >= 0.05)
+        categoria = (intensidad[visibles] * 10).astype(np.int64)
+        visibles = visibles[np.argsort(categoria, kind="stable")]
+        intensidad_v = intensidad[visibles]
+        
+        # Color con efecto CRT (verde con toque azul) y tamaño según la intensidad
+        niveles = self.paleta_lissajous.niveles(intensidad_v)
+        rellenos = self.paleta_lissajous.relleno[niveles]
+        halos = self.paleta_lissajous.halo[niveles]
+        sizes = np.select([intensidad_v > 0.8, intensidad_v > 0.5, intensidad_v > 0.2], [2.5, 1.8, 1.2], 0.8)
+        
+        for px, py, size, relleno, halo in zip(x[visibles].tolist(), y[visibles].tolist(), sizes.tolist(),
+                                              rellenos.tolist(), halos.tolist()):
+            if size == 2.5:
+                # Halo para puntos muy brillantes
+                self._reserva_puntos.dibujar((px-4, py-4, px+4, py+4), fill=halo)
+            # Punto principal
+            self._reserva_puntos.dibujar((px-size, py-size, px+size, py+size), fill=relleno)
         
         # Opcional: líneas conectoras para figuras complejas
-        if len(puntos_validos) > 1 and any(p['intensidad'] > 0.3 for p in puntos_validos):
-            self._dibujar_conectores_lissajous(puntos_validos)
+        if len(historial) > 1 and np.any(intensidad > 0.3):
+            self._dibujar_conectores_lissajous(x, y, t, intensidad)
 
     def _dibujar_punto_pantalla_mejorado(self, pixel_x, pixel_y, voltaje_aceleracion, persistencia, tiempo_actual, brillo):
         """Dibuja punto único con persistencia mejorada"""
@@ -800,178 +947,139 @@ class Display:
             # Intensidad basada en voltaje de aceleración y brillo
             intensidad = min(voltaje_aceleracion / 3000.0 * brillo, 1.5)
             
-            self.puntos_pantalla.append({
-                'x': pos_x, 'y': pos_y, 'tiempo': tiempo_actual, 
-                'intensidad': intensidad
-            })
+            historial = self.puntos_pantalla
+            historial.agregar(pos_x, pos_y, tiempo_actual, intensidad)
+            
+            # Dibujar puntos con fade out (la intensidad guardada no cambia; el fade se aplica al dibujar)
+            x, y, t, intensidad = historial.columnas()
+            edad = tiempo_actual - t
+            vivos = edad <= persistencia
+            intensidad_actual = intensidad * np.maximum(0, 1.0 - edad / persistencia)
+            visibles = np.flatnonzero(vivos & (intensidad_actual > 0.05))
+            intensidad_actual = intensidad_actual[visibles]
+            
+            niveles = self.paleta_punto.niveles(intensidad_actual)
+            sizes = np.maximum(1, (3 * intensidad_actual).astype(np.int64))
             
-            # Dibujar puntos con fade out
-            puntos_validos = []
-            for punto in self.puntos_pantalla:
-                edad = tiempo_actual - punto['tiempo']
-                if edad <= persistencia:
-                    alpha = max(0, 1.0 - edad / persistencia)
-                    intensidad_actual = punto['intensidad'] * alpha
-                    
-                    if intensidad_actual > 0.05:
-                        verde = min(255, int(255 * intensidad_actual))
-                        azul = min(150, int(100 * intensidad_actual))
-                        color = f"#{0:02x}{verde:02x}{azul:02x}"
-                        
-                        size = max(1, int(3 * intensidad_actual))
-                        
-                        # Halo para puntos brillantes
-                        if intensidad_actual > 0.7:
-                            halo_color = f"#{0:02x}{int(verde*0.3):02x}{int(azul*0.3):02x}"
-                            self.canvas.create_oval(punto['x']-size*2, punto['y']-size*2,
-                                                   punto['x']+size*2, punto['y']+size*2,
-                                                   fill=halo_color, outline="", tags="punto")
-                        
-                        self.canvas.create_oval(punto['x']-size, punto['y']-size,
-                                               punto['x']+size, punto['y']+size,
-                                               fill=color, outline="", tags="punto")
-                    
-                    puntos_validos.append(punto)
+            for px, py, size, brillante, relleno, halo in zip(x[visibles].tolist(), y[visibles].tolist(), sizes.tolist(),
+                                                              (intensidad_actual > 0.7).tolist(),
+                                                              self.paleta_punto.relleno[niveles].tolist(),
+                                                              self.paleta_punto.halo[niveles].tolist()):
+                # Halo para puntos brillantes
+                if brillante:
+                    self._reserva_puntos.dibujar((px-size*2, py-size*2, px+size*2, py+size*2), fill=halo)
+                
+                self._reserva_puntos.dibujar((px-size, py-size, px+size, py+size), fill=relleno)
             
-            # Actualizar lista
-            self.puntos_pantalla.clear()
-            self.puntos_pantalla.extend(puntos_validos)
+            # Actualizar historial
+            historial.conservar(vivos)
 
-    def _dibujar_conectores_lissajous(self, puntos):
+    def _dibujar_conectores_lissajous(self, x, y, t, intensidad):
         """Dibuja líneas conectoras sutiles para figuras de Lissajous"""
-        puntos_ordenados = sorted([p for p in puntos if p['intensidad'] > 0.2], 
-                                 key=lambda p: p['tiempo'])
-        
-        for i in range(len(puntos_ordenados) - 1):
-            p1 = puntos_ordenados[i]
-            p2 = puntos_ordenados[i + 1]
-            
-            # Solo conectar puntos muy cercanos en tiempo
-            if p2['tiempo'] - p1['tiempo'] < 0.05:
-                intensidad_linea = min(p1['intensidad'], p2['intensidad']) * 0.15
-                if intensidad_linea > 0.03:
-                    verde = int(120 * intensidad_linea)
-                    azul = int(80 * intensidad_linea)
-                    color_linea = f"#{0:02x}{verde:02x}{azul:02x}"
-                    
-                    self.canvas.create_line(p1['x'], p1['y'], p2['x'], p2['y'],
-                                           fill=color_linea, width=1, tags="punto")
+        orden = np.flatnonzero(intensidad > 0.2)
+        orden = orden[np.argsort(t[orden], kind="stable")]
+        if orden.size < 2:
+            return
+        
+        # Solo conectar puntos muy cercanos en tiempo
+        intensidad_linea = np.minimum(intensidad[orden[:-1]], intensidad[orden[1:]]) * 0.15
+        conectar = np.flatnonzero((np.diff(t[orden]) < 0.05) & (intensidad_linea > 0.03))
+        colores = self.paleta_conector.relleno[self.paleta_conector.niveles(intensidad_linea[conectar])]
+        
+        x1, y1 = x[orden[conectar]].tolist(), y[orden[conectar]].tolist()
+        x2, y2 = x[orden[conectar + 1]].tolist(), y[orden[conectar + 1]].tolist()
+        for a, b, c, d, color_linea in zip(x1, y1, x2, y2, colores.tolist()):
+            self._reserva_conectores.dibujar((a, b, c, d), fill=color_linea, width=1)
 
     def _actualizar_informacion_sistema(self, valores, tiempo_actual, pixel_x, pixel_y):
-        """Actualiza el área de información con datos del sistema"""
-        info = self.info_area
-        
-        # Limpiar área de información
-        self.canvas.delete("info")
-        
-        # Información básica
-        col1_x = info['x'] + 15
-        col2_x = info['x'] + 200
-        col3_x = info['x'] + 400
-        y_start = info['y'] + 35
+        """Actualiza el área de información: solo se tocan los textos cuyo valor formateado cambió"""
+        panel = self.panel_info
+        trazo = self.fuente is not None or valores.get("modo_sinusoidal", False)
+        modo = "Externa" if self.fuente is not None else ("Sinusoidal" if trazo else "Manual")
+        if modo != self._panel_modo:
+            # Las líneas de la columna 1 cambian de significado con el modo
+            self._panel_modo = modo
+            panel.forzar()
         
         # Columna 1: Voltajes
-        self.canvas.create_text(col1_x, y_start, text="VOLTAJES:", 
-                               font=("Consolas", 9, "bold"), fill="#00ffff", anchor="w", tags="info")
-        
         voltaje_aceleracion = valores.get("voltaje_aceleracion", 0)
-        self.canvas.create_text(col1_x, y_start + 15, 
-                               text=f"Aceleración: {voltaje_aceleracion:.0f} V",
-                               font=("Consolas", 8), fill="#ffffff", anchor="w", tags="info")
-        
-        if valores.get("modo_sinusoidal", False):
-            freq_v = valores.get("frecuencia_vertical", 0)
-            freq_h = valores.get("frecuencia_horizontal", 0)
-            self.canvas.create_text(col1_x, y_start + 30,
-                                   text=f"Modo: Sinusoidal {freq_v:.1f}:{freq_h:.1f} Hz",
-                                   font=("Consolas", 8), fill="#ffff00", anchor="w", tags="info")
+        panel.actualizar_por_clave("aceleracion", voltaje_aceleracion,
+                                   lambda: f"Aceleración: {voltaje_aceleracion:.0f} V")
+        
+        if trazo:
+            estimacion = self.analizador.estimacion if self.analizador is not None else None
+            if estimacion is not None:
+                # Frecuencias medidas sobre el trazo (para la fuente externa no hay controles que leer)
+                freq_v, freq_h = estimacion.vertical.frecuencia, estimacion.horizontal.frecuencia
+            else:
+                freq_v = valores.get("frecuencia_vertical", 0)
+                freq_h = valores.get("frecuencia_horizontal", 0)
+            panel.actualizar_cada("linea_1", tiempo_actual,
+                                  lambda: f"Modo: {modo} {freq_v:.1f}:{freq_h:.1f} Hz", fill="#ffff00")
             
-            # Identificar tipo de figura
-            tipo_figura = self._identificar_figura_lissajous(freq_v, freq_h, 
-                                                            valores.get("fase_vertical", 0),
-                                                            valores.get("fase_horizontal", 0))
-            self.canvas.create_text(col1_x, y_start + 45,
-                                   text=f"Figura: {tipo_figura}",
-                                   font=("Consolas", 8), fill="#00ff00", anchor="w", tags="info")
+            # Identificar tipo de figura (solo cuando el analizador entrega una estimación nueva)
+            panel.actualizar_por_clave("linea_2", estimacion,
+                                       lambda: f"Figura: {self._identificar_figura_lissajous(estimacion)}",
+                                       fill="#00ff00")
         else:
             voltaje_v = valores.get("voltaje_vertical", 0)
             voltaje_h = valores.get("voltaje_horizontal", 0)
-            self.canvas.create_text(col1_x, y_start + 30,
-                                   text=f"Vertical: {voltaje_v:.0f} V",
-                                   font=("Consolas", 8), fill="#ffff00", anchor="w", tags="info")
-            self.canvas.create_text(col1_x, y_start + 45,
-                                   text=f"Horizontal: {voltaje_h:.0f} V",
-                                   font=("Consolas", 8), fill="#ff8800", anchor="w", tags="info")
-        
-        # Columna 2: Física
-        self.canvas.create_text(col2_x, y_start, text="FÍSICA:",
-                               font=("Consolas", 9, "bold"), fill="#00ffff", anchor="w", tags="info")
-        
-        # Calcular velocidad inicial
-        if voltaje_aceleracion > 0:
-            v0 = math.sqrt(2 * 1.602e-19 * voltaje_aceleracion / 9.109e-31)
-            self.canvas.create_text(col2_x, y_start + 15,
-                                   text=f"Velocidad: {v0/1e6:.1f} Mm/s",
-                                   font=("Consolas", 8), fill="#ffffff", anchor="w", tags="info")
-        
-        # Posición en pantalla
-        self.canvas.create_text(col2_x, y_start + 30,
-                               text=f"Deflexión X: {pixel_x:.1f} px",
-                               font=("Consolas", 8), fill="#ff8800", anchor="w", tags="info")
-        self.canvas.create_text(col2_x, y_start + 45,
-                               text=f"Deflexión Y: {-pixel_y:.1f} px",
-                               font=("Consolas", 8), fill="#ffff00", anchor="w", tags="info")
+            panel.actualizar_por_clave("linea_1", voltaje_v, lambda: f"Vertical: {voltaje_v:.0f} V", fill="#ffff00")
+            panel.actualizar_por_clave("linea_2", voltaje_h, lambda: f"Horizontal: {voltaje_h:.0f} V", fill="#ff8800")
         
-        # Columna 3: Sistema
-        self.canvas.create_text(col3_x, y_start, text="SISTEMA:",
-                               font=("Consolas", 9, "bold"), fill="#00ffff", anchor="w", tags="info")
+        # Columna 2: Física (velocidad inicial solo al cambiar la aceleración)
+        panel.actualizar_por_clave("velocidad", voltaje_aceleracion,
+                                   lambda: f"Velocidad: {velocidadCE(E_CHARGE, voltaje_aceleracion, E_MASS)/1e6:.1f} Mm/s"
+                                   if voltaje_aceleracion > 0 else "")
         
-        persistencia = valores.get("persistencia", 1.0)
-        self.canvas.create_text(col3_x, y_start + 15,
-                               text=f"Persistencia: {persistencia:.2f} s",
-                               font=("Consolas", 8), fill="#ffffff", anchor="w", tags="info")
+        # Posición en pantalla (cambia cada cuadro en los modos de trazo)
+        panel.actualizar_cada("deflexion_x", tiempo_actual, lambda: f"Deflexión X: {pixel_x:.1f} px")
+        panel.actualizar_cada("deflexion_y", tiempo_actual, lambda: f"Deflexión Y: {-pixel_y:.1f} px")
         
+        # Columna 3: Sistema
+        persistencia = valores.get("persistencia", 1.0)
+        panel.actualizar_por_clave("persistencia", persistencia, lambda: f"Persistencia: {persistencia:.2f} s")
         brillo = valores.get("brillo", 1.0)
-        self.canvas.create_text(col3_x, y_start + 30,
-                               text=f"Brillo: {brillo:.1f}x",
-                               font=("Consolas", 8), fill="#ffffff", anchor="w", tags="info")
-        
-        # Número de puntos activos
-        num_puntos = len([p for p in self.puntos_lissajous if p.get('intensidad', 0) > 0.1]) if valores.get("modo_sinusoidal") else len(self.puntos_pantalla)
-        self.canvas.create_text(col3_x, y_start + 45,
-                               text=f"Puntos: {num_puntos}",
-                               font=("Consolas", 8), fill="#00ff00", anchor="w", tags="info")
+        panel.actualizar_por_clave("brillo", brillo, lambda: f"Brillo: {brillo:.1f}x")
+        
+        # Número de puntos activos (recorre el historial: solo al refrescar)
+        panel.actualizar_cada("puntos", tiempo_actual, lambda: f"Puntos: {self._contar_puntos_activos(valores)}")
 
-    def _identificar_figura_lissajous(self, freq_v, freq_h, fase_v, fase_h):
-        """Identifica el tipo de figura de Lissajous"""
-        # Simplificar ratio de frecuencias
-        from fractions import Fraction
-        try:
-            ratio = Fraction(freq_v / freq_h).limit_denominator(10)
-            ratio_str = f"{ratio.numerator}:{ratio.denominator}"
-        except:
-            ratio_str = "1:1"
-        
-        # Diferencia de fase
-        diff_fase = abs(fase_v - fase_h) % 360
+    def _contar_puntos_activos(self, valores):
+        """Puntos del historial que todavía se ven (el trazo externo y el sinusoidal comparten historial)"""
+        if self.fuente is not None or valores.get("modo_sinusoidal"):
+            return int(np.count_nonzero(self.puntos_lissajous.columnas()[3] > 0.1))
+        return len(self.puntos_pantalla)
+
+    def _identificar_figura_lissajous(self, estimacion):
+        """Identifica el tipo de figura de Lissajous a partir de la estimación del analizador"""
+        if estimacion is None:
+            return "Analizando..."
+        p, q = estimacion.p, estimacion.q
+        
+        # Diferencia de fase (grados); en 1:1 es directamente φv - φh
+        diff_fase = math.degrees(estimacion.fase_relativa) % 360
         
         # Clasificación basada en la imagen de referencia
-        if freq_v == freq_h:  # 1:1
-            if diff_fase < 15 or abs(diff_fase - 180) < 15:
+        if p == q:  # 1:1
+            if diff_fase < 15 or abs(diff_fase - 180) < 15 or diff_fase > 345:
                 return "Línea diagonal"
             elif abs(diff_fase - 90) < 15 or abs(diff_fase - 270) < 15:
                 return "Círculo"
             else:
                 return "Elipse"
-        elif abs(freq_v - 2*freq_h) < 0.1 or abs(2*freq_v - freq_h) < 0.1:
+        elif (p, q) in ((2, 1), (1, 2)):
             return "Figura 8"
-        elif abs(freq_v - 3*freq_h) < 0.1 or abs(3*freq_v - freq_h) < 0.1:
+        elif (p, q) in ((3, 1), (1, 3)):
             return "Trébol 3 hojas"
         else:
-            return f"Lissajous {ratio_str}"
+            return f"Lissajous {estimacion.razon}"
 
     def limpiar_pantalla(self):
         """Limpia todos los puntos de la pantalla"""
-        self.puntos_pantalla.clear()
-        self.puntos_lissajous.clear()
-        self.canvas.delete("punto")
\ No newline at end of file
+        self.puntos_pantalla.limpiar()
+        self.puntos_lissajous.limpiar()
+        self._reserva_puntos.ocultar()
+        self._reserva_conectores.ocultar()
+        if self.fosforo is not None:
+            self.fosforo.limpiar()
\ No newline at end of file
@@ -0,0 +1,60 @@
+# panel.py
+INTERVALO_PANEL = 0.25  # Refresco de los valores que cambian cada cuadro (4 Hz)
+
+
+class PanelTexto:
+    """
+    Textos persistentes del panel de información: cada campo es un item creado una sola vez y solo se
+    llama itemconfig cuando cambia su texto (o color) formateado. Los campos lentos se recalculan solo
+    cuando cambia su clave de entrada; los rápidos, a lo sumo cada `intervalo` segundos.
+    """
+
+    _SIN_CLAVE = object()
+
+    def __init__(self, canvas, tags="info", intervalo=INTERVALO_PANEL):
+        self.canvas = canvas
+        self.tags = tags
+        self.intervalo = intervalo
+        self._items = {}
+        self._estado = {}  # nombre -> (texto, fill) mostrados
+        self._claves = {}  # nombre -> clave con la que se formateó el texto
+        self._refresco = {}  # nombre -> tiempo del último refresco
+
+    def campo(self, nombre, x, y, **opciones):
+        """Crea el item de texto (vacío) de un campo"""
+        self._items[nombre] = self.canvas.create_text(x, y, text="", tags=self.tags, **opciones)
+        self._estado[nombre] = ("", opciones.get("fill"))
+
+    def actualizar(self, nombre, texto, fill=None):
+        """Muestra texto (y fill) en el campo si difiere de lo que ya muestra"""
+        texto_anterior, fill_anterior = self._estado[nombre]
+        cambios = {}
+        if texto != texto_anterior:
+            cambios["text"] = texto
+        if fill is not None and fill != fill_anterior:
+            cambios["fill"] = fill
+        if not cambios:
+            return False
+        self.canvas.itemconfig(self._items[nombre], **cambios)
+        self._estado[nombre] = (texto, fill or fill_anterior)
+        return True
+
+    def actualizar_por_clave(self, nombre, clave, formato, fill=None):
+        """formato() solo se evalúa cuando cambia la clave (tupla de entradas) del campo"""
+        if self._claves.get(nombre, self._SIN_CLAVE) == clave:
+            return False
+        self._claves[nombre] = clave
+        return self.actualizar(nombre, formato(), fill)
+
+    def actualizar_cada(self, nombre, tiempo, formato, fill=None):
+        """formato() solo se evalúa si pasó el intervalo desde el último refresco del campo"""
+        ultimo = self._refresco.get(nombre)
+        if ultimo is not None and 0 <= tiempo - ultimo < self.intervalo:
+            return False
+        self._refresco[nombre] = tiempo
+        return self.actualizar(nombre, formato(), fill)
+
+    def forzar(self):
+        """El próximo cuadro recalcula todos los campos (p. ej. al cambiar de modo)"""
+        self._claves.clear()
+        self._refresco.clear()
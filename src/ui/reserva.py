@@ -0,0 +1,55 @@
+# reserva.py
+class ReservaCanvas:
+    """
+    Reserva de items de canvas de un mismo tipo que se crean una sola vez y se reutilizan cuadro a cuadro.
+
+    Uso por cuadro: iniciar(), dibujar(...) por cada item, terminar(). El item i del cuadro reutiliza
+    el i-ésimo item creado (coords + itemconfig solo de las opciones que cambiaron); los que sobran se
+    ocultan con state="hidden" en lugar de borrarse, así el canvas no acumula ids ni crea/destruye items.
+    """
+
+    def __init__(self, canvas, tipo, tags, **fijas):
+        self.canvas = canvas
+        self._crear = getattr(canvas, f"create_{tipo}")  # create_line, create_oval, ...
+        self.tags = tags
+        self.fijas = fijas  # Opciones que no cambian entre cuadros (solo al crear)
+        self.items = []
+        self._opciones = []  # Últimas opciones aplicadas a cada item
+        self._usados = 0  # Items dibujados en el cuadro actual
+        self._visibles = 0  # Items visibles al terminar el cuadro anterior
+
+    def iniciar(self):
+        """Comienza un cuadro: los items se reasignan desde el primero"""
+        self._usados = 0
+
+    def dibujar(self, coords, **opciones):
+        """Coloca el siguiente item de la reserva en coords con las opciones dadas; retorna su id"""
+        i = self._usados
+        self._usados += 1
+        if i == len(self.items):
+            item = self._crear(*coords, tags=self.tags, **self.fijas, **opciones)
+            self.items.append(item)
+            self._opciones.append(dict(opciones))
+            return item
+        item = self.items[i]
+        self.canvas.coords(item, *coords)
+        anteriores = self._opciones[i]
+        cambios = {k: v for k, v in opciones.items() if anteriores.get(k) != v}
+        if cambios:
+            anteriores.update(cambios)
+        if i >= self._visibles:
+            cambios["state"] = "normal"
+        if cambios:
+            self.canvas.itemconfig(item, **cambios)
+        return item
+
+    def terminar(self):
+        """Oculta los items que no se usaron en este cuadro"""
+        for item in self.items[self._usados:self._visibles]:
+            self.canvas.itemconfig(item, state="hidden")
+        self._visibles = self._usados
+
+    def ocultar(self):
+        """Oculta todos los items (p. ej. al limpiar la pantalla)"""
+        self.iniciar()
+        self.terminar()
@@ -1,10 +1,12 @@
 # ventana.py
 import tkinter as tk
-from tkinter import ttk
+from tkinter import filedialog, messagebox, simpledialog, ttk
 import time
 import threading
 from .controles import Controles
 from .display import Display
+from src.functions.fuentes import abrir_fuente
+from src.utils.constantes import FS_DEF
 
 class Ventana:
     def __init__(self):
@@ -123,6 +125,9 @@ class Ventana:
         menu_sim.add_separator()
         menu_sim.add_command(label="Limpiar Pantalla", command=self._limpiar_pantalla, accelerator="C")
         menu_sim.add_separator()
+        menu_sim.add_command(label="Abrir Señal Externa...", command=self._abrir_fuente_externa)
+        menu_sim.add_command(label="Desconectar Señal Externa", command=self._desconectar_fuente_externa)
+        menu_sim.add_separator()
         
         # Submenú velocidad
         menu_velocidad = tk.Menu(menu_sim, tearoff=0, bg="#1e2a3a", fg="white")
@@ -298,8 +303,12 @@ class Ventana:
         else:
             self.status_sim.config(text="⚡ SIMULACIÓN ACTIVA", fg="#00ff00")
         
-        modo = "SINUSOIDAL" if valores["modo_sinusoidal"] else "MANUAL"
-        self.modo_label.config(text=f"MODO: {modo}")
+        if self.display.fuente is not None:
+            modo = "EXTERNA"
+        else:
+            modo = "SINUSOIDAL" if valores["modo_sinusoidal"] else "MANUAL"
+        deflexion = "YUGO" if valores.get("modo_magnetico") else "PLACAS"
+        self.modo_label.config(text=f"MODO: {modo} | {deflexion}")
         
         self.velocidad_label.config(text=f"Velocidad: {self.velocidad_simulacion:.2f}x")
 
@@ -317,6 +326,27 @@ class Ventana:
         """Limpia la pantalla"""
         self.display.limpiar_pantalla()
 
+    def _abrir_fuente_externa(self):
+        """Conecta un WAV estéreo (X/Y), una traza .npy o un CSV a las placas"""
+        ruta = filedialog.askopenfilename(title="Señal externa",
+                                          filetypes=[("Señales", "*.wav *.npy *.csv *.txt"), ("Todos", "*.*")])
+        if not ruta:
+            return
+        fs = None
+        if not ruta.lower().endswith(".wav"):
+            # NPY y CSV no guardan la frecuencia de muestreo
+            fs = simpledialog.askfloat("Frecuencia de muestreo", "fs (Hz):", initialvalue=FS_DEF, minvalue=1.0)
+            if fs is None:
+                return
+        try:
+            self.display.conectar_fuente(abrir_fuente(ruta, fs=fs))
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Señal externa", f"No se pudo abrir {ruta}:\n{error}")
+
+    def _desconectar_fuente_externa(self):
+        """Vuelve a los voltajes de los controles"""
+        self.display.desconectar_fuente()
+
     def _cambiar_velocidad(self, nueva_velocidad):
         """Cambia la velocidad de simulación"""
         self.velocidad_simulacion = nueva_velocidad
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 EPSILON_0: float = 8.8541878128e-12 #Permisividad del vacío (F/m)
 E_CHARGE: float = 1.602176634e-19 #Carga del electrón (C)
 E_MASS: float = 9.1093837015e-31 #Masa del electrón (kg)
+K_BOLTZMANN: float = 1.380649e-23 #Constante de Boltzmann (J/K)
 PI: float = 3.141592653589793 #Valor de π
 
 #Parámetros de muestreo por defecto
@@ -18,6 +19,8 @@ AMP_DEF: float = 1.0 #Amplitud
 FREQ_DEF: float = 1_000.0 #Frecuencia (Hz)
 PHASE_DEF: float = 0.0 #Fase (rad)
 OFFSET_DEF: float = 0.0 #Desplazamiento DC
+PRECISION_DEF: str = "float64" #Tipo de las muestras de señal y posiciones en pantalla
+PRECISIONES = ("float64", "float32") #float32 reduce a la mitad la memoria; tiempo y fase siguen en float64
 
 
 @dataclass(frozen = True)
@@ -27,4 +30,21 @@ class SignalDefaults: #Valores predeterminados para generación de señales
     amplitude: float = AMP_DEF
     frequency: float = FREQ_DEF
     phase: float = PHASE_DEF
-    offset: float = OFFSET_DEF
\ No newline at end of file
+    offset: float = OFFSET_DEF
+    precision: str = PRECISION_DEF
+
+    def __post_init__(self) -> None:
+        if self.precision not in PRECISIONES:
+            raise ValueError(f"precision debe ser una de {PRECISIONES}.")
+
+
+#Geometría del tubo (m) y calibración de pantalla
+@dataclass(frozen = True)
+class TubeGeometry: #Dimensiones del CRT usadas por la física y la interfaz
+    longitud_placas_v: float = 0.05 #5 cm
+    longitud_placas_h: float = 0.04 #4 cm
+    separacion_placas: float = 0.02 #2 cm
+    distancia_placas_v_pantalla: float = 0.25 #25 cm
+    distancia_placas_h_pantalla: float = 0.20 #20 cm
+    distancia_entre_placas: float = 0.08 #8 cm entre placas V y H
+    escala_px: float = 800.0 #Factor de calibración m -> px
@@ -0,0 +1,90 @@
+#Pantalla de fósforo como imagen NumPy: impactos depositados, decaimiento exponencial y volcado a PPM
+
+#Imports
+from __future__ import annotations
+import math
+from functools import lru_cache
+from typing import Tuple
+import numpy as np
+from src.utils.paleta import ESQUEMAS_FOSFORO, rgb_esquema
+
+FONDO_FOSFORO: Tuple[int, int, int] = (8, 8, 8) #Vidrio apagado (centro del gradiente de la pantalla)
+NIVELES_FOSFORO: int = 256 #Entradas de la paleta
+HALO_FOSFORO: float = 0.3 #Peso del desenfoque 3x3 sumado a la imagen (el halo de los puntos brillantes)
+UMBRAL_FOSFORO: float = 1.0 / 1024 #Intensidad bajo la cual el píxel se apaga (evita subnormales tras muchos cuadros)
+
+
+@lru_cache(maxsize=4)
+def paleta_fosforo(fondo: Tuple[int, int, int] = FONDO_FOSFORO) -> np.ndarray: #(NIVELES, 3) uint8 con el verde-azulado de los puntos del trazo
+    rgb = rgb_esquema(ESQUEMAS_FOSFORO["lissajous"], np.linspace(0.0, 1.0, NIVELES_FOSFORO))
+    rgb = np.maximum(rgb, fondo).astype(np.uint8)
+    rgb.flags.writeable = False
+    return rgb
+
+
+class PantallaFosforo: #Intensidad (alto, ancho); el costo por cuadro depende de la resolución, no del historial
+    def __init__(self, ancho: int, alto: int, dtype=np.float32) -> None:
+        if ancho <= 0 or alto <= 0:
+            raise ValueError("ancho y alto deben ser > 0.")
+        self.ancho = int(ancho)
+        self.alto = int(alto)
+        self.dtype = np.dtype(dtype)
+        self.imagen = np.zeros((self.alto, self.ancho), self.dtype)
+        #Buffers de trabajo del volcado (se reutilizan en cada cuadro)
+        self._fila = np.zeros_like(self.imagen)
+        self._halo = np.zeros_like(self.imagen)
+        self._niveles = np.empty((self.alto, self.ancho), np.intp)
+        self._rgb = np.empty((self.alto, self.ancho, 3), np.uint8)
+        self._encabezado = f"P6 {self.ancho} {self.alto} 255\n".encode("ascii")
+
+    def limpiar(self) -> None:
+        self.imagen.fill(0)
+
+    def decaer(self, dt: float, persistencia: float) -> float: #Mismo exp(-edad / (0.7 persistencia)) del trazo vectorial; retorna el factor
+        if dt <= 0:
+            return 1.0
+        factor = math.exp(-dt / (0.7 * max(persistencia, 1e-3)))
+        self.imagen *= factor
+        self.imagen[self.imagen < UMBRAL_FOSFORO] = 0
+        return factor
+
+    def depositar(self, x: np.ndarray, y: np.ndarray, intensidad) -> None: #Impactos en px desde la esquina superior izquierda, repartidos bilinealmente
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        intensidad = np.broadcast_to(np.asarray(intensidad, dtype=float), x.shape)
+        x0 = np.floor(x)
+        y0 = np.floor(y)
+        dentro = (x0 >= 0) & (x0 < self.ancho) & (y0 >= 0) & (y0 < self.alto)
+        if not dentro.any():
+            return
+        fx, fy = x[dentro] - x0[dentro], y[dentro] - y0[dentro]
+        i = intensidad[dentro]
+        columna = x0[dentro].astype(np.intp)
+        fila = y0[dentro].astype(np.intp)
+        base = fila * self.ancho + columna
+        #Vecino +1 recortado al borde: en la última columna/fila su peso cae en el mismo píxel
+        dx = (columna < self.ancho - 1).astype(np.intp)
+        dy = (fila < self.alto - 1).astype(np.intp) * self.ancho
+        plano = self.imagen.reshape(-1)
+        #np.add.at acumula impactos repetidos en el mismo píxel
+        np.add.at(plano, base, i * (1 - fx) * (1 - fy))
+        np.add.at(plano, base + dx, i * fx * (1 - fy))
+        np.add.at(plano, base + dy, i * (1 - fx) * fy)
+        np.add.at(plano, base + dy + dx, i * fx * fy)
+
+    def ppm(self) -> bytes: #Imagen coloreada como PPM binario (P6) listo para tk.PhotoImage
+        img, fila, halo = self.imagen, self._fila, self._halo
+        #Caja 3x3 separable para el halo: suma por filas y luego por columnas
+        fila[:] = img
+        fila[:, 1:] += img[:, :-1]
+        fila[:, :-1] += img[:, 1:]
+        halo[:] = fila
+        halo[1:] += fila[:-1]
+        halo[:-1] += fila[1:]
+        halo *= HALO_FOSFORO / 9.0
+        halo += img
+        np.clip(halo, 0.0, 1.0, out=halo)
+        halo *= NIVELES_FOSFORO - 1
+        np.copyto(self._niveles, halo, casting="unsafe")
+        np.take(paleta_fosforo(), self._niveles, axis=0, out=self._rgb)
+        return self._encabezado + self._rgb.tobytes()
@@ -2,9 +2,11 @@
 
 #Imports
 import matplotlib.pyplot as plt
+import numpy as np
 from typing import Optional
 from src.utils.constantes import SignalDefaults
 from src.functions.señales import SignalSpec, SignalGenerator
+from src.functions.respuesta import RespuestaFrecuencia
 
 
 def plot_lissajous(spec_x: SignalSpec, spec_y: SignalSpec, defaults: Optional[SignalDefaults] = None, fs: Optional[float] = None, duration: Optional[float] = None, show_time_series: bool = False) -> None:
@@ -39,4 +41,32 @@ def plot_lissajous(spec_x: SignalSpec, spec_y: SignalSpec, defaults: Optional[Si
         ax_ty.set_title("Señal Y(t)")
         ax_ty.grid(True)
 
-    plt.show()
\ No newline at end of file
+    plt.show()
+
+
+def plot_respuesta_frecuencia(resp: RespuestaFrecuencia, show: bool = True) -> None: #Diagrama de Bode de ambos pares de placas
+    fig = plt.figure()
+    ax_g = fig.add_subplot(2, 1, 1)
+    ax_f = fig.add_subplot(2, 1, 2, sharex=ax_g)
+
+    for eje, nombre in (("x", "Placas H (X)"), ("y", "Placas V (Y)")):
+        ax_g.semilogx(resp.frecuencias, resp.ganancia_db(eje), linewidth=1.0, label=nombre)
+        fase = resp.fase_x if eje == "x" else resp.fase_y
+        ax_f.semilogx(resp.frecuencias, fase, linewidth=1.0, label=nombre)
+
+    ax_g.axhline(-3.0, color="gray", linestyle="--", linewidth=0.8)
+    ax_g.set_ylabel("Ganancia [dB]")
+    ax_g.set_title(f"Respuesta de deflexión (Va = {resp.voltaje_aceleracion:.0f} V)")
+    ax_g.grid(True, which="both")
+    ax_g.legend()
+    ax_f.set_xlabel("f [Hz]")
+    ax_f.set_ylabel("Fase [°]")
+    ax_f.grid(True, which="both")
+
+    if show:
+        plt.show()
+
+
+def guardar_tabla_respuesta(resp: RespuestaFrecuencia, ruta: str) -> None: #Tabla CSV: f, ganancia (px/V) y fase (°) por eje
+    tabla = np.column_stack([resp.frecuencias, resp.ganancia_x, resp.fase_x, resp.ganancia_y, resp.fase_y])
+    np.savetxt(ruta, tabla, delimiter=",", header="f_hz,ganancia_x_px_v,fase_x_deg,ganancia_y_px_v,fase_y_deg", comments="")
@@ -2,8 +2,9 @@
 
 #Imports
 import math
+from functools import lru_cache
 import numpy as np
-from typing import Tuple
+from typing import Optional, Tuple
 from .constantes import PI
 
 
@@ -19,15 +20,38 @@ def clamp(x: float, lo: float, hi: float) -> float: #Restricción de un valor a
     return max(lo, min(hi, x))
 
 
-def tvector(fs: float, duration: float, endpoint: bool = False) -> np.ndarray: #Vector de tiempo uniformemente muestreado
+def n_muestras(fs: float, duration: float, endpoint: bool = False) -> int: #Cantidad de muestras de tvector
     if fs <= 0: 
         raise ValueError("fs debe ser > 0.") #Frecuencia de muestreo positiva
     if duration <= 0:
         raise ValueError("duration debe ser > 0.") #Duración positiva
+    return max(int(round(fs * duration)), 1) + (1 if endpoint else 0)
 
-    n = int(round(fs * duration))
-    n = max(n, 1)
-    return np.linspace(0.0, duration, n + (1 if endpoint else 0), endpoint=endpoint, dtype=float) #Vector de tiempo
+
+@lru_cache(maxsize=8)
+def _indices(n: int) -> np.ndarray: #0, 1, ..., n-1 en float64, compartido entre llamadas (solo lectura)
+    i = np.arange(n, dtype=float)
+    i.flags.writeable = False
+    return i
+
+
+def tvector(fs: float, duration: float, endpoint: bool = False, out: Optional[np.ndarray] = None) -> np.ndarray: #Vector de tiempo uniformemente muestreado
+    n = n_muestras(fs, duration, endpoint)
+    out = salida(out, n)
+    np.multiply(_indices(n), duration / (n - 1 if endpoint else n) if n > 1 else 0.0, out=out) #Igual que np.linspace
+    if endpoint and n > 1:
+        out[-1] = duration
+    return out #Vector de tiempo
+
+
+def salida(out: Optional[np.ndarray], n: int, dtype=float) -> np.ndarray: #Buffer de salida de n muestras: el recibido (validado) o uno nuevo
+    if out is None:
+        return np.empty(n, dtype=dtype)
+    if out.shape != (n,):
+        raise ValueError(f"out debe tener forma ({n},), tiene {out.shape}.")
+    if out.dtype != np.dtype(dtype):
+        raise ValueError(f"out debe ser {np.dtype(dtype)}, es {out.dtype}.")
+    return out
 
 
 def validate_signal_params(freq: float, amp: float) -> None: #Valida parámetros de señal
@@ -40,7 +64,8 @@ def validate_signal_params(freq: float, amp: float) -> None: #Valida parámetros
 def rms(x: np.ndarray) -> float: #Valor RMS de una señal discreta
     if x.size == 0: #Señal vacía
         return 0.0 
-    return float(np.sqrt(np.mean(np.square(x)))) #RMS
+    x = x.ravel()
+    return float(np.sqrt(np.dot(x, x) / x.size)) #RMS sin arreglo intermedio
 
 
 def phasor(amp: float, phase: float) -> complex: #Fasor a partir de amplitud y fase
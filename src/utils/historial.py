@@ -0,0 +1,73 @@
+#Historial de persistencia de la pantalla como ring buffer de columnas NumPy (struct of arrays)
+
+#Imports
+from __future__ import annotations
+from typing import Optional, Tuple
+import numpy as np
+
+
+class HistorialPuntos: #Capacidad fija; al llenarse descarta los más antiguos, como deque(maxlen)
+    """
+    Columnas x, y (px de canvas), tiempo de impacto e intensidad, en orden de inserción. Los puntos
+    vivos se leen con columnas() (vistas mientras el anillo no dé la vuelta) y se filtran con
+    conservar(máscara), que los compacta al inicio en una sola pasada; así envejecer, decaer y
+    descartar cuestan unas pocas operaciones vectorizadas sin importar cuántos puntos haya.
+    """
+
+    def __init__(self, capacidad: int, dtype=np.float32) -> None:
+        if capacidad <= 0:
+            raise ValueError("capacidad debe ser > 0.")
+        self.capacidad = int(capacidad)
+        self.x = np.zeros(self.capacidad, dtype)
+        self.y = np.zeros(self.capacidad, dtype)
+        self.tiempo = np.zeros(self.capacidad) #Siempre float64: los tiempos absolutos crecen sin límite
+        self.intensidad = np.zeros(self.capacidad, dtype)
+        self._inicio = 0
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def limpiar(self) -> None:
+        self._inicio = 0
+        self._n = 0
+
+    def _indices(self, inicio: int, n: int): #Slice si el tramo no da la vuelta; si no, índices con módulo
+        if inicio + n <= self.capacidad:
+            return slice(inicio, inicio + n)
+        return np.arange(inicio, inicio + n) % self.capacidad
+
+    def agregar(self, x, y, tiempo, intensidad) -> None: #Agrega al final (escalares o arreglos del mismo largo)
+        x = np.atleast_1d(x)
+        m = x.size
+        if m == 0:
+            return
+        y, tiempo, intensidad = (np.broadcast_to(np.atleast_1d(v), (m,)) for v in (y, tiempo, intensidad))
+        if m > self.capacidad: #Solo caben los últimos
+            x, y, tiempo, intensidad = x[-self.capacidad:], y[-self.capacidad:], tiempo[-self.capacidad:], intensidad[-self.capacidad:]
+            m = self.capacidad
+        destino = self._indices((self._inicio + self._n) % self.capacidad, m)
+        self.x[destino] = x
+        self.y[destino] = y
+        self.tiempo[destino] = tiempo
+        self.intensidad[destino] = intensidad
+        sobrantes = max(0, self._n + m - self.capacidad) #Los más antiguos se sobrescribieron
+        self._inicio = (self._inicio + sobrantes) % self.capacidad
+        self._n += m - sobrantes
+
+    def columnas(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: #(x, y, tiempo, intensidad) de los puntos vivos
+        orden = self._indices(self._inicio, self._n)
+        return self.x[orden], self.y[orden], self.tiempo[orden], self.intensidad[orden]
+
+    def conservar(self, mascara: np.ndarray, intensidad: Optional[np.ndarray] = None) -> None: #Deja solo los puntos de la máscara (y su nueva intensidad)
+        orden = self._indices(self._inicio, self._n)
+        k = int(np.count_nonzero(mascara))
+        for columna in (self.x, self.y, self.tiempo):
+            columna[:k] = columna[orden][mascara]
+        self.intensidad[:k] = self.intensidad[orden][mascara] if intensidad is None else intensidad
+        self._inicio = 0
+        self._n = k
+
+    def descartar_viejos(self, tiempo_actual: float, persistencia: float) -> None: #Quita los puntos con edad > persistencia
+        _, _, tiempo, _ = self.columnas()
+        self.conservar(tiempo_actual - tiempo <= persistencia)
@@ -0,0 +1,66 @@
+#Paletas de fósforo cuantizadas: colores Tk precalculados por nivel de intensidad
+
+#Imports
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+import numpy as np
+
+NIVELES_PALETA: int = 256 #Niveles de intensidad por esquema
+INTENSIDAD_MAX_PALETA: float = 1.5 #Intensidad del último nivel (la mayor que producen los trazos)
+
+
+@dataclass(frozen = True)
+class EsquemaFosforo: #Color por canal RGB: min(tope, int(ganancia * intensidad))
+    ganancia: Tuple[float, float, float]
+    tope: Tuple[int, int, int] = (255, 255, 255)
+    halo: float = 0.3 #Fracción del color del punto que toma su halo
+
+
+ESQUEMAS_FOSFORO = {
+    "lissajous": EsquemaFosforo((50.0, 255.0, 120.0), (100, 255, 180)), #Verde con toque azul del trazo
+    "punto": EsquemaFosforo((0.0, 255.0, 100.0), (0, 255, 150)), #Punto del modo manual
+    "conector": EsquemaFosforo((0.0, 120.0, 80.0)), #Líneas tenues entre puntos del trazo
+}
+
+
+def rgb_esquema(esquema: EsquemaFosforo, intensidad: np.ndarray) -> np.ndarray: #(..., 3) enteros para intensidades arbitrarias
+    i = np.asarray(intensidad, dtype=float)[..., None]
+    return np.minimum(np.asarray(esquema.tope), (i * np.asarray(esquema.ganancia)).astype(np.int64))
+
+
+_ESCALA: float = (NIVELES_PALETA - 1) / INTENSIDAD_MAX_PALETA #Niveles por unidad de intensidad
+
+
+@dataclass(frozen = True)
+class Paleta: #Colores del esquema en NIVELES_PALETA niveles uniformes de [0, INTENSIDAD_MAX_PALETA]
+    rgb: np.ndarray #(NIVELES, 3) uint8
+    relleno: np.ndarray #"#rrggbb" por nivel (arreglo de objetos: se indexa con un entero o con un arreglo de niveles)
+    halo: np.ndarray
+
+    def nivel(self, intensidad: float) -> int: #Índice del nivel más cercano (saturado en los extremos)
+        k = int(intensidad * _ESCALA + 0.5)
+        return 0 if k < 0 else (k if k < NIVELES_PALETA else NIVELES_PALETA - 1)
+
+    def niveles(self, intensidad: np.ndarray) -> np.ndarray: #Versión vectorizada de nivel
+        k = np.rint(np.asarray(intensidad, dtype=float) * _ESCALA)
+        return np.clip(k, 0, NIVELES_PALETA - 1).astype(np.intp)
+
+
+def _hex(rgb: np.ndarray) -> np.ndarray: #Colores Tk como arreglo de objetos de solo lectura
+    colores = np.array([f"#{r:02x}{g:02x}{b:02x}" for r, g, b in rgb.tolist()], dtype=object)
+    colores.flags.writeable = False
+    return colores
+
+
+@lru_cache(maxsize=8)
+def paleta(nombre: str) -> Paleta: #Se calcula una vez por esquema; los renderizadores solo indexan
+    if nombre not in ESQUEMAS_FOSFORO:
+        raise ValueError(f"Esquema de fósforo desconocido: {nombre}. Opciones: {tuple(ESQUEMAS_FOSFORO)}.")
+    esquema = ESQUEMAS_FOSFORO[nombre]
+    relleno = rgb_esquema(esquema, np.arange(NIVELES_PALETA) / _ESCALA)
+    halo = (relleno * esquema.halo).astype(np.int64) #Como int(canal * 0.3) sobre el color ya entero
+    rgb = relleno.astype(np.uint8)
+    rgb.flags.writeable = False
+    return Paleta(rgb, _hex(relleno), _hex(halo))